@@ -0,0 +1,3 @@
+"""
+Performance benchmarks of `mnemo_lib`, run with `python -m benchmarks.<name>`.
+"""
@@ -0,0 +1,54 @@
+"""
+Measure the JSON to DMP conversion throughput for every validation mode.
+
+    python -m benchmarks.from_json --repeat 500
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.utils import ARTIFACTS_DIR
+from benchmarks.utils import best_of
+from benchmarks.utils import build_large_dmp
+from mnemo_lib.models import DMPFile
+
+# ruff: noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="benchmarks.from_json")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for artifact in ("test_v2.dmp", "test_v5.dmp"):
+            dmp_fp = build_large_dmp(
+                ARTIFACTS_DIR / artifact, args.repeat, tmp_dir / artifact
+            )
+            json_fp = tmp_dir / f"{artifact}.json"
+            DMPFile.from_dmp(dmp_fp).to_json(json_fp)
+            n_sections = len(DMPFile.from_json(json_fp).sections)
+
+            timings: list[str] = []
+            for validate in ("full", "deferred", "none"):
+                output = tmp_dir / f"{artifact}.{validate}.dmp"
+
+                def convert(json_fp=json_fp, validate=validate, output=output) -> None:
+                    DMPFile.from_json(json_fp, validate=validate).to_dmp(output)
+
+                elapsed = best_of(convert, repeat=3)
+                assert output.read_bytes() == dmp_fp.read_bytes()
+                timings.append(
+                    f"{validate} {elapsed * 1e3:.0f} ms "
+                    f"({n_sections / elapsed:,.0f} sections/s)"
+                )
+
+            print(f"{artifact} ({n_sections} sections): " + " | ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure how the decoding of a single large dump scales with the number of
+worker processes validating its sections.
+
+    python -m benchmarks.parallel --repeat 2000 --max-workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.utils import ARTIFACTS_DIR
+from benchmarks.utils import best_of
+from benchmarks.utils import build_large_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.tokenizer import read_dmp_file
+
+# ruff: noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="benchmarks.parallel")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs available")
+
+    with TemporaryDirectory() as tmp_dir:
+        for artifact in ("test_v2.dmp", "test_v5.dmp"):
+            filepath = build_large_dmp(
+                ARTIFACTS_DIR / artifact, args.repeat, Path(tmp_dir) / artifact
+            )
+            data = read_dmp_file(filepath)
+            expected = DMPFile.from_dmp_data(data)
+
+            timings: list[str] = []
+            reference = None
+            for workers in range(1, args.max_workers + 1):
+                assert DMPFile.from_dmp_data(data, workers=workers) == expected
+
+                elapsed = best_of(
+                    lambda data=data, workers=workers: DMPFile.from_dmp_data(
+                        data, workers=workers
+                    ),
+                    repeat=3,
+                )
+                reference = reference or elapsed
+                timings.append(
+                    f"{workers}: {elapsed * 1e3:.0f} ms (x{reference / elapsed:.2f})"
+                )
+
+            print(
+                f"{artifact} ({len(expected.sections)} sections): "
+                + " | ".join(timings)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compare the section boundary scanner against the historical sliding window.
+
+    python -m benchmarks.split --repeat 500
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.utils import ARTIFACTS_DIR
+from benchmarks.utils import best_of
+from benchmarks.utils import build_large_dmp
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import EOS_SEQUENCES
+from mnemo_lib.utils import find_section_offsets
+
+# ruff: noqa: T201
+
+
+def legacy_split(data: list[int]) -> list[list[int]]:
+    """Sliding window implementation of `split_dmp_into_sections` (<= 0.0.8)."""
+    end_seq_patterns = EOS_SEQUENCES[data[0]]
+    len_end_seq = len(end_seq_patterns[0])
+
+    sections = []
+    start_seq_idx = 0
+    for current_idx in range(len(data) - len_end_seq + 1):
+        window = data[current_idx : current_idx + len_end_seq]
+        if any(window == end_seq_pattern for end_seq_pattern in end_seq_patterns):
+            sections.append(data[start_seq_idx : current_idx + len_end_seq])
+            start_seq_idx = current_idx + len_end_seq
+
+    return sections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="benchmarks.split")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp_dir:
+        for artifact in ("test_v2.dmp", "test_v5.dmp", "test_v5_buggy_EOS.dmp"):
+            filepath = build_large_dmp(
+                ARTIFACTS_DIR / artifact, args.repeat, Path(tmp_dir) / artifact
+            )
+            packed = read_dmp_file(filepath)
+            data = packed.tolist()
+
+            assert legacy_split(data) == [
+                data[start:end] for start, end in find_section_offsets(packed)
+            ]
+
+            legacy = best_of(lambda data=data: legacy_split(data), repeat=3)
+            fast = best_of(lambda packed=packed: find_section_offsets(packed))
+
+            print(
+                f"{artifact} ({len(data) / 1e6:.1f}M values): "
+                f"legacy {legacy * 1e3:.1f} ms | scanner {fast * 1e3:.2f} ms "
+                f"| x{legacy / fast:.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Benchmark suite of the decoding, encoding and CLI paths, for every DMP version
+and input size. Results are saved as JSON and compared against a baseline.
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.2
+
+With `--baseline`, the exit status is 1 if a case is slower than its baseline
+by more than `--threshold` (a fraction). Cases absent from either run are
+ignored: a subset of the suite can be compared to a full baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from typing import Any
+
+import mnemo_lib
+from benchmarks.utils import ARTIFACTS_DIR
+from benchmarks.utils import build_large_dmp
+from benchmarks.utils import build_single_section_dmp
+from mnemo_lib.commands.convert import convert
+from mnemo_lib.commands.split import split_dmp_into_sections
+from mnemo_lib.decoder import decode_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.models import Section
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import find_section_offsets
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# ruff: noqa: T201
+
+RESULTS_FORMAT_VERSION = 1
+
+SOURCES = {2: "test_v2.dmp", 5: "test_v5.dmp"}
+
+# Number of repetitions of the sections of the source artifact, `0` for its
+# first section only
+SIZES = {"one": 0, "small": 1, "large": 200, "xlarge": 2000}
+
+# Cases writing one file per section are limited to these sizes
+_SPLIT_SIZES = ("one", "small", "large")
+
+
+def measure(stmt: Callable[[], object], repeat: int) -> float:
+    """Best wall time in seconds of one execution of `stmt`. Tiny cases are run
+    several times in a row, for at least 0.2s, see `timeit.Timer.autorange`."""
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def build_input(version: int, size: str, directory: Path) -> Path:
+    source = ARTIFACTS_DIR / SOURCES[version]
+    output = directory / f"v{version}_{size}.dmp"
+    if (repeat := SIZES[size]) == 0:
+        return build_single_section_dmp(source, output)
+    return build_large_dmp(source, repeat, output)
+
+
+def bench_input(
+    filepath: Path, size: str, tmp_dir: Path, repeat: int
+) -> dict[str, float]:
+    """Seconds spent by every stage on `filepath`."""
+    data = read_dmp_file(filepath)
+    bounds = find_section_offsets(data)
+    decoded = decode_dmp(data)
+    dmp_file = DMPFile.from_dmp(filepath)
+    sections_data = [data[start:end].tolist() for start, end in bounds]
+
+    output_dmp = tmp_dir / "output.dmp"
+    output_json = tmp_dir / "output.json"
+    split_dir = tmp_dir / "split"
+    split_dir.mkdir(exist_ok=True)
+
+    stages: dict[str, Callable[[], object]] = {
+        "tokenize": lambda: read_dmp_file(filepath),
+        "split": lambda: find_section_offsets(data),
+        "decode": lambda: decode_dmp(data),
+        "validate": lambda: [Section.from_decoded(section) for section in decoded],
+        "section_from_dmp": lambda: [Section.from_dmp(s) for s in sections_data],
+        "from_dmp": lambda: DMPFile.from_dmp(filepath),
+        "encode": lambda: dmp_file.to_dmp(output_dmp),
+        "to_json": dmp_file.to_json,
+        "cli_convert_json": lambda: convert(
+            ["-i", str(filepath), "-o", str(output_json), "-f", "json", "-w"]
+        ),
+    }
+    if size in _SPLIT_SIZES:
+        stages["cli_split"] = lambda: split_dmp_into_sections(
+            filepath, split_dir, overwrite=True
+        )
+        stages["cli_split_raw"] = lambda: split_dmp_into_sections(
+            filepath, split_dir, overwrite=True, raw=True
+        )
+
+    return {name: measure(stmt, repeat=repeat) for name, stmt in stages.items()}
+
+
+def run_suite(
+    versions: list[int], sizes: list[str], repeat: int
+) -> dict[str, dict[str, Any]]:
+    """Results of every case, keyed by `v<version>/<size>/<stage>`."""
+    results: dict[str, dict[str, Any]] = {}
+
+    with TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for version in versions:
+            for size in sizes:
+                filepath = build_input(version, size, tmp_dir)
+                n_sections = len(find_section_offsets(read_dmp_file(filepath)))
+                n_bytes = filepath.stat().st_size
+
+                for stage, seconds in bench_input(
+                    filepath, size, tmp_dir, repeat=repeat
+                ).items():
+                    key = f"v{version}/{size}/{stage}"
+                    results[key] = {
+                        "seconds": seconds,
+                        "n_sections": n_sections,
+                        "n_bytes": n_bytes,
+                    }
+                    print(
+                        f"{key:<32} {seconds * 1e3:>10.3f} ms "
+                        f"({n_sections / seconds:>12,.0f} sections/s)"
+                    )
+
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Print the comparison of `results` to `baseline` and return the keys of
+    the cases regressing by more than `threshold`."""
+    regressions: list[str] = []
+
+    for key in sorted(results):
+        if key not in baseline:
+            print(f"{key:<32} not in the baseline")
+            continue
+
+        ratio = results[key]["seconds"] / baseline[key]["seconds"]
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 / (1 + threshold):
+            status = "faster"
+
+        print(f"{key:<32} x{ratio:>6.2f} {status}")
+
+    if not_run := len(baseline.keys() - results.keys()):
+        print(f"{not_run} cases of the baseline were not run.")
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.suite")
+    parser.add_argument(
+        "--versions", type=int, nargs="+", choices=sorted(SOURCES), default=[2, 5]
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(SIZES),
+        default=["one", "small", "large"],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run_suite(args.versions, args.sizes, repeat=args.repeat)
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "format_version": RESULTS_FORMAT_VERSION,
+                    "mnemo_lib": mnemo_lib.__version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "date": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline format: `{args.baseline}`.")
+
+    regressions = compare(results, baseline["results"], threshold=args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regressions beyond {args.threshold:.0%}.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
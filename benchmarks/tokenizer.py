@@ -0,0 +1,50 @@
+"""
+Compare the bytes tokenizer against the historical `str.split` + `int` path.
+
+    python -m benchmarks.tokenizer --repeat 500
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.utils import ARTIFACTS_DIR
+from benchmarks.utils import best_of
+from benchmarks.utils import build_large_dmp
+from mnemo_lib.tokenizer import read_dmp_file
+
+# ruff: noqa: T201
+
+
+def legacy_tokenize(filepath: Path) -> list[int]:
+    with filepath.open(mode="r") as file:
+        return [int(i) for i in file.read().strip().split(";") if i != ""]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="benchmarks.tokenizer")
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp_dir:
+        for artifact in ("test_v2.dmp", "test_v5.dmp"):
+            filepath = build_large_dmp(
+                ARTIFACTS_DIR / artifact, args.repeat, Path(tmp_dir) / artifact
+            )
+            size_mb = filepath.stat().st_size / 1e6
+
+            assert legacy_tokenize(filepath) == read_dmp_file(filepath).tolist()
+
+            legacy = best_of(lambda fp=filepath: legacy_tokenize(fp))
+            fast = best_of(lambda fp=filepath: read_dmp_file(fp))
+
+            print(
+                f"{artifact} ({size_mb:.1f} MB): legacy {legacy * 1e3:.1f} ms "
+                f"| tokenizer {fast * 1e3:.1f} ms | x{legacy / fast:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
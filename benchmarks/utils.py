@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import timeit
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mnemo_lib.constants import MN2OVER
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.writers import dmp_bytes_to_text
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ARTIFACTS_DIR = Path(__file__).parent.parent / "tests" / "artifacts"
+
+_MN2OVER_STR = "".join(f"{value};" for value in MN2OVER)
+
+
+def build_large_dmp(source: str | Path, repeat: int, output: str | Path) -> Path:
+    """Write a DMP file made of the sections of `source` repeated `repeat` times."""
+    content = Path(source).read_text().strip()
+
+    trailer = ""
+    if content.endswith(_MN2OVER_STR):
+        content = content.removesuffix(_MN2OVER_STR)
+        trailer = _MN2OVER_STR
+
+    output = Path(output)
+    with output.open(mode="w") as file:
+        for _ in range(repeat):
+            file.write(content)
+        file.write(trailer)
+
+    return output
+
+
+def build_single_section_dmp(source: str | Path, output: str | Path) -> Path:
+    """Write a DMP file made of the first section of `source` only."""
+    data = read_dmp_file(source)
+    start, end = find_section_offsets(data)[0]
+
+    section = array("b", data[start:end])
+    if section[0] > 2:  # version > 2
+        section.extend(MN2OVER)
+
+    output = Path(output)
+    output.write_bytes(dmp_bytes_to_text(section.tobytes()))
+    return output
+
+
+def best_of(stmt: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    """Best wall time in seconds of `number` executions of `stmt`."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
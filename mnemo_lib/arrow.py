@@ -0,0 +1,165 @@
+"""
+Apache Arrow export of the shots of a DMP file.
+
+`pyarrow` (and `pandas` / `polars` for the DataFrame helpers) are optional
+dependencies, imported on first use: `pip install mnemo_lib[arrow]`.
+"""
+
+from __future__ import annotations
+
+import importlib
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from mnemo_lib.codecs import CODECS
+from mnemo_lib.codecs import SHOT_FIELD_SCALES
+from mnemo_lib.codecs import SHOT_FIELDS
+from mnemo_lib.constants import ShotType
+from mnemo_lib.constants import SurveyDirection
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+    from mnemo_lib.table import SectionTable
+
+# Arrow type of the `array` typecodes used by `ShotTable`
+_ARROW_TYPES = {"b": "int8", "h": "int16", "i": "int32", "q": "int64"}
+
+
+def _import_optional(module: str, extra: str = "arrow") -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"`{module}` is required for this feature. "
+            f"Install it with: `pip install mnemo_lib[{extra}]`."
+        ) from e
+
+
+def _from_array(values: array[int]) -> pa.Array:
+    """Wrap an `array` in an Arrow array without copy nor per-item conversion."""
+    pa = _import_optional("pyarrow")
+    arrow_type = getattr(pa, _ARROW_TYPES[values.typecode])()
+    return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+
+def _section_indices(offsets: array[int]) -> array[int]:
+    """Index of the section of every shot, section `i` owning
+    `offsets[i]:offsets[i + 1]`."""
+    indices = array("i")
+    for idx in range(len(offsets) - 1):
+        indices.extend(array("i", [idx]) * (offsets[idx + 1] - offsets[idx]))
+    return indices
+
+
+def _dictionary(
+    section_values: pa.Array, section_idx: pa.Array, dictionary_type: pa.DataType
+) -> pa.DictionaryArray:
+    """Broadcast one value per section to every shot as a dictionary array."""
+    pa = _import_optional("pyarrow")
+    pc = _import_optional("pyarrow.compute")
+
+    encoded = section_values.dictionary_encode()
+    return pa.DictionaryArray.from_arrays(
+        pc.take(encoded.indices, section_idx).cast(pa.int32()),
+        encoded.dictionary.cast(dictionary_type),
+    )
+
+
+def to_arrow(table: SectionTable) -> pa.Table:
+    """
+    Build an Arrow table of the shots of `table`, one row per shot.
+
+    The section columns (`date`, `name`, `direction`, `version`) are dictionary
+    encoded. The shot columns hold the same values as `Shot`: physical units as
+    `float64`, `null` when the field does not exist in the DMP version of the
+    section, and `type` as a dictionary of `ShotType` names.
+    """
+    pa = _import_optional("pyarrow")
+    pc = _import_optional("pyarrow.compute")
+
+    section_idx = _from_array(_section_indices(table.offsets))
+    versions = pc.take(_from_array(table.versions), section_idx)
+
+    shot_offsets = pc.take(_from_array(table.offsets), section_idx)
+    shot_idx = pc.subtract(
+        _from_array(array("q", range(len(table.shots)))), shot_offsets
+    )
+
+    columns: dict[str, pa.Array] = {
+        "section_idx": section_idx,
+        "date": _dictionary(
+            pa.array(table.dates, pa.timestamp("s", tz="UTC")),
+            section_idx,
+            pa.timestamp("s", tz="UTC"),
+        ),
+        "name": _dictionary(
+            pa.array(table.names, pa.string()), section_idx, pa.string()
+        ),
+        "direction": pa.DictionaryArray.from_arrays(
+            pc.take(_from_array(table.directions), section_idx),
+            [direction.name for direction in SurveyDirection],
+        ),
+        "version": _dictionary(_from_array(table.versions), section_idx, pa.int8()),
+        "shot_idx": shot_idx.cast(pa.int32()),
+    }
+
+    for field in SHOT_FIELDS:
+        values = _from_array(table.shots.columns[field])
+
+        if field == "type":
+            columns[field] = pa.DictionaryArray.from_arrays(
+                values, [shot_type.name for shot_type in ShotType]
+            )
+            continue
+
+        if (scale := SHOT_FIELD_SCALES.get(field)) is not None:
+            values = pc.divide(values.cast(pa.float64()), scale)
+
+        with_field = [v for v, codec in CODECS.items() if field in codec.fields]
+        if len(with_field) != len(CODECS):
+            present = pc.is_in(versions, pa.array(with_field, pa.int8()))
+            values = pc.if_else(present, values, pa.scalar(None, values.type))
+
+        columns[field] = values
+
+    return pa.table(columns)
+
+
+def to_pandas(table: SectionTable) -> pd.DataFrame:
+    """Arrow backed conversion: dictionary columns become `pandas.Categorical`."""
+    _import_optional("pandas", extra="pandas")
+    return to_arrow(table).to_pandas()
+
+
+def to_polars(table: SectionTable) -> pl.DataFrame:
+    """Zero-copy conversion: dictionary columns become `polars.Categorical`."""
+    pl = _import_optional("polars", extra="polars")
+    return pl.from_arrow(to_arrow(table))
+
+
+def write_parquet(table: SectionTable, filepath: str | Path) -> int:
+    """Write the Arrow table of `table` as Parquet. Returns the number of rows."""
+    pq = _import_optional("pyarrow.parquet")
+
+    arrow_table = to_arrow(table)
+    pq.write_table(arrow_table, Path(filepath))
+    return arrow_table.num_rows
+
+
+def write_arrow(table: SectionTable, filepath: str | Path) -> int:
+    """Write the Arrow table of `table` in the Arrow IPC file format (Feather v2).
+    Returns the number of rows."""
+    pa = _import_optional("pyarrow")
+
+    arrow_table = to_arrow(table)
+    with (
+        pa.OSFile(str(filepath), "wb") as sink,
+        pa.ipc.new_file(sink, arrow_table.schema) as writer,
+    ):
+        writer.write_table(arrow_table)
+    return arrow_table.num_rows
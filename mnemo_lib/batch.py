@@ -0,0 +1,232 @@
+"""
+Batch processing of many DMP files.
+
+Files are processed by a pool of worker processes, which pays the interpreter
+start-up and import cost once per worker instead of once per file. Results are
+yielded as soon as they complete, whatever the order of the inputs, and a
+failure only affects its own file: the error is reported in its result.
+
+`arun_batch` is the asyncio counterpart of `run_batch`: the files are processed
+by an executor, at most `concurrency` at a time, without blocking the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Generic
+from typing import NamedTuple
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+
+
+class BatchResult(NamedTuple, Generic[T]):
+    filepath: Path
+    value: T | None
+    error: Exception | None
+    elapsed: float  # seconds spent on the file by its worker
+    size: int  # bytes of the input file, 0 if it can not be read
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Number of worker processes: every CPU if `workers` is `None`."""
+    if workers is None:
+        return os.cpu_count() or 1
+
+    if workers <= 0:
+        raise ValueError("`workers` must be strictly positive.")
+
+    return workers
+
+
+def expand_paths(inputs: Iterable[str | Path], pattern: str = "*.dmp") -> list[Path]:
+    """
+    Expand `inputs` into a list of files.
+
+    Directories are replaced by their files matching `pattern` and glob patterns
+    by the files they match, both sorted by name. Other inputs are kept as is:
+    a missing file is reported when it is processed. Duplicates are dropped.
+    """
+    filepaths: dict[Path, None] = {}
+
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = sorted(p for p in path.glob(pattern) if p.is_file())
+        elif glob.has_magic(str(item)):
+            matches = sorted(
+                Path(p)
+                for p in glob.glob(str(item), recursive=True)  # noqa: PTH207
+            )
+            matches = [p for p in matches if p.is_file()]
+        else:
+            matches = [path]
+
+        filepaths.update(dict.fromkeys(matches))
+
+    return list(filepaths)
+
+
+def _run_one(fn: Callable[[Path], T], filepath: Path) -> BatchResult[T]:
+    start = time.perf_counter()
+    try:
+        size = filepath.stat().st_size
+    except OSError:
+        size = 0
+
+    try:
+        value = fn(filepath)
+    except Exception as e:  # noqa: BLE001
+        return BatchResult(filepath, None, e, time.perf_counter() - start, size)
+
+    return BatchResult(filepath, value, None, time.perf_counter() - start, size)
+
+
+def run_batch(
+    fn: Callable[[Path], T],
+    filepaths: Iterable[str | Path],
+    workers: int | None = None,
+) -> Iterator[BatchResult[T]]:
+    """
+    Yield the result of `fn` applied to every file, in completion order.
+
+    With more than one worker, `fn` and its results must be picklable, e.g. a
+    module-level function or a `functools.partial` of one. With one worker, the
+    files are processed in order, in the current process.
+    """
+    workers = resolve_workers(workers)
+    filepaths = [Path(filepath) for filepath in filepaths]
+
+    if workers == 1 or len(filepaths) <= 1:
+        for filepath in filepaths:
+            yield _run_one(fn, filepath)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(filepaths)))
+    try:
+        futures = {
+            executor.submit(_run_one, fn, filepath): filepath for filepath in filepaths
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:  # noqa: BLE001
+                # The worker died or its result could not be pickled
+                result = BatchResult(futures[future], None, e, 0.0, 0)
+            yield result
+    finally:
+        # Stopping the iteration early cancels the files not started yet
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def arun_batch(
+    fn: Callable[[Path], T],
+    filepaths: Iterable[str | Path],
+    concurrency: int = 4,
+    executor: Executor | None = None,
+) -> AsyncIterator[BatchResult[T]]:
+    """
+    Yield the result of `fn` applied to every file, in completion order.
+
+    `fn` runs in `executor`, the default executor of the loop if `None`, on at
+    most `concurrency` files at a time. With a process pool, `fn` and its
+    results must be picklable, see `run_batch`. Stopping the iteration early
+    cancels the files not started yet.
+    """
+    if concurrency <= 0:
+        raise ValueError("`concurrency` must be strictly positive.")
+
+    loop = asyncio.get_running_loop()
+    pending: dict[asyncio.Future[BatchResult[T]], Path] = {}
+    filepaths_iter = iter(filepaths)
+
+    try:
+        while True:
+            for filepath in filepaths_iter:
+                path = Path(filepath)
+                future = loop.run_in_executor(
+                    executor, functools.partial(_run_one, fn, path)
+                )
+                pending[future] = path
+                if len(pending) >= concurrency:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # noqa: BLE001
+                    # The worker died or its result could not be pickled
+                    result = BatchResult(path, None, e, 0.0, 0)
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class BatchSummary:
+    """Throughput and errors of a batch, fed with its results."""
+
+    __slots__ = ("_start", "elapsed", "errors", "n_files", "size")
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self.elapsed = 0.0
+        self.n_files = 0
+        self.size = 0
+        self.errors: list[tuple[Path, Exception]] = []
+
+    def add(self, result: BatchResult) -> None:
+        self.n_files += 1
+        self.size += result.size
+        if result.error is not None:
+            self.errors.append((result.filepath, result.error))
+        self.elapsed = time.perf_counter() - self._start
+
+    @property
+    def n_failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.n_files / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"Processed {self.n_files} files ({self.size / 1e6:.2f} MB) "
+            f"in {self.elapsed:.2f}s: {self.files_per_second:.1f} files/s, "
+            f"{self.bytes_per_second / 1e6:.2f} MB/s.",
+            f"{self.n_files - self.n_failed} succeeded, {self.n_failed} failed.",
+        ]
+        lines.extend(
+            f"  - {filepath}: {type(error).__name__}: {error}"
+            for filepath, error in self.errors
+        )
+        return "\n".join(lines)
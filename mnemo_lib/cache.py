@@ -0,0 +1,169 @@
+"""
+On-disk, content-addressed, cache of decoded DMP files.
+
+Entries are keyed by a hash of the DMP file content, of the library version
+and of the decoding options. They hold the sections exactly as decoded from
+the file, as compressed columns (see `decoder.dump_sections`), prefixed by a
+checksum: a corrupted entry is detected, deleted and rebuilt. The least
+recently used entries are evicted once the cache grows beyond `max_size` bytes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import mnemo_lib
+from mnemo_lib.decoder import dump_sections
+from mnemo_lib.decoder import load_sections
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Sequence
+
+    from mnemo_lib.decoder import DecodedSection
+
+# Bumped whenever the layout of the entries changes
+CACHE_FORMAT_VERSION = 3
+
+DEFAULT_CACHE_SIZE = 256 << 20  # 256 MiB
+
+_ENTRY_SUFFIX = ".pdmpc"
+_DIGEST_SIZE = 32
+
+
+def _checksum(payload: bytes | memoryview) -> bytes:
+    return hashlib.blake2b(payload, digest_size=_DIGEST_SIZE).digest()
+
+
+class DMPCache:
+    """
+    Cache of decoded DMP files stored in `directory`.
+
+    Used by `DMPFile.from_dmp(..., cache=DMPCache(directory))`. The directory
+    can be shared between processes: entries are written atomically.
+    """
+
+    __slots__ = ("directory", "max_size")
+
+    def __init__(
+        self, directory: str | Path, max_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("`max_size` must be strictly positive.")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(
+        raw: bytes,
+        uncorrupt: bool = False,
+        uncorrupt_date: datetime.date | None = None,
+    ) -> str:
+        """Key of the DMP file content `raw` decoded with the given options."""
+        key = hashlib.sha256(raw)
+        key.update(
+            f"|{CACHE_FORMAT_VERSION}|{mnemo_lib.__version__}"
+            f"|{uncorrupt}|{uncorrupt_date}".encode()
+        )
+        return key.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get_entry(self, key: str) -> bytes | None:
+        """
+        Serialized sections of the entry `key`, see `decoder.load_sections`,
+        `None` if absent.
+
+        A corrupted entry is deleted and reported as absent.
+        """
+        path = self._path(key)
+        try:
+            entry = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if _checksum(memoryview(entry)[_DIGEST_SIZE:]) != entry[:_DIGEST_SIZE]:
+            path.unlink(missing_ok=True)
+            return None
+
+        # Least recently used entries are the oldest modified ones
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+
+        return entry[_DIGEST_SIZE:]
+
+    def get(self, key: str) -> list[DecodedSection] | None:
+        """
+        Decoded sections of the entry `key`, `None` if absent.
+
+        A corrupted entry is deleted and reported as absent.
+        """
+        if (entry := self.get_entry(key)) is None:
+            return None
+
+        try:
+            return load_sections(entry)
+        except ValueError:
+            self._path(key).unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, sections: Sequence[DecodedSection]) -> None:
+        """Store the decoded `sections` as `key`."""
+        self.put_entry(key, dump_sections(sections))
+
+    def put_entry(self, key: str, entry: bytes) -> None:
+        """Store as `key` the serialized sections `entry`, see
+        `decoder.dump_sections`."""
+        # Atomic: a concurrent reader sees either no entry or a complete one
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="wb") as file:
+                file.write(_checksum(entry))
+                file.write(entry)
+            Path(tmp_path).replace(self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            with contextlib.suppress(FileNotFoundError):  # concurrent eviction
+                entries.append((path, path.stat()))
+        return entries
+
+    @property
+    def size(self) -> int:
+        """Total size of the entries, in bytes."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in
+        `max_size` bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        size = sum(stat.st_size for _, stat in entries)
+
+        for path, stat in entries:
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries())
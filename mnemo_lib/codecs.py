@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import itertools
+import operator
+import struct
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Order of the shot fields once the magic values have been stripped.
+SHOT_FIELDS = (
+    "type",
+    "head_in",
+    "head_out",
+    "length",
+    "depth_in",
+    "depth_out",
+    "pitch_in",
+    "pitch_out",
+    "left",
+    "right",
+    "up",
+    "down",
+    "temperature",
+    "hours",
+    "minutes",
+    "seconds",
+    "marker_idx",
+)
+
+# Divider applied to the raw Int16BE value to obtain the physical value.
+SHOT_FIELD_SCALES: dict[str, float] = {
+    "head_in": 10.0,
+    "head_out": 10.0,
+    "length": 100.0,
+    "depth_in": 100.0,
+    "depth_out": 100.0,
+    "pitch_in": 10.0,
+    "pitch_out": 10.0,
+    "left": 100.0,
+    "right": 100.0,
+    "up": 100.0,
+    "down": 100.0,
+    "temperature": 10.0,
+}
+
+SHOT_START_MAGIC = (57, 67, 77)
+SHOT_END_MAGIC = (95, 25, 35)
+SECTION_START_MAGIC = (68, 89, 101)
+
+
+def int16be_words(values: Sequence[int]) -> array[int]:
+    """
+    Words whose big endian bytes match `utils.convert_to_Int16BE` for each value.
+
+    `convert_to_Int16BE` computes the MSB of negative values as `value // 255`,
+    which is reproduced here to keep the encoded bytes identical.
+    """
+    try:
+        return array(
+            "h",
+            [v if v >= 0 else (v // 255) * 256 + (v & 0xFF) for v in values],
+        )
+    except OverflowError as e:
+        raise ValueError("Value can not be encoded as Int16BE.") from e
+
+
+class FrameCodec:
+    """
+    Precompiled layout of the binary structures of one DMP version.
+
+    A shot frame is `[start magic] fields [end magic]` where every field of
+    `SHOT_FIELD_SCALES` is an Int16BE value and the others are signed bytes. A
+    section header is `version [start magic] date(5) name(3) direction`.
+    """
+
+    __slots__ = (
+        "fields",
+        "frame",
+        "get_fields",
+        "header",
+        "scales",
+        "section_magic",
+        "shot_magic",
+        "version",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        fields: tuple[str, ...],
+        section_magic: bool,
+        shot_magic: bool,
+    ) -> None:
+        if unknown := set(fields) - set(SHOT_FIELDS):
+            raise ValueError(f"Unknown shot fields: {sorted(unknown)}")
+
+        self.version = version
+        self.fields = fields
+        self.section_magic = section_magic
+        self.shot_magic = shot_magic
+
+        # Scale of every field, `None` for single byte fields
+        self.scales = tuple(SHOT_FIELD_SCALES.get(field) for field in fields)
+        # Read all the `fields` attributes of an object in a single call
+        self.get_fields = operator.attrgetter(*fields)
+
+        body = "".join("h" if field in SHOT_FIELD_SCALES else "b" for field in fields)
+        self.frame = struct.Struct(f">3b{body}3b" if shot_magic else f">{body}")
+        self.header = struct.Struct(">13b" if section_magic else ">10b")
+
+    # =========================== Shot frames =========================== #
+
+    def decode_frame(self, values: Sequence[int]) -> dict[str, int]:
+        """Map the values of an unpacked frame to the shot fields, in device
+        units, after checking the magic values."""
+        if self.shot_magic:
+            if (
+                tuple(values[:3]) != SHOT_START_MAGIC
+                or tuple(values[-3:]) != SHOT_END_MAGIC
+            ):
+                raise ValueError("Invalid shot magic values.")
+            values = values[3:-3]
+
+        return dict(zip(self.fields, values, strict=True))
+
+    def encode_frame(self, values: Sequence[int]) -> bytes:
+        """Pack the values of `fields`, in device units, into a frame."""
+        return self.encode_frames([[value] for value in values])
+
+    def encode_frames(self, columns: Sequence[Sequence[int]]) -> bytes:
+        """
+        Pack consecutive frames given one column of values, in device units, per
+        field of `fields`.
+        """
+        if len(columns) != len(self.fields):
+            raise ValueError(f"Expected one column per field: {self.fields}")
+
+        columns = [
+            int16be_words(col) if scale is not None and min(col, default=0) < 0 else col
+            for col, scale in zip(columns, self.scales, strict=True)
+        ]
+        if self.shot_magic:
+            columns = [
+                *(itertools.repeat(magic) for magic in SHOT_START_MAGIC),
+                *columns,
+                *(itertools.repeat(magic) for magic in SHOT_END_MAGIC),
+            ]
+
+        try:
+            # `strict=False`: the magic values columns are endless
+            frames = zip(*columns, strict=False)
+            return b"".join(itertools.starmap(self.frame.pack, frames))
+        except struct.error as e:
+            raise ValueError(f"Value out of range for a v{self.version} frame.") from e
+
+    # ========================== Section header ========================= #
+
+    def decode_header(self, values: Sequence[int]) -> tuple[int, ...]:
+        """
+        Strip the magic values of an unpacked section header after checking them.
+
+        Returns `(version, year % 100, month, day, hour, minute, *name, direction)`.
+        """
+        header = tuple(values)
+        if self.section_magic:
+            if header[1:4] != SECTION_START_MAGIC:
+                raise ValueError("Invalid section start magic values.")
+            header = (header[0], *header[4:])
+
+        return header
+
+    def encode_header(self, values: Sequence[int]) -> bytes:
+        """Pack `(version, year % 100, month, day, hour, minute, *name, direction)`."""
+        if self.section_magic:
+            values = [values[0], *SECTION_START_MAGIC, *values[1:]]
+
+        try:
+            return self.header.pack(*values)
+        except struct.error as e:
+            raise ValueError(f"Value out of range for a v{self.version} header.") from e
+
+
+# ============================= Registry ============================== #
+
+CODECS: dict[int, FrameCodec] = {}
+
+
+def register_codec(codec: FrameCodec) -> FrameCodec:
+    """Declare the layout of a DMP version."""
+    CODECS[codec.version] = codec
+    return codec
+
+
+def get_codec(version: int) -> FrameCodec:
+    """Return the layout of a DMP version."""
+    try:
+        return CODECS[version]
+    except KeyError:
+        raise ValueError(
+            f"Invalid File Format: Expected DMP version: {list(CODECS)}"
+            f", got `{version}`."
+        ) from None
+
+
+_BASE_FIELDS = SHOT_FIELDS[:8]
+_LRUD_FIELDS = ("left", "right", "up", "down")
+_ENV_FIELDS = ("temperature", "hours", "minutes", "seconds")
+
+register_codec(
+    FrameCodec(
+        version=2,
+        fields=(*_BASE_FIELDS, "marker_idx"),
+        section_magic=False,
+        shot_magic=False,
+    )
+)
+register_codec(
+    FrameCodec(
+        version=3,
+        fields=(*_BASE_FIELDS, *_ENV_FIELDS, "marker_idx"),
+        section_magic=True,
+        shot_magic=False,
+    )
+)
+register_codec(
+    FrameCodec(
+        version=4,
+        fields=(*_BASE_FIELDS, *_LRUD_FIELDS, *_ENV_FIELDS, "marker_idx"),
+        section_magic=True,
+        shot_magic=False,
+    )
+)
+register_codec(
+    FrameCodec(
+        version=5,
+        fields=(*_BASE_FIELDS, *_LRUD_FIELDS, *_ENV_FIELDS, "marker_idx"),
+        section_magic=True,
+        shot_magic=True,
+    )
+)
@@ -1,9 +1,111 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import glob
+import os
 from pathlib import Path
 
+from mnemo_lib.arrow import write_arrow
+from mnemo_lib.arrow import write_parquet
+from mnemo_lib.batch import BatchSummary
+from mnemo_lib.batch import expand_paths
+from mnemo_lib.batch import run_batch
 from mnemo_lib.models import DMPFile
+from mnemo_lib.table import SectionTable
+from mnemo_lib.writers import write_json
+from mnemo_lib.writers import write_ndjson
+
+# Extension of the converted files, in batch mode
+_SUFFIXES = {
+    "json": ".json",
+    "ndjson": ".ndjson",
+    "dmp": ".dmp",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+
+def convert_file(input_file: Path, output_file: Path, fmt: str) -> None:
+    """Convert `input_file` to `fmt`. On failure, an existing `output_file` is
+    left untouched and no partial output is left behind."""
+    # Written next to the target then renamed
+    tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    try:
+        _write_converted(input_file, tmp_file, fmt)
+        tmp_file.replace(output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _write_converted(input_file: Path, output_file: Path, fmt: str) -> None:
+    match fmt:
+        case "json" | "ndjson":
+            writer = write_json if fmt == "json" else write_ndjson
+
+            # Sections are decoded and written one at a time
+            with output_file.open(mode="wb") as file:
+                writer(DMPFile.iter_sections(filepath=input_file), file)
+        case "dmp":
+            DMPFile.from_json(input_file).to_dmp(output_file)
+        case "parquet" | "arrow":
+            writer = write_parquet if fmt == "parquet" else write_arrow
+
+            # Columnar decoding: the models only validate the sections, like
+            # the other formats, and are not kept
+            writer(SectionTable.from_dmp(input_file, validate=True), output_file)
+        case _:  # pragma: no cover
+            raise ValueError(f"Unknown value: {fmt=}")
+
+
+def _convert_to_dir(
+    input_file: Path, output_dir: Path, fmt: str, overwrite: bool
+) -> None:
+    output_file = output_dir / f"{input_file.stem}{_SUFFIXES[fmt]}"
+    if output_file.exists() and not overwrite:
+        raise FileExistsError(
+            f"The file {output_file} already existing. "
+            "Please pass the flag `--overwrite` to ignore."
+        )
+
+    convert_file(input_file, output_file, fmt)
+
+
+def _convert_many(
+    inputs: list[str], output_dir: Path, fmt: str, overwrite: bool, jobs: int
+) -> int:
+    input_files = expand_paths(inputs, pattern="*.json" if fmt == "dmp" else "*.dmp")
+    if not input_files:
+        raise FileNotFoundError(f"No file to convert in: `{' '.join(inputs)}`.")
+
+    # Checked upfront: a file would silently replace another one
+    stems: dict[str, Path] = {}
+    for input_file in input_files:
+        if (other := stems.setdefault(input_file.stem, input_file)) != input_file:
+            raise ValueError(
+                f"`{other}` and `{input_file}` would both be converted to "
+                f"`{input_file.stem}{_SUFFIXES[fmt]}`."
+            )
+
+    if output_dir.exists() and not output_dir.is_dir():
+        raise NotADirectoryError(
+            f"`{output_dir}` must be a directory to convert several files."
+        )
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    summary = BatchSummary()
+    for result in run_batch(
+        functools.partial(
+            _convert_to_dir, output_dir=output_dir, fmt=fmt, overwrite=overwrite
+        ),
+        input_files,
+        workers=jobs,
+    ):
+        summary.add(result)
+
+    print(summary.format())  # noqa: T201
+    return 1 if summary.n_failed else 0
 
 
 def convert(args: list[str]) -> int:
@@ -13,9 +115,15 @@ def convert(args: list[str]) -> int:
         "-i",
         "--input_file",
         type=str,
+        nargs="+",
+        action="extend",
         default=None,
         required=True,
-        help="Mnemo DMP Source File.",
+        help=(
+            "Mnemo DMP Source File, or JSON Source File for `--format=dmp`. "
+            "Several files (repeated or not), directories or glob patterns "
+            "convert every matching file into the `--output_file` directory."
+        ),
     )
 
     parser.add_argument(
@@ -24,7 +132,7 @@ def convert(args: list[str]) -> int:
         type=str,
         default=None,
         required=True,
-        help="Path to save the converted file at.",
+        help="Path to save the converted file at, or directory of converted files.",
     )
 
     parser.add_argument(
@@ -39,15 +147,43 @@ def convert(args: list[str]) -> int:
         "-f",
         "--format",
         type=str,
-        # choices=["json", "dmp"],
-        choices=["json"],
+        choices=["json", "ndjson", "dmp", "parquet", "arrow"],
         required=True,
-        help="Conversion format used.",
+        help=(
+            "Conversion format used. `ndjson`: JSON Lines, one shot per line. "
+            "`dmp`: convert a JSON file back to the DMP format. "
+            "`parquet` / `arrow`: one row per shot, requires `mnemo_lib[arrow]`."
+        ),
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes converting several files in parallel.",
     )
 
     parsed_args = parser.parse_args(args)
 
-    input_file = Path(parsed_args.input_file)
+    if parsed_args.jobs <= 0:
+        parser.error("`--jobs` must be strictly positive.")
+
+    inputs: list[str] = parsed_args.input_file
+    if (
+        len(inputs) > 1
+        or Path(inputs[0]).is_dir()
+        or (glob.has_magic(inputs[0]) and not Path(inputs[0]).exists())
+    ):
+        return _convert_many(
+            inputs,
+            output_dir=Path(parsed_args.output_file),
+            fmt=parsed_args.format,
+            overwrite=parsed_args.overwrite,
+            jobs=parsed_args.jobs,
+        )
+
+    input_file = Path(inputs[0])
     if not input_file.exists():
         raise FileNotFoundError(f"Impossible to find: `{input_file}`.")
 
@@ -58,14 +194,6 @@ def convert(args: list[str]) -> int:
             "Please pass the flag `--overwrite` to ignore."
         )
 
-    match parsed_args.format:
-        case "json":
-            dmp_file = DMPFile.from_dmp(filepath=input_file)
-            dmp_file.to_json(filepath=output_file)
-        # case "dmp":
-        #     with input_file.open(mode="r") as f:
-        #         json_target = json.load(f)  # TODO
-        case _:  # pragma: no cover
-            raise ValueError(f"Unknown value: {parsed_args.format=}")
+    convert_file(input_file, output_file, parsed_args.format)
 
     return 0
@@ -5,7 +5,10 @@ import datetime
 import re
 from pathlib import Path
 
+from mnemo_lib.corrections import Corrections
+from mnemo_lib.corrections import apply_corrections
 from mnemo_lib.models import DMPFile
+from mnemo_lib.profiling import phase
 
 
 def str_to_datetime(value: str) -> datetime.datetime:
@@ -141,37 +144,18 @@ def correct(args: list[str]) -> int:
 
     dmp_file = DMPFile.from_dmp(filepath=dmp_file)
 
-    for section in dmp_file.sections:
-        if parsed_args.date is not None:
-            section.date = section.date.replace(
-                year=parsed_args.date.year,
-                month=parsed_args.date.month,
-                day=parsed_args.date.day,
-            )
-
-        for shot in section.shots:
-            if parsed_args.length_scaling is not None:
-                shot.length = round(shot.length * parsed_args.length_scaling, ndigits=2)
-
-            if parsed_args.compass_offset is not None:
-                shot.head_in = round(
-                    (shot.head_in + parsed_args.compass_offset) % 360, ndigits=1
-                )
-                shot.head_out = round(
-                    (shot.head_out + parsed_args.compass_offset) % 360, ndigits=1
-                )
-
-            if parsed_args.depth_offset is not None:
-                shot.depth_in = round(
-                    shot.depth_in + parsed_args.depth_offset, ndigits=2
-                )
-                shot.depth_out = round(
-                    shot.depth_out + parsed_args.depth_offset, ndigits=2
-                )
-
-            if parsed_args.reverse_azimuth:
-                shot.head_in = round((shot.head_in + 180) % 360, ndigits=0)
-                shot.head_out = round((shot.head_out + 180) % 360, ndigits=0)
+    with phase("correct") as correct_phase:
+        n_shots = apply_corrections(
+            dmp_file,
+            Corrections(
+                date=parsed_args.date,
+                length_scaling=parsed_args.length_scaling,
+                compass_offset=parsed_args.compass_offset,
+                depth_offset=parsed_args.depth_offset,
+                reverse_azimuth=parsed_args.reverse_azimuth,
+            ),
+        )
+        correct_phase.add(n_shots=n_shots)
 
     dmp_file.to_dmp(output_file)
 
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from mnemo_lib.constants import MNEMO_SUPPORTED_VERSIONS
+from mnemo_lib.generator import CORRUPTIONS
+from mnemo_lib.generator import generate_dmp_file
+
+
+def generate(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="mnemo generate",
+        description="Generate a synthetic DMP file, for load testing.",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output_file",
+        type=str,
+        default=None,
+        required=True,
+        help="Path to save the generated file at.",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--overwrite",
+        action="store_true",
+        help="Allow overwrite an already existing file.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--dmp_version",
+        type=int,
+        choices=MNEMO_SUPPORTED_VERSIONS,
+        default=5,
+        help="DMP version of the file.",
+    )
+
+    parser.add_argument(
+        "--sections",
+        type=int,
+        default=10,
+        help="Number of sections.",
+    )
+
+    parser.add_argument(
+        "--shots",
+        type=int,
+        nargs=2,
+        metavar=("MIN", "MAX"),
+        default=[10, 50],
+        help="Range of the number of shots per section, bounds included.",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the generator: the same seed produces the same file.",
+    )
+
+    parser.add_argument(
+        "--corruption_rate",
+        type=float,
+        default=0.0,
+        help="Probability of a section to be corrupted, within [0, 1].",
+    )
+
+    parser.add_argument(
+        "--corruptions",
+        nargs="+",
+        choices=CORRUPTIONS,
+        default=None,
+        help="Kinds of corruption injected: every one supported by the version "
+        "by default.",
+    )
+
+    parsed_args = parser.parse_args(args)
+
+    output_file = Path(parsed_args.output_file)
+    if output_file.exists() and not parsed_args.overwrite:
+        raise FileExistsError(
+            f"The file {output_file} already existing. "
+            "Please pass the flag `--overwrite` to ignore."
+        )
+
+    try:
+        generate_dmp_file(
+            output_file,
+            version=parsed_args.dmp_version,
+            n_sections=parsed_args.sections,
+            shots=tuple(parsed_args.shots),
+            seed=parsed_args.seed,
+            corruption_rate=parsed_args.corruption_rate,
+            corruptions=parsed_args.corruptions,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    return 0
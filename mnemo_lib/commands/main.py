@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from importlib.metadata import entry_points
 
 import mnemo_lib
+from mnemo_lib.profiling import profile
 
 
 def main():
@@ -16,6 +18,22 @@ def main():
         action="version",
         version=f"%(prog)s version: {mnemo_lib.__version__}",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Report the wall time, bytes/s and shots/s of every phase of the "
+            "command: reading, tokenizing, splitting, decoding, validation, "
+            "serialization. Printed to stderr."
+        ),
+        default=False,
+    )
+    parser.add_argument(
+        "--profile_output",
+        type=str,
+        default=None,
+        help="With `--profile`, also dump the `cProfile` statistics to this file.",
+    )
     parser.add_argument(
         "command",
         choices=registered_commands.names,
@@ -29,5 +47,16 @@ def main():
     args = argparse.Namespace()
     parser.parse_args(namespace=args)
 
+    if args.profile_output is not None and not args.profile:
+        parser.error("`--profile_output` requires `--profile`.")
+
     main_fn = registered_commands[args.command].load()
-    return main_fn(args.args)
+    if not args.profile:
+        return main_fn(args.args)
+
+    try:
+        with profile(pstats_file=args.profile_output) as profiler:
+            return main_fn(args.args)
+    finally:
+        # Reported even if the command fails
+        print(profiler.format(), file=sys.stderr)  # noqa: T201
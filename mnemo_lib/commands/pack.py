@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mnemo_lib.packed import pack_dmp_file
+from mnemo_lib.packed import unpack_dmp_file
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _run(
+    prog: str,
+    description: str,
+    converter: Callable[[Path, Path], int],
+    args: list[str],
+) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+
+    parser.add_argument(
+        "-i",
+        "--input_file",
+        type=str,
+        default=None,
+        required=True,
+        help="Source File.",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output_file",
+        type=str,
+        default=None,
+        required=True,
+        help="Path to save the converted file at.",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--overwrite",
+        action="store_true",
+        help="Allow overwrite an already existing file.",
+        default=False,
+    )
+
+    parsed_args = parser.parse_args(args)
+
+    input_file = Path(parsed_args.input_file)
+    if not input_file.exists():
+        raise FileNotFoundError(f"Impossible to find: `{input_file}`.")
+
+    output_file = Path(parsed_args.output_file)
+    if output_file.exists() and not parsed_args.overwrite:
+        raise FileExistsError(
+            f"The file {output_file} already existing. "
+            "Please pass the flag `--overwrite` to ignore."
+        )
+
+    # Written next to the target then renamed: a failure leaves an existing
+    # `output_file` untouched and no partial file behind
+    tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
+    try:
+        converter(input_file, tmp_file)
+        tmp_file.replace(output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    return 0
+
+
+def pack(args: list[str]) -> int:
+    return _run(
+        prog="mnemo pack",
+        description="Convert a DMP file to the packed binary format.",
+        converter=pack_dmp_file,
+        args=args,
+    )
+
+
+def unpack(args: list[str]) -> int:
+    return _run(
+        prog="mnemo unpack",
+        description="Convert a packed binary DMP file back to the DMP format.",
+        converter=unpack_dmp_file,
+        args=args,
+    )
@@ -3,7 +3,13 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from mnemo_lib.constants import MN2OVER
+from mnemo_lib.decoder import decode_sections
 from mnemo_lib.models import DMPFile
+from mnemo_lib.models import Section
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.writers import dmp_bytes_to_text
 
 
 def split(args: list[str]) -> int:
@@ -35,20 +41,56 @@ def split(args: list[str]) -> int:
         default=False,
     )
 
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help=(
+            "Copy the original bytes of every section, located on the raw stream, "
+            "instead of decoding and re-encoding them."
+        ),
+        default=False,
+    )
+
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="With `--raw`, validate every section before writing any file.",
+        default=False,
+    )
+
     parsed_args = parser.parse_args(args)
 
+    if parsed_args.validate and not parsed_args.raw:
+        parser.error("`--validate` requires `--raw`: sections are always validated.")
+
     split_dmp_into_sections(
         input_file=parsed_args.input_file,
         output_directory=parsed_args.output_directory,
         overwrite=parsed_args.overwrite,
+        raw=parsed_args.raw,
+        validate=parsed_args.validate,
     )
 
     return 0
 
 
 def split_dmp_into_sections(
-    input_file: str | Path, output_directory: str | Path, overwrite: bool = False
+    input_file: str | Path,
+    output_directory: str | Path,
+    overwrite: bool = False,
+    raw: bool = False,
+    validate: bool = False,
 ) -> None:
+    """
+    Write every section of `input_file` to its own DMP file.
+
+    With `raw`, the sections are located on the raw stream and their original
+    bytes are copied, without building any model: identical output for valid
+    files, far faster. `validate` then decodes and validates every section
+    before writing any file.
+
+    On failure, no section file is left behind.
+    """
     dmp_file = Path(input_file)
     if not dmp_file.exists():
         raise FileNotFoundError(f"Impossible to find: `{dmp_file}`.")
@@ -63,8 +105,39 @@ def split_dmp_into_sections(
             "Please pass the flag `--overwrite` to ignore."
         )
 
-    dmp_object = DMPFile.from_dmp(filepath=dmp_file)
-
-    for section_id, section in enumerate(dmp_object.sections):
-        section_dmp = DMPFile([section])
-        section_dmp.to_dmp(output_directory / f"{dmp_file.name}.{section_id + 1}.dmp")
+    if raw:
+        _split_raw(dmp_file, output_directory, validate=validate)
+        return
+
+    # Sections are decoded and written one at a time: the files written before
+    # an invalid section are deleted
+    written: list[Path] = []
+    try:
+        for section_id, section in enumerate(DMPFile.iter_sections(filepath=dmp_file)):
+            filepath = output_directory / f"{dmp_file.name}.{section_id + 1}.dmp"
+            written.append(filepath)
+            DMPFile([section]).to_dmp(filepath)
+    except BaseException:
+        for filepath in written:
+            filepath.unlink(missing_ok=True)
+        raise
+
+
+def _split_raw(dmp_file: Path, output_directory: Path, validate: bool) -> None:
+    data = read_dmp_file(dmp_file).tobytes()
+    bounds = find_section_offsets(data)
+
+    if validate:
+        for decoded in decode_sections(data, bounds):
+            Section.from_decoded(decoded, validate="full")
+
+    trailer = dmp_bytes_to_text(bytes(MN2OVER))
+    with memoryview(data) as view:
+        for section_id, (start, end) in enumerate(bounds):
+            filepath = output_directory / f"{dmp_file.name}.{section_id + 1}.dmp"
+            with filepath.open(mode="wb") as file:
+                file.write(dmp_bytes_to_text(view[start:end]))
+
+                # adding `MN2OVER` message at the end, version > 2
+                if view[start] > 2:
+                    file.write(trailer)
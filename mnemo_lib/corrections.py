@@ -0,0 +1,139 @@
+"""
+Post-survey corrections of DMP files.
+
+Corrections are applied column by column: the values of a field are gathered
+for every selected shot, transformed in a single pass by the composition of
+every correction of that field, and written back. The rounding is identical to
+applying the corrections one shot at a time, in this order: length scaling,
+compass offset, depth offset, reverse azimuth.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterable
+
+    from mnemo_lib.constants import ShotType
+    from mnemo_lib.models import DMPFile
+
+
+class Corrections(NamedTuple):
+    # New day of the sections, the time of the day is kept
+    date: datetime.date | None = None
+    # Post-survey recalibration: lengths are multiplied by this factor
+    length_scaling: float | None = None
+    # Post-survey recalibration: degrees added to the headings, in [0, 360[
+    compass_offset: float | None = None
+    # `offset > 0` => correcting deeper, `offset < 0` => correcting shallower
+    depth_offset: float | None = None
+    # Reciprocal headings, to correct a survey IN/OUT into OUT/IN
+    reverse_azimuth: bool = False
+
+
+def _check(corrections: Corrections) -> None:
+    if corrections.length_scaling is not None and corrections.length_scaling <= 0:
+        raise ValueError(
+            f"`length_scaling` must be positive: `{corrections.length_scaling}`."
+        )
+
+    if corrections.compass_offset is not None and not (
+        0 <= corrections.compass_offset < 360
+    ):
+        raise ValueError(
+            f"`compass_offset` must be within [0, 360[: `{corrections.compass_offset}`."
+        )
+
+
+# Transform of all the values of a shot field at once
+ColumnTransform = Callable[[list[float]], list[float]]
+
+
+def column_transforms(corrections: Corrections) -> dict[str, ColumnTransform]:
+    """Transform of every shot field modified by `corrections`."""
+    transforms: dict[str, ColumnTransform] = {}
+
+    if (scaling := corrections.length_scaling) is not None:
+        transforms["length"] = lambda values: [
+            round(value * scaling, ndigits=2) for value in values
+        ]
+
+    # Composed in a single comprehension: no intermediate column
+    heading: ColumnTransform | None = None
+    match corrections.compass_offset, corrections.reverse_azimuth:
+        case None, False:
+            pass
+        case None, True:
+            heading = lambda values: [  # noqa: E731
+                round((value + 180) % 360, ndigits=0) for value in values
+            ]
+        case offset, False:
+            heading = lambda values: [  # noqa: E731
+                round((value + offset) % 360, ndigits=1) for value in values
+            ]
+        case offset, True:
+            heading = lambda values: [  # noqa: E731
+                round((round((value + offset) % 360, ndigits=1) + 180) % 360, ndigits=0)
+                for value in values
+            ]
+
+    if heading is not None:
+        transforms["head_in"] = transforms["head_out"] = heading
+
+    if (depth_offset := corrections.depth_offset) is not None:
+        transforms["depth_in"] = transforms["depth_out"] = lambda values: [
+            round(value + depth_offset, ndigits=2) for value in values
+        ]
+
+    return transforms
+
+
+def apply_corrections(
+    dmp_file: DMPFile,
+    corrections: Corrections,
+    sections: Iterable[int] | None = None,
+    shot_types: Iterable[ShotType] | None = None,
+) -> int:
+    """
+    Apply `corrections` in place to the shots of `dmp_file`.
+
+    The corrections can be restricted to the sections at the indices `sections`
+    and to the shots of the types `shot_types`: every section and every shot by
+    default. The date only depends on the selected sections. Returns the number
+    of shots corrected.
+    """
+    _check(corrections)
+
+    selected = (
+        dmp_file.sections
+        if sections is None
+        else [dmp_file.sections[idx] for idx in dict.fromkeys(sections)]
+    )
+
+    if (date := corrections.date) is not None:
+        for section in selected:
+            section.date = section.date.replace(
+                year=date.year, month=date.month, day=date.day
+            )
+
+    types = None if shot_types is None else frozenset(shot_types)
+    shots = [
+        shot
+        for section in selected
+        for shot in section.shots
+        if types is None or shot.type in types
+    ]
+
+    # Read and written through `__dict__`: the assignments bypass the pydantic
+    # machinery, which would not validate them anyway
+    states = [shot.__dict__ for shot in shots]
+    for field, transform in column_transforms(corrections).items():
+        values = transform([state[field] for state in states])
+        for state, value in zip(states, values, strict=True):
+            state[field] = value
+
+    return len(shots)
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import itertools
+import marshal
+import struct
+import sys
+import zlib
+from array import array
+from typing import TYPE_CHECKING
+
+from mnemo_lib.codecs import SHOT_END_MAGIC
+from mnemo_lib.codecs import SHOT_FIELD_SCALES
+from mnemo_lib.codecs import SHOT_FIELDS
+from mnemo_lib.codecs import SHOT_START_MAGIC
+from mnemo_lib.codecs import get_codec
+from mnemo_lib.constants import ShotType
+from mnemo_lib.constants import SurveyDirection
+from mnemo_lib.profiling import phase
+from mnemo_lib.utils import EOS_SEQUENCES
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.utils import get_eos_regex
+from mnemo_lib.utils import pack_dmp_data
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+# `ShotType` members by value, faster than calling the enum
+_SHOT_TYPES = {member.value: member for member in ShotType}
+
+# Order of the `Shot` model fields: models built from the rows without validation
+# then dump and print the same way as validated ones
+SHOT_MODEL_FIELDS = (*SHOT_FIELDS[:8], "marker_idx", *SHOT_FIELDS[8:-1])
+
+# `Shot` fields clamped to 0 by its validators: the rows hold them clamped too
+SHOT_POSITIVE_FIELDS = ("length", "depth_in", "depth_out")
+
+
+class DecodedSection:
+    """
+    One DMP section decoded into columns of raw integer values.
+
+    Every shot field is stored as a compact `array` in device units (e.g.
+    `length` in centimeters) shared by all the sections of a same stream. Fields
+    absent from the DMP version are not stored. No pydantic model is created
+    until `Section.from_decoded` is called.
+    """
+
+    __slots__ = (
+        "_rows",
+        "_start",
+        "_stop",
+        "_store",
+        "date",
+        "direction",
+        "name",
+        "version",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        date: datetime.datetime,
+        name: str,
+        direction: SurveyDirection,
+        store: dict[str, array[int]],
+        start: int = 0,
+        stop: int | None = None,
+        rows: _ShotRows | None = None,
+    ) -> None:
+        self.version = version
+        self.date = date
+        self.name = name
+        self.direction = direction
+
+        self._store = store
+        self._start = start
+        self._stop = len(store["type"]) if stop is None else stop
+        self._rows = _ShotRows(store) if rows is None else rows
+
+    def __len__(self) -> int:
+        """Return the number of shots in the section."""
+        return self._stop - self._start
+
+    @property
+    def columns(self) -> dict[str, array[int]]:
+        """Raw values of every field stored for this DMP version."""
+        return {
+            field: values[self._start : self._stop]
+            for field, values in self._store.items()
+        }
+
+    def column(self, field: str) -> list[float] | list[int] | list[None]:
+        """Return the values of `field` for every shot, in physical units."""
+        if field not in SHOT_FIELDS:
+            raise KeyError(f"Unknown shot field: `{field}`")
+
+        if (values := self._store.get(field)) is None:
+            return [None] * len(self)
+
+        raw = values[self._start : self._stop]
+        if (scale := SHOT_FIELD_SCALES.get(field)) is None:
+            return raw.tolist()
+
+        return [value / scale for value in raw]
+
+    def iter_shot_data(self) -> Iterator[dict[str, ShotType | float | int | None]]:
+        """Yield one dictionary per shot, ready for `Shot.model_validate`. Raises
+        upfront if a shot type is unknown."""
+        rows = self._rows.get()
+        if (idx := self._rows.first_invalid(self._start)) < self._stop:
+            raise ValueError(f"{rows[idx][0]} is not a valid ShotType")
+
+        shots = rows[self._start : self._stop]
+        return map(dict, map(zip, itertools.repeat(SHOT_MODEL_FIELDS), shots))
+
+
+class _ShotRows:
+    """
+    Shots of a column store as tuples of `SHOT_MODEL_FIELDS` values in physical
+    units.
+
+    Transposing the columns of every section separately costs more than the
+    sections themselves hold shots: the store is transposed once, on first use,
+    for all the sections sharing it.
+    """
+
+    __slots__ = ("_invalid", "_rows", "_store")
+
+    def __init__(self, store: dict[str, array[int]]) -> None:
+        self._store = store
+        self._rows: list[tuple[ShotType | float | int | None, ...]] | None = None
+        self._invalid: list[int] = []
+
+    def get(self) -> list[tuple[ShotType | float | int | None, ...]]:
+        if self._rows is None:
+            n_shots = len(self._store["type"])
+
+            columns: list[Iterable[ShotType | float | int | None]] = []
+            for field in SHOT_MODEL_FIELDS:
+                if (values := self._store.get(field)) is None:
+                    columns.append(itertools.repeat(None, n_shots))
+                elif field == "type":
+                    # Unknown values are kept as is and rejected per section
+                    types = [_SHOT_TYPES.get(value, value) for value in values]
+                    self._invalid = [
+                        idx
+                        for idx, value in enumerate(types)
+                        if value.__class__ is not ShotType
+                    ]
+                    columns.append(types)
+                elif (scale := SHOT_FIELD_SCALES.get(field)) is None:
+                    columns.append(values)
+                elif field in SHOT_POSITIVE_FIELDS:
+                    columns.append(
+                        [value / scale if value > 0 else 0.0 for value in values]
+                    )
+                else:
+                    columns.append([value / scale for value in values])
+
+            # `strict=False`: the `repeat` columns are sized
+            self._rows = list(zip(*columns, strict=False))
+
+        return self._rows
+
+    def first_invalid(self, start: int) -> int:
+        """Index of the first row from `start` with an unknown shot type, the
+        number of rows if none. Valid once `get` was called."""
+        if (pos := bisect.bisect_left(self._invalid, start)) < len(self._invalid):
+            return self._invalid[pos]
+        return len(self._rows or ())
+
+
+def _decode_date(
+    year: int, month: int, day: int, hour: int, minute: int
+) -> datetime.datetime:
+    year += 2000
+
+    if year not in range(2016, 2100):
+        raise ValueError(f"Invalid year: `{year}`")
+
+    if month not in range(1, 13):
+        raise ValueError(f"Invalid month: `{month}`")
+
+    if day not in range(1, 31):
+        raise ValueError(f"Invalid day: `{day}`")
+
+    if hour not in range(24):
+        raise ValueError(f"Invalid hour: `{hour}`")
+
+    return datetime.datetime(  # noqa: DTZ001
+        year=year,
+        month=month,
+        day=day,
+        hour=hour,
+        minute=minute,
+    )
+
+
+def _decode_header(
+    raw: bytes | memoryview, uncorrupt: bool = False
+) -> tuple[int, datetime.datetime, str, SurveyDirection]:
+    version = struct.unpack_from(">b", raw)[0]
+    codec = get_codec(version)
+    if len(raw) < codec.header.size:
+        raise IndexError("Reading beyond the buffer.")
+
+    header = codec.decode_header(codec.header.unpack_from(raw))
+
+    # When uncorrupting, the date might be corrupted: it is not decoded
+    date = (
+        datetime.datetime.now()  # noqa: DTZ005
+        if uncorrupt
+        else _decode_date(*header[1:6])
+    )
+    name = "".join([chr(i) for i in header[6:9]])
+    direction = SurveyDirection(header[9])
+
+    return version, date, name, direction
+
+
+def _decode_frames(version: int, chunks: list[memoryview]) -> dict[str, array[int]]:
+    """Unpack the shot frames of several sections in one pass and transpose them
+    in columns. `chunks` are views over the original buffer: nothing is copied."""
+    codec = get_codec(version)
+    frame = codec.frame
+
+    frames = itertools.chain.from_iterable(frame.iter_unpack(c) for c in chunks)
+    values = list(zip(*frames, strict=True))
+    if not values:  # no complete shot frame
+        values = [() for _ in frame.unpack(bytes(frame.size))]
+
+    if codec.shot_magic:  # magic values checking
+        for col, expected in zip(
+            (*values[:3], *values[-3:]),
+            (*SHOT_START_MAGIC, *SHOT_END_MAGIC),
+            strict=True,
+        ):
+            if col.count(expected) != len(col):
+                raise ValueError("Invalid shot magic values.")
+        values = values[3:-3]
+
+    return {
+        field: array("h" if field in SHOT_FIELD_SCALES else "b", col)
+        for field, col in zip(codec.fields, values, strict=True)
+    }
+
+
+def _frames_bounds(version: int, start: int, end: int) -> tuple[int, int]:
+    """Offsets of the complete shot frames of a section - trailing bytes ignored."""
+    codec = get_codec(version)
+    start += codec.header.size
+    frame_size = codec.frame.size
+    return start, start + (end - start) // frame_size * frame_size
+
+
+def decode_section(
+    raw: bytes | bytearray | memoryview, uncorrupt: bool = False
+) -> DecodedSection:
+    """Decode one section from its packed signed-byte representation."""
+    return decode_sections(raw, [(0, len(raw))], uncorrupt=uncorrupt)[0]
+
+
+def decode_sections(
+    raw: bytes | bytearray | memoryview,
+    bounds: list[tuple[int, int]],
+    uncorrupt: bool = False,
+) -> list[DecodedSection]:
+    """
+    Decode the sections located at `bounds` inside a packed DMP stream.
+
+    The headers are parsed first, then the shot frames of all the sections are
+    unpacked together, per DMP version, from views of `raw`. With `uncorrupt`,
+    the section dates are not decoded and set to the current time instead.
+    """
+    with phase("decode", n_bytes=sum(end - start for start, end in bounds)):
+        return _decode_sections(raw, bounds, uncorrupt=uncorrupt)
+
+
+def _decode_sections(
+    raw: bytes | bytearray | memoryview,
+    bounds: list[tuple[int, int]],
+    uncorrupt: bool,
+) -> list[DecodedSection]:
+    view = memoryview(raw)
+
+    headers = [
+        _decode_header(view[start:end], uncorrupt=uncorrupt) for start, end in bounds
+    ]
+
+    # ============================== SHOTS ============================== #
+    # {version: [frames of every section of this version]}
+    frames: dict[int, list[memoryview]] = {}
+    for (version, *_), (start, end) in zip(headers, bounds, strict=True):
+        frames_start, frames_end = _frames_bounds(version, start, end)
+        frames.setdefault(version, []).append(view[frames_start:frames_end])
+
+    stores = {
+        version: _decode_frames(version, chunks) for version, chunks in frames.items()
+    }
+
+    sections: list[DecodedSection] = []
+    chunks_iters = {version: iter(chunks) for version, chunks in frames.items()}
+    cursors = dict.fromkeys(stores, 0)
+    rows = {version: _ShotRows(store) for version, store in stores.items()}
+    for version, date, name, direction in headers:
+        start = cursors[version]
+        cursors[version] += (
+            len(next(chunks_iters[version])) // get_codec(version).frame.size
+        )
+        sections.append(
+            DecodedSection(
+                version=version,
+                date=date,
+                name=name,
+                direction=direction,
+                store=stores[version],
+                start=start,
+                stop=cursors[version],
+                rows=rows[version],
+            )
+        )
+
+    return sections
+
+
+def decode_dmp(dmp_data: list[int] | array[int] | bytes) -> list[DecodedSection]:
+    """Decode a full DMP stream into a list of `DecodedSection`."""
+    raw = pack_dmp_data(dmp_data)
+    return decode_sections(raw, find_section_offsets(raw))
+
+
+def iter_decode_chunks(
+    chunks: Iterable[array[int] | bytes],
+) -> Iterator[DecodedSection]:
+    """
+    Decode sections incrementally from consecutive chunks of a DMP stream.
+
+    Each section is yielded as soon as its end of survey sequence is received, so
+    only the section being read is kept in memory.
+    """
+    buffer = bytearray()
+    regex: re.Pattern[bytes] | None = None
+    eos_size = 0
+    pos = 0  # where to resume searching for an end of survey sequence
+
+    for chunk in chunks:
+        buffer += pack_dmp_data(chunk)
+
+        if regex is None:
+            if not buffer:
+                continue
+
+            dmp_version = struct.unpack_from(">b", buffer)[0]
+            regex = get_eos_regex(dmp_version)
+            eos_size = len(EOS_SEQUENCES[dmp_version][0])
+
+        start = 0
+        while True:
+            with phase("split", n_bytes=len(buffer) - pos):
+                match = regex.search(buffer, pos)
+            if match is None:
+                break
+
+            yield decode_section(bytes(buffer[start : match.end()]))
+            start = pos = match.end()
+
+        # Drop the sections already decoded
+        del buffer[:start]
+        pos = max(0, len(buffer) - eos_size + 1)
+
+
+# ========================== Serialization ========================== #
+
+
+def _little_endian(values: array[int]) -> array[int]:
+    if sys.byteorder == "big":  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def dump_sections(sections: Sequence[DecodedSection]) -> bytes:
+    """
+    Serialize decoded sections as compressed columns, see `load_sections`.
+
+    Loading them back is lossless and skips the parsing of the headers and of
+    the shot frames: used by `DMPCache` and `DMPMemo`.
+    """
+    store_indices: dict[int, int] = {}
+    stores: list[dict[str, tuple[str, bytes]]] = []
+    headers: list[tuple[int, tuple[int, ...], str, int, int, int, int]] = []
+    for section in sections:
+        store = section._store  # noqa: SLF001
+        if (store_idx := store_indices.get(id(store))) is None:
+            store_idx = store_indices[id(store)] = len(stores)
+            stores.append(
+                {
+                    field: (values.typecode, _little_endian(values).tobytes())
+                    for field, values in store.items()
+                }
+            )
+
+        date = section.date
+        headers.append(
+            (
+                section.version,
+                (
+                    date.year,
+                    date.month,
+                    date.day,
+                    date.hour,
+                    date.minute,
+                    date.second,
+                    date.microsecond,
+                ),
+                section.name,
+                section.direction.value,
+                store_idx,
+                section._start,  # noqa: SLF001
+                section._stop,  # noqa: SLF001
+            )
+        )
+
+    return zlib.compress(marshal.dumps((headers, stores)), 1)
+
+
+def load_sections(buffer: bytes | bytearray | memoryview) -> list[DecodedSection]:
+    """Load sections serialized by `dump_sections`."""
+    try:
+        # Only ever holds the plain values written by `dump_sections`
+        headers, dumped = marshal.loads(zlib.decompress(buffer))  # noqa: S302
+
+        stores = [
+            {
+                field: _little_endian(array(typecode, values))
+                for field, (typecode, values) in store.items()
+            }
+            for store in dumped
+        ]
+        rows = [_ShotRows(store) for store in stores]
+
+        return [
+            DecodedSection(
+                version=version,
+                date=datetime.datetime(*date),  # noqa: DTZ001
+                name=name,
+                direction=SurveyDirection(direction),
+                store=stores[store_idx],
+                start=start,
+                stop=stop,
+                rows=rows[store_idx],
+            )
+            for version, date, name, direction, store_idx, start, stop in headers
+        ]
+    except (zlib.error, EOFError, IndexError, TypeError, ValueError) as e:
+        raise ValueError("Invalid serialized sections.") from e
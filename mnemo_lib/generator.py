@@ -0,0 +1,359 @@
+"""
+Seeded generator of synthetic DMP files, for load testing.
+
+Surveys are random walks: the heading, pitch and depth of a shot follow from
+the previous one, lengths, LRUD and temperatures are drawn around typical cave
+values, and every value stays within the bounds of `Shot`. Sections are
+generated, encoded and written one at a time: the size of the output is not
+limited by the memory.
+
+The output only depends on the arguments: the same seed always produces the
+same bytes. Corruptions are drawn from their own random stream, so a corrupted
+file only differs from its clean counterpart by the corrupted sections.
+
+Versions 3 and 4 can be generated, but `mnemo_lib` can not split them into
+sections yet: their end of survey sequences are not known (see
+`utils.EOS_SEQUENCES`).
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+import operator
+import os
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from mnemo_lib.codecs import SHOT_END_MAGIC
+from mnemo_lib.codecs import SHOT_FIELDS
+from mnemo_lib.codecs import SHOT_START_MAGIC
+from mnemo_lib.codecs import get_codec
+from mnemo_lib.constants import MN2OVER
+from mnemo_lib.constants import MNEMO_SUPPORTED_VERSIONS
+from mnemo_lib.constants import ShotType
+from mnemo_lib.constants import SurveyDirection
+from mnemo_lib.writers import dmp_bytes_to_text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from typing import BinaryIO
+
+    from mnemo_lib.codecs import FrameCodec
+
+# Kinds of corruption that can be injected in a section:
+# - `truncated`: the section is cut in the middle of its shots, without its
+#   end of survey shot.
+# - `magic`: one of the section or shot start magic values is broken.
+#   Versions 3 to 5.
+# - `buggy_eos`: the section ends with the buggy end of survey shot of some
+#   devices, which is still readable. Version 5 only.
+CORRUPTIONS = ("truncated", "magic", "buggy_eos")
+
+_MIN_CORRUPTION_VERSION = {"truncated": 2, "magic": 3, "buggy_eos": 5}
+
+DEFAULT_START_DATE = datetime.datetime(2024, 1, 1, 9, 0)  # noqa: DTZ001
+
+# Int16BE hundredths of meters: at most 327.67m
+_MAX_DEPTH = 300.0
+
+# Head in/out of the buggy end of survey shot: the bytes `7, 8, 7, 8`
+_BUGGY_EOS_HEADING = 7 * 256 + 8
+
+_NAME_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+class GeneratedSection(NamedTuple):
+    raw: bytes  # packed signed bytes of the section
+    n_shots: int  # shots before the end of survey shot, 0 if truncated
+    corruption: str | None
+
+
+class GeneratorStats(NamedTuple):
+    n_sections: int
+    n_shots: int
+    n_corrupted: int
+    size: int  # bytes written
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return min(max(value, low), high)
+
+
+def _device(value: float, scale: float) -> int:
+    return round(value * scale)
+
+
+def _check(
+    version: int,
+    n_sections: int,
+    shots: tuple[int, int],
+    corruption_rate: float,
+    corruptions: tuple[str, ...],
+    start_date: datetime.datetime,
+) -> None:
+    if version not in MNEMO_SUPPORTED_VERSIONS:
+        raise ValueError(
+            f"Unsupported Mnemo Version: {version}, "
+            f"expected one of {MNEMO_SUPPORTED_VERSIONS}."
+        )
+
+    if n_sections < 0:
+        raise ValueError(f"`n_sections` must be positive: `{n_sections}`.")
+
+    if not 0 <= shots[0] <= shots[1]:
+        raise ValueError(f"Invalid range of shots per section: `{shots}`.")
+
+    if not 0 <= corruption_rate <= 1:
+        raise ValueError(
+            f"`corruption_rate` must be within [0, 1]: `{corruption_rate}`."
+        )
+
+    if corruption_rate > 0 and not corruptions:
+        raise ValueError("At least one kind of corruption is required.")
+
+    for kind in corruptions:
+        if kind not in _MIN_CORRUPTION_VERSION:
+            raise ValueError(f"Unknown corruption `{kind}`, expected: {CORRUPTIONS}.")
+        if version < _MIN_CORRUPTION_VERSION[kind]:
+            raise ValueError(
+                f"Corruption `{kind}` requires a DMP version >= "
+                f"{_MIN_CORRUPTION_VERSION[kind]}, got `{version}`."
+            )
+
+    if start_date.year not in range(2016, 2100) or start_date.day == 31:
+        raise ValueError(
+            f"`start_date` must be within 2016 and 2099, not a 31st: `{start_date}`."
+        )
+
+
+def _next_date(
+    date: datetime.datetime, rng: random.Random, start_date: datetime.datetime
+) -> datetime.datetime:
+    """Date of the section following one at `date`: the day 31 is not valid in
+    a DMP file and the dates wrap around to `start_date` after 2099."""
+    date += datetime.timedelta(minutes=rng.randint(5, 240))
+    if date.day == 31:
+        date = (date + datetime.timedelta(days=1)).replace(hour=9, minute=0)
+    if date.year >= 2100:
+        date = start_date
+    return date
+
+
+def _section_shots(
+    rng: random.Random, n_shots: int, date: datetime.datetime
+) -> Iterator[dict[str, int]]:
+    """Every field of `n_shots` consecutive shots, in device units."""
+    heading = rng.uniform(0, 360)
+    depth = rng.uniform(0, 30)
+    temperature = _clamp(rng.gauss(16, 5), -5, 35)
+    elapsed = date.hour * 3600 + date.minute * 60
+
+    for _ in range(n_shots):
+        heading = (heading + rng.gauss(0, 30)) % 360
+        head_out = (heading + rng.gauss(0, 1.5)) % 360
+        pitch = _clamp(rng.gauss(0, 15), -90, 90)
+        length = _clamp(rng.lognormvariate(math.log(4), 0.6), 0.1, 50)
+        depth_out = _clamp(
+            depth - length * math.sin(math.radians(pitch)), 0, _MAX_DEPTH
+        )
+        temperature = _clamp(temperature + rng.gauss(0, 0.2), -50, 49.9)
+        elapsed += rng.randint(20, 180)
+
+        yield {
+            "type": (
+                ShotType.STANDARD
+                if rng.random() > 0.02
+                else rng.choice((ShotType.CSA, ShotType.CSB))
+            ),
+            # `% 3600`: 359.96 would be rounded to 360.0, out of bounds
+            "head_in": _device(heading, 10) % 3600,
+            "head_out": _device(head_out, 10) % 3600,
+            "length": _device(length, 100),
+            "depth_in": _device(depth, 100),
+            "depth_out": _device(depth_out, 100),
+            "pitch_in": _device(pitch, 10),
+            "pitch_out": _device(_clamp(pitch + rng.gauss(0, 1), -90, 90), 10),
+            "left": _device(_clamp(rng.lognormvariate(0.4, 0.7), 0, 20), 100),
+            "right": _device(_clamp(rng.lognormvariate(0.4, 0.7), 0, 20), 100),
+            "up": _device(_clamp(rng.lognormvariate(0.2, 0.7), 0, 20), 100),
+            "down": _device(_clamp(rng.lognormvariate(0.0, 0.7), 0, 20), 100),
+            "temperature": _device(temperature, 10),
+            "hours": elapsed // 3600 % 24,
+            "minutes": elapsed // 60 % 60,
+            "seconds": elapsed % 60,
+            "marker_idx": 0 if rng.random() > 0.05 else rng.randint(1, 9),
+        }
+        depth = depth_out
+
+
+def _eos_shot(buggy: bool = False) -> dict[str, int]:
+    shot = dict.fromkeys(SHOT_FIELDS, 0)
+    shot["type"] = ShotType.END_OF_SURVEY
+    if buggy:
+        shot["head_in"] = shot["head_out"] = _BUGGY_EOS_HEADING
+    return shot
+
+
+def _pack_shots(codec: FrameCodec, shots: Iterable[dict[str, int]]) -> bytes:
+    get_fields = operator.itemgetter(*codec.fields)
+    if codec.shot_magic:
+        return b"".join(
+            codec.frame.pack(*SHOT_START_MAGIC, *get_fields(shot), *SHOT_END_MAGIC)
+            for shot in shots
+        )
+    return b"".join(codec.frame.pack(*get_fields(shot)) for shot in shots)
+
+
+def _corrupt(
+    raw: bytes, kind: str, codec: FrameCodec, n_shots: int, rng: random.Random
+) -> bytes:
+    header_size = codec.header.size
+    frame_size = codec.frame.size
+
+    match kind:
+        case "truncated":
+            # Cut anywhere after the header, before the end of survey shot
+            return raw[: rng.randint(header_size, len(raw) - frame_size - 1)]
+
+        case "magic":
+            # Section start magic values or, for version 5, start magic
+            # values of a shot other than the end of survey one
+            if codec.shot_magic and n_shots and rng.random() < 0.5:
+                offset = header_size + rng.randrange(n_shots) * frame_size
+            else:
+                offset = 1
+            idx = offset + rng.randrange(3)
+
+            corrupted = bytearray(raw)
+            corrupted[idx] = (corrupted[idx] + rng.randrange(1, 256)) % 256
+            return bytes(corrupted)
+
+        case "buggy_eos":
+            return raw[:-frame_size] + _pack_shots(codec, [_eos_shot(buggy=True)])
+
+    raise ValueError(f"Unknown corruption `{kind}`, expected: {CORRUPTIONS}.")
+
+
+def iter_sections(
+    version: int = 5,
+    n_sections: int = 10,
+    shots: int | tuple[int, int] = (10, 50),
+    seed: int = 0,
+    corruption_rate: float = 0.0,
+    corruptions: Iterable[str] | None = None,
+    start_date: datetime.datetime = DEFAULT_START_DATE,
+) -> Iterator[GeneratedSection]:
+    """
+    Yield `n_sections` synthetic sections of a DMP `version`.
+
+    Every section holds a number of shots drawn in the `shots` range (bounds
+    included), followed by its end of survey shot. Each section is corrupted
+    with the probability `corruption_rate`, by one of `corruptions` drawn at
+    random: every kind supported by `version` if `None`.
+    """
+    if isinstance(shots, int):
+        shots = (shots, shots)
+    if corruptions is None:
+        corruptions = [
+            kind for kind in CORRUPTIONS if version >= _MIN_CORRUPTION_VERSION[kind]
+        ]
+    corruptions = tuple(dict.fromkeys(corruptions))
+    _check(version, n_sections, shots, corruption_rate, corruptions, start_date)
+
+    codec = get_codec(version)
+    rng = random.Random(seed)
+    # Own stream: the values do not depend on the corruptions
+    corruption_rng = random.Random(f"{seed}-corruption")
+    eos = _pack_shots(codec, [_eos_shot()])
+
+    date = start_date
+    for _ in range(n_sections):
+        n_shots = rng.randint(*shots)
+        header = codec.encode_header(
+            (
+                version,
+                date.year % 100,
+                date.month,
+                date.day,
+                date.hour,
+                date.minute,
+                *(ord(rng.choice(_NAME_CHARS)) for _ in range(3)),
+                rng.choice(list(SurveyDirection)),
+            )
+        )
+        raw = header + _pack_shots(codec, _section_shots(rng, n_shots, date)) + eos
+
+        corruption = None
+        if corruption_rate and corruption_rng.random() < corruption_rate:
+            corruption = corruption_rng.choice(corruptions)
+            raw = _corrupt(raw, corruption, codec, n_shots, corruption_rng)
+            if corruption == "truncated":
+                n_shots = 0
+
+        yield GeneratedSection(raw, n_shots, corruption)
+        date = _next_date(date, rng, start_date)
+
+
+def generate_dmp(
+    file: BinaryIO,
+    version: int = 5,
+    n_sections: int = 10,
+    shots: int | tuple[int, int] = (10, 50),
+    seed: int = 0,
+    corruption_rate: float = 0.0,
+    corruptions: Iterable[str] | None = None,
+    start_date: datetime.datetime = DEFAULT_START_DATE,
+) -> GeneratorStats:
+    """
+    Write a synthetic DMP file to `file`, one section at a time.
+
+    See `iter_sections` for the arguments. The `MN2OVER` trailer is appended
+    for versions > 2.
+    """
+    n_sections_written = n_shots = n_corrupted = size = 0
+
+    for section in iter_sections(
+        version=version,
+        n_sections=n_sections,
+        shots=shots,
+        seed=seed,
+        corruption_rate=corruption_rate,
+        corruptions=corruptions,
+        start_date=start_date,
+    ):
+        size += file.write(dmp_bytes_to_text(section.raw))
+        n_sections_written += 1
+        n_shots += section.n_shots
+        n_corrupted += section.corruption is not None
+
+    if version > 2:
+        # adding `MN2OVER` message at the end
+        size += file.write(dmp_bytes_to_text(bytes(MN2OVER)))
+
+    return GeneratorStats(n_sections_written, n_shots, n_corrupted, size)
+
+
+def generate_dmp_file(filepath: str | Path, **kwargs) -> GeneratorStats:
+    """
+    Write a synthetic DMP file at `filepath`, see `generate_dmp`.
+
+    On failure, e.g. invalid arguments, an existing `filepath` is left untouched
+    and no partial file is left behind.
+    """
+    filepath = Path(filepath)
+
+    # Written next to the target then renamed
+    tmp_file = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_file.open(mode="wb") as file:
+            stats = generate_dmp(file, **kwargs)
+        tmp_file.replace(filepath)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+    return stats
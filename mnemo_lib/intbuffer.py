@@ -1,23 +1,54 @@
 from __future__ import annotations
 
+import struct
+from array import array
 from typing import TYPE_CHECKING
 from typing import overload
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from types import NoneType
+    from typing import Self
 
 
 class IntegerBuffer:
-    def __init__(self, buffer: list[int]) -> None:
-        if not isinstance(buffer, list) or any(  # pyright: ignore[reportUnnecessaryIsInstance]
-            not isinstance(item, int)  # pyright: ignore[reportUnnecessaryIsInstance]
-            for item in buffer
-        ):
+    """
+    Read cursor over a sequence of integers.
+
+    A `list` is validated and copied. An `array('b')`, `bytes`, `bytearray` or
+    `memoryview` of signed bytes is wrapped in a `memoryview` without copy nor
+    validation: sub-buffers returned by `read_buffer` share the same storage and
+    Int16BE values are decoded in bulk with `struct`.
+    """
+
+    buffer: Sequence[int]
+
+    def __init__(
+        self, buffer: list[int] | array[int] | bytes | bytearray | memoryview
+    ) -> None:
+        if isinstance(buffer, list):
+            if any(not isinstance(item, int) for item in buffer):  # pyright: ignore[reportUnnecessaryIsInstance]
+                raise TypeError("Buffer must be a list of integers.")
+
+            self.buffer = tuple(buffer)  # Tuple to guarantee immutability
+
+        elif isinstance(buffer, (array, bytes, bytearray, memoryview)):
+            view = memoryview(buffer)
+            if view.itemsize != 1 or view.ndim != 1:
+                raise TypeError("Binary buffers must be one-dimensional bytes.")
+
+            self.buffer = view if view.format == "b" else view.cast("b")
+
+        else:
             raise TypeError("Buffer must be a list of integers.")
 
-        self.buffer = tuple(buffer)  # Tuple to guarantee immutability
         self.cursor = 0
 
+    @property
+    def is_packed(self) -> bool:
+        """`True` if the buffer is a zero-copy view over binary storage."""
+        return isinstance(self.buffer, memoryview)
+
     @overload
     def read(self) -> int: ...
 
@@ -51,17 +82,88 @@ class IntegerBuffer:
             case _:
                 raise TypeError(f"Unknown type received: {type(n_items)} ...")
 
-    def readInt16BE(self) -> float:  # noqa: N802
-        lsb: int = self.read()  # pyright: ignore[reportCallIssue]
-        msb: int = self.read()  # pyright: ignore[reportCallIssue]
-
-        # ---- old method ---- #
-        # if msb < 0:
-        #     msb = 2**8 + msb
-        #
-        # return lsb * 2**8 + msb
-        # -------------------- #
-        return (lsb * 2**8) + (msb & 0xFF)
+    def read_buffer(self, n_items: int) -> Self:
+        """
+        Read `n_items` integers as a new buffer and move the cursor.
+
+        Packed buffers share their storage with the returned sub-buffer.
+        """
+        if n_items <= 0:
+            raise ValueError("Can not fetch 0 or negative items.")
+
+        if self.cursor + n_items > len(self.buffer):
+            raise IndexError("Reading beyond the buffer.")
+
+        sub_buffer = object.__new__(type(self))
+        sub_buffer.buffer = self.buffer[self.cursor : self.cursor + n_items]
+        sub_buffer.cursor = 0
+
+        self.cursor += n_items
+        return sub_buffer
+
+    @overload
+    def readInt16BE(self) -> int: ...
+
+    @overload
+    def readInt16BE(self, n_items: NoneType) -> int: ...
+
+    @overload
+    def readInt16BE(self, n_items: int) -> list[int]: ...
+
+    def readInt16BE(self, n_items: int | None = None) -> int | list[int]:  # noqa: N802
+        """
+        Read one, or `n_items`, Int16BE values and move the cursor.
+        """
+        if n_items is None:
+            lsb: int = self.read()  # pyright: ignore[reportCallIssue]
+            msb: int = self.read()  # pyright: ignore[reportCallIssue]
+
+            # ---- old method ---- #
+            # if msb < 0:
+            #     msb = 2**8 + msb
+            #
+            # return lsb * 2**8 + msb
+            # -------------------- #
+            return (lsb * 2**8) + (msb & 0xFF)
+
+        if not self.is_packed:
+            values = self.read(n_items * 2)
+            return [
+                (lsb * 2**8) + (msb & 0xFF)
+                for lsb, msb in zip(values[0::2], values[1::2], strict=True)
+            ]
+
+        if n_items <= 0:
+            raise ValueError("Can not fetch 0 or negative items.")
+
+        if self.cursor + n_items * 2 > len(self.buffer):
+            raise IndexError("Reading beyond the buffer.")
+
+        values = struct.unpack_from(f">{n_items}h", self.buffer, self.cursor)  # pyright: ignore[reportArgumentType]
+        self.cursor += n_items * 2
+
+        return list(values)
+
+    def unpack(self, layout: struct.Struct) -> tuple[int, ...]:
+        """
+        Read `layout.size` signed bytes, unpack them in a single call and move the
+        cursor.
+        """
+        n_items = layout.size
+        if self.cursor + n_items > len(self.buffer):
+            raise IndexError("Reading beyond the buffer.")
+
+        if self.is_packed:
+            values = layout.unpack_from(self.buffer, self.cursor)  # pyright: ignore[reportArgumentType]
+        else:
+            try:
+                raw = array("b", self.buffer[self.cursor : self.cursor + n_items])
+            except OverflowError as e:
+                raise ValueError("Values must be signed bytes in [-128, 127].") from e
+            values = layout.unpack(raw)
+
+        self.cursor += n_items
+        return values
 
     def peek(self, items: int = 1) -> list[int]:
         """
@@ -0,0 +1,185 @@
+"""
+In-process memoization of decoded DMP files.
+
+Entries are keyed by the resolved path of the file, its size and modification
+time and the decoding options: a modified file is decoded again. They hold the
+sections exactly as decoded from the file, as compressed columns (see
+`decoder.dump_sections`), which are immutable and far smaller than the models.
+Every hit builds a new `DMPFile`: callers are free to modify it (as `mnemo
+correct` does) without affecting the memo nor the other callers.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from mnemo_lib.decoder import dump_sections
+from mnemo_lib.decoder import load_sections
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Sequence
+
+    from mnemo_lib.decoder import DecodedSection
+
+DEFAULT_MEMO_ENTRIES = 128
+DEFAULT_MEMO_SIZE = 64 << 20  # 64 MiB
+
+# (resolved path, size, mtime_ns, uncorrupt, uncorrupt_date)
+MemoKey = tuple[str, int, int, bool, "datetime.date | None"]
+
+
+class MemoStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class DMPMemo:
+    """
+    Thread-safe, bounded, LRU memo of decoded DMP files.
+
+    Used by `DMPFile.from_dmp(..., memo=DMPMemo())`. The least recently used
+    entries are evicted beyond `max_entries` entries or `max_size` bytes.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_evictions",
+        "_hits",
+        "_lock",
+        "_misses",
+        "_size",
+        "max_entries",
+        "max_size",
+    )
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MEMO_ENTRIES,
+        max_size: int = DEFAULT_MEMO_SIZE,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("`max_entries` must be strictly positive.")
+
+        if max_size <= 0:
+            raise ValueError("`max_size` must be strictly positive.")
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[MemoKey, bytes] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(
+        filepath: str | Path,
+        uncorrupt: bool = False,
+        uncorrupt_date: datetime.date | None = None,
+    ) -> MemoKey:
+        """Key of the current version of `filepath` decoded with the given
+        options."""
+        path = Path(filepath).resolve()
+        stat = path.stat()
+        return (str(path), stat.st_size, stat.st_mtime_ns, uncorrupt, uncorrupt_date)
+
+    def get(self, key: MemoKey) -> list[DecodedSection] | None:
+        """
+        Decoded sections of the entry `key`, `None` if absent.
+
+        An entry which can no longer be loaded is dropped and reported as
+        absent, like a corrupted `DMPCache` entry.
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        # Loaded out of the lock: entries are immutable
+        try:
+            return load_sections(entry)
+        except ValueError:
+            with self._lock:
+                self._hits -= 1
+                self._misses += 1
+                # Unless replaced in the meantime
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self._size -= len(entry)
+            return None
+
+    def put(self, key: MemoKey, sections: Sequence[DecodedSection]) -> None:
+        """Store the decoded `sections` as `key`."""
+        self.put_entry(key, dump_sections(sections))
+
+    def put_entry(self, key: MemoKey, entry: bytes) -> None:
+        """Store as `key` the serialized sections `entry`, e.g. a `DMPCache`
+        entry, see `decoder.dump_sections`."""
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = entry
+            self._size += len(entry)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_size
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
+
+    def invalidate(self, filepath: str | Path | None = None) -> int:
+        """
+        Drop every entry of `filepath`, whatever its version and decoding
+        options, or every entry without `filepath`. Returns the number of
+        entries dropped.
+        """
+        with self._lock:
+            if filepath is None:
+                keys = list(self._entries)
+            else:
+                path = str(Path(filepath).resolve())
+                keys = [key for key in self._entries if key[0] == path]
+
+            for key in keys:
+                self._size -= len(self._entries.pop(key))
+
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @property
+    def stats(self) -> MemoStats:
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
@@ -1,32 +1,146 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
+import gc
+from array import array
+from collections.abc import Callable  # noqa: TC003 - resolved by pydantic
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Annotated
 from typing import Any
 from typing import ClassVar
 from typing import Literal
+from typing import TypeVar
+from typing import overload
 
 import orjson
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import RootModel
 from pydantic import field_serializer
 from pydantic import field_validator
 
-from mnemo_lib.constants import MNEMO_SUPPORTED_VERSIONS
+from mnemo_lib import arrow
+from mnemo_lib.batch import arun_batch
+from mnemo_lib.batch import resolve_workers
+from mnemo_lib.batch import run_batch
+from mnemo_lib.codecs import SHOT_FIELD_SCALES
+from mnemo_lib.codecs import SHOT_FIELDS
+from mnemo_lib.codecs import get_codec
+from mnemo_lib.constants import MN2OVER
 from mnemo_lib.constants import ShotType
 from mnemo_lib.constants import SurveyDirection
+from mnemo_lib.decoder import SHOT_MODEL_FIELDS
+from mnemo_lib.decoder import decode_sections
+from mnemo_lib.decoder import dump_sections
+from mnemo_lib.decoder import iter_decode_chunks
+from mnemo_lib.decoder import load_sections
 from mnemo_lib.intbuffer import IntegerBuffer
-from mnemo_lib.utils import convert_to_Int16BE
-from mnemo_lib.utils import split_dmp_into_sections
-from mnemo_lib.utils import try_split_dmp_in_sections
+from mnemo_lib.packed import PackedDMP
+from mnemo_lib.packed import write_packed_sections
+from mnemo_lib.profiling import phase
+from mnemo_lib.progress import PROGRESS_INTERVAL
+from mnemo_lib.progress import Progress
+from mnemo_lib.tokenizer import DEFAULT_CHUNK_SIZE
+from mnemo_lib.tokenizer import iter_dmp_chunks
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.tokenizer import tokenize_dmp
+from mnemo_lib.utils import chunk_section_offsets
+from mnemo_lib.utils import find_recovery_offsets
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.utils import iter_recovery_offsets
+from mnemo_lib.utils import iter_section_offsets
+from mnemo_lib.utils import pack_dmp_data
+from mnemo_lib.writers import write_dmp
+from mnemo_lib.writers import write_ndjson
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from concurrent.futures import Executor
     from typing import Self
 
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+    from mnemo_lib.batch import BatchResult
+    from mnemo_lib.cache import DMPCache
+    from mnemo_lib.codecs import FrameCodec
+    from mnemo_lib.decoder import DecodedSection
+    from mnemo_lib.memo import DMPMemo
+    from mnemo_lib.progress import CancellationToken
+    from mnemo_lib.progress import ProgressCallback
+    from mnemo_lib.table import SectionTable
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# - "full": every model is validated on construction.
+# - "deferred": models are trusted on construction and validated in one batch by
+#   `DMPFile.ensure_validated`, on first access to `DMPFile.sections`, dump,
+#   comparison or export. `DMPFile.root` gives the sections as is, unvalidated.
+# - "none": models are trusted and never validated.
+ValidationMode = Literal["full", "deferred", "none"]
+
+# `Shot` validators clamp these fields to 0
+_POSITIVE_FIELDS = ("length", "depth_in", "depth_out")
+
+# `Shot` float fields, possibly serialized as integers
+_FLOAT_FIELDS = tuple(SHOT_FIELD_SCALES)
+
+# Optional `Shot` fields default to `None`, in the order of the model fields
+_EMPTY_SHOT: dict[str, Any] = dict.fromkeys(SHOT_MODEL_FIELDS)
+
+# Enum members by name and by value
+_SHOT_TYPES: dict[str | int, ShotType] = {
+    **{member.name: member for member in ShotType},
+    **{member.value: member for member in ShotType},
+}
+_SURVEY_DIRECTIONS: dict[str | int, SurveyDirection] = {
+    **{member.name: member for member in SurveyDirection},
+    **{member.value: member for member in SurveyDirection},
+}
+
+
+_object_setattr = object.__setattr__
+
+
+def _construct_trusted(model_cls: type[ModelT], data: dict[str, Any]) -> ModelT:
+    """
+    Build `model_cls` from already validated `data` holding every field, in the
+    order of `model_cls.model_fields` like validated models.
+
+    Same result as `model_construct`, minus its per-field default handling which
+    makes it slower than the validation itself.
+    """
+    model = model_cls.__new__(model_cls)
+    _object_setattr(model, "__dict__", data)
+    _object_setattr(model, "__pydantic_fields_set__", set(data))
+    _object_setattr(model, "__pydantic_extra__", None)
+    _object_setattr(model, "__pydantic_private__", None)
+    return model
+
+
+def _encode_shots(shots: Sequence[Shot], codec: FrameCodec) -> bytes:
+    """Encode `shots` into consecutive frames, one field at a time."""
+    columns: list[list[int]] = []
+    for values, scale in zip(
+        zip(*map(codec.get_fields, shots), strict=True), codec.scales, strict=True
+    ):
+        if scale is None:
+            columns.append([value if value else 0 for value in values])
+        else:
+            columns.append([round(value * scale) if value else 0 for value in values])
+
+    return codec.encode_frames(columns)
+
 
 class Shot(BaseModel):
     type: ShotType
@@ -89,82 +203,23 @@ class Shot(BaseModel):
             raise ValueError(f"Expected numeric or empty value, got {v!r}") from e
 
     @classmethod
-    def from_dmp(cls, version: int, int_buffer: list[int]) -> Self:
-        if version not in MNEMO_SUPPORTED_VERSIONS:
-            raise ValueError(
-                f"Invalid File Format: Expected DMP version: {MNEMO_SUPPORTED_VERSIONS}"
-                f", got `{version}`."
-            )
-
-        buffer = IntegerBuffer(int_buffer)  # pyright: ignore[reportAssignmentType]
-
-        data: dict[str, Any] = {
-            "depth_in": None,
-            "depth_out": None,
-            "down": None,
-            "head_in": None,
-            "head_out": None,
-            "hours": None,
-            "left": None,
-            "length": None,
-            "marker_idx": None,
-            "minutes": None,
-            "pitch_in": None,
-            "pitch_out": None,
-            "right": None,
-            "seconds": None,
-            "temperature": None,
-            "type": None,
-            "up": None,
-        }
-
-        # =========================== Magic Values ========================== #
-
-        if version >= 5:  # magic values checking
-            assert buffer.read() == cls.shotStartValueA
-            assert buffer.read() == cls.shotStartValueB
-            assert buffer.read() == cls.shotStartValueC
-
-        # =============================== TYPE ============================== #
-
-        data["type"] = ShotType(buffer.read())
-
-        # ============================= Shot Data =========================== #
-
-        data["head_in"] = buffer.readInt16BE() / 10.0
-        data["head_out"] = buffer.readInt16BE() / 10.0
-        data["length"] = buffer.readInt16BE() / 100.0
-        data["depth_in"] = buffer.readInt16BE() / 100.0
-        data["depth_out"] = buffer.readInt16BE() / 100.0
-        data["pitch_in"] = buffer.readInt16BE() / 10.0
-        data["pitch_out"] = buffer.readInt16BE() / 10.0
-
-        # =============================== LRUD ============================== #
+    def from_dmp(cls, version: int, int_buffer: list[int] | IntegerBuffer) -> Self:
+        codec = get_codec(version)
 
-        if version >= 4:
-            data["left"] = buffer.readInt16BE() / 100.0
-            data["right"] = buffer.readInt16BE() / 100.0
-            data["up"] = buffer.readInt16BE() / 100.0
-            data["down"] = buffer.readInt16BE() / 100.0
-
-        # =============================== Env =============================== #
-
-        if version >= 4:
-            data["temperature"] = buffer.readInt16BE() / 10.0
-            data["hours"] = buffer.read()
-            data["minutes"] = buffer.read()
-            data["seconds"] = buffer.read()
-
-        # ============================= Markers ============================= #
+        buffer = (
+            int_buffer
+            if isinstance(int_buffer, IntegerBuffer)
+            else IntegerBuffer(int_buffer)
+        )
 
-        data["marker_idx"] = buffer.read()
+        # Fields absent from this DMP version are left empty
+        data: dict[str, Any] = dict.fromkeys(SHOT_FIELDS)
 
-        # =========================== Magic Values ========================== #
+        for field, value in codec.decode_frame(buffer.unpack(codec.frame)).items():
+            scale = SHOT_FIELD_SCALES.get(field)
+            data[field] = value if scale is None else value / scale
 
-        if version >= 5:  # magic values checking
-            assert buffer.read() == cls.shotEndValueA
-            assert buffer.read() == cls.shotEndValueB
-            assert buffer.read() == cls.shotEndValueC
+        data["type"] = ShotType(data["type"])
 
         return cls.model_validate(data)
 
@@ -193,53 +248,7 @@ class Shot(BaseModel):
         )
 
     def _generate_dmp(self, version: int) -> list[int]:  # pyright: ignore[reportIncompatibleMethodOverride]
-        if version not in MNEMO_SUPPORTED_VERSIONS:
-            raise ValueError(
-                f"Invalid File Format: Expected DMP version: {MNEMO_SUPPORTED_VERSIONS}"
-                f", got `{version}`."
-            )
-
-        data: list[int] = []
-
-        # Magic Numbers
-        if version >= 5:
-            data += [self.shotStartValueA, self.shotStartValueB, self.shotStartValueC]
-
-        data += [
-            self.type.value,
-            *convert_to_Int16BE(self.head_in * 10.0),
-            *convert_to_Int16BE(self.head_out * 10.0),
-            *convert_to_Int16BE(self.length * 100.0),
-            *convert_to_Int16BE(self.depth_in * 100.0),
-            *convert_to_Int16BE(self.depth_out * 100.0),
-            *convert_to_Int16BE(self.pitch_in * 10.0),
-            *convert_to_Int16BE(self.pitch_out * 10.0),
-        ]
-
-        if version >= 4:
-            data += [
-                *convert_to_Int16BE((left if (left := self.left) else 0.0) * 100.0),
-                *convert_to_Int16BE((right if (right := self.right) else 0.0) * 100.0),
-                *convert_to_Int16BE((up if (up := self.up) else 0.0) * 100.0),
-                *convert_to_Int16BE((down if (down := self.down) else 0.0) * 100.0),
-            ]
-
-        if version >= 3:
-            data += [
-                *convert_to_Int16BE(
-                    (temp if (temp := self.temperature) else 0.0) * 10.0
-                ),
-                hours if (hours := self.hours) else 0,
-                minutes if (minutes := self.minutes) else 0,
-                seconds if (seconds := self.seconds) else 0,
-            ]
-
-        data += [marker_idx if (marker_idx := self.marker_idx) else 0]
-
-        if version >= 5:
-            data += [self.shotEndValueA, self.shotEndValueB, self.shotEndValueC]
-
-        return data
+        return array("b", _encode_shots([self], get_codec(version))).tolist()
 
 
 class Section(BaseModel):
@@ -296,8 +305,15 @@ class Section(BaseModel):
         return value.strftime("%Y-%m-%d %H:%M")
 
     @classmethod
-    def from_dmp(cls, int_buffer: list[int], uncorrupt: bool = False) -> Self:  # noqa: C901, PLR0912
-        buffer = IntegerBuffer(int_buffer)
+    def from_dmp(
+        cls,
+        int_buffer: list[int] | array[int] | bytes | memoryview,
+        uncorrupt: bool = False,
+    ) -> Self:
+        # Packed once: every shot is then read from a view over the same storage
+        buffer = IntegerBuffer(
+            pack_dmp_data(int_buffer) if isinstance(int_buffer, list) else int_buffer
+        )
 
         data: dict[str, Any] = {
             "date": None,
@@ -309,43 +325,33 @@ class Section(BaseModel):
 
         # ============================= VERSION ============================= #
 
-        data["version"] = buffer.read()
-
-        if data["version"] not in MNEMO_SUPPORTED_VERSIONS:
-            raise ValueError(
-                f"Invalid File Format: Expected DMP version: {MNEMO_SUPPORTED_VERSIONS}"
-                f", got `{data['version']}`."
-            )
+        codec = get_codec(buffer[0])
 
-        if data["version"] > 2:  # magic values checking
-            assert buffer.read() == cls.sectionStartValueA
-            assert buffer.read() == cls.sectionStartValueB
-            assert buffer.read() == cls.sectionStartValueC
+        # Magic values are checked by the codec
+        header = codec.decode_header(buffer.unpack(codec.header))
+        data["version"] = header[0]
 
         # =============================== DATE ============================== #
 
         if uncorrupt:
-            _ = buffer.read(5)  # Skip 5 positions over
             data["date"] = datetime.datetime.now()  # noqa: DTZ005
 
         else:
-            year = buffer.read() + 2000
+            year, month, day, hour, minute = header[1:6]
+
+            year += 2000
             if year not in range(2016, 2100):
                 raise ValueError(f"Invalid year: `{year}`")
 
-            month = buffer.read()
             if month not in range(1, 13):
                 raise ValueError(f"Invalid month: `{month}`")
 
-            day = buffer.read()
             if day not in range(1, 31):
                 raise ValueError(f"Invalid day: `{day}`")
 
-            hour = buffer.read()
             if hour not in range(24):
                 raise ValueError(f"Invalid hour: `{hour}`")
 
-            minute = buffer.read()
             if hour not in range(60):
                 raise ValueError(f"Invalid minute: `{minute}`")
 
@@ -358,27 +364,13 @@ class Section(BaseModel):
             )
 
         # =============================== NAME ============================== #
-        data["name"] = "".join([chr(i) for i in buffer.read(3)])
+        data["name"] = "".join([chr(i) for i in header[6:9]])
 
         # ============================ DIRECTION ============================ #
 
-        data["direction"] = SurveyDirection(buffer.read())
+        data["direction"] = SurveyDirection(header[9])
 
         # ============================== SHOTS ============================== #
-        match data["version"]:
-            case 2:
-                shot_buff_len = 16
-            case 3:
-                shot_buff_len = 21
-            case 4:
-                shot_buff_len = 29
-            case 5:
-                shot_buff_len = 35
-            case _:
-                raise ValueError(
-                    f"Unknown value received for MNEMO DMP Version: `{data['version']}`"
-                )
-
         # `while True` loop equivalent with exit bound
         # There will never be more than 9999 shots in one section.
         for _ in range(int(9e5)):
@@ -386,7 +378,7 @@ class Section(BaseModel):
                 data["shots"].append(
                     Shot.from_dmp(
                         version=data["version"],
-                        int_buffer=buffer.read(shot_buff_len),
+                        int_buffer=buffer.read_buffer(codec.frame.size),
                     )
                 )
             except IndexError:
@@ -396,52 +388,257 @@ class Section(BaseModel):
 
         return cls.model_validate(data)
 
-    def _generate_dmp(self) -> list[int]:
-        # =================== DMP HEADER =================== #
-        data = [self.version]
+    @classmethod
+    def from_decoded(
+        cls, decoded: DecodedSection, validate: ValidationMode = "full"
+    ) -> Self:
+        """
+        Materialize a section produced by `mnemo_lib.decoder.decode_dmp`.
+
+        Unless `validate="full"`, the decoded values are trusted and the models
+        are built without validation. See `ValidationMode`.
+        """
+        with phase("validate", n_shots=len(decoded)):
+            if validate != "full":
+                # The decoded rows are already clamped like the validators do
+                shots = [
+                    _construct_trusted(Shot, shot_data)
+                    for shot_data in decoded.iter_shot_data()
+                ]
+
+                return _construct_trusted(
+                    cls,
+                    {
+                        "date": decoded.date,
+                        "direction": decoded.direction,
+                        "name": decoded.name,
+                        "shots": shots,
+                        "version": decoded.version,
+                    },
+                )
 
-        if self.version > 2:  # magic numbers
-            data += [
-                self.sectionStartValueA,
-                self.sectionStartValueB,
-                self.sectionStartValueC,
-            ]
+            return cls.model_validate(
+                {
+                    "date": decoded.date,
+                    "direction": decoded.direction,
+                    "name": decoded.name,
+                    "shots": [
+                        Shot.model_validate(shot_data)
+                        for shot_data in decoded.iter_shot_data()
+                    ],
+                    "version": decoded.version,
+                }
+            )
 
-        data += [
-            self.date.year % 100,  # 2023 -> 23
-            self.date.month,
-            self.date.day,
-            self.date.hour,
-            self.date.minute,
-            ord(self.name[0]),
-            ord(self.name[1]),
-            ord(self.name[2]),
-            self.direction.value,
-        ]
+    @classmethod
+    def from_serialized(
+        cls, data: dict[str, Any], validate: ValidationMode = "full"
+    ) -> Self:
+        """
+        Materialize a section from its serialized form, as produced by
+        `model_dump` or `DMPFile.to_json`.
+
+        Unless `validate="full"`, the values are trusted: they are only converted
+        to the field types, as the validators would, and no check is performed.
+        """
+        if validate == "full":
+            return cls.model_validate(data)
+
+        shots: list[Shot] = []
+        for shot in data["shots"]:
+            shot_data = _EMPTY_SHOT | shot
+            shot_data["type"] = _SHOT_TYPES[shot_data["type"]]
+
+            for field in _FLOAT_FIELDS:
+                if type(value := shot_data[field]) is int:
+                    shot_data[field] = float(value)
+
+            for field in _POSITIVE_FIELDS:
+                if shot_data[field] < 0:
+                    shot_data[field] = 0.0
+
+            shots.append(_construct_trusted(Shot, shot_data))
+
+        date = data["date"]
+        return _construct_trusted(
+            cls,
+            {
+                "date": (
+                    # Same result than `validate_datetime` for `%Y-%m-%d %H:%M`
+                    datetime.datetime.fromisoformat(date).replace(tzinfo=datetime.UTC)
+                    if isinstance(date, str)
+                    else date
+                ),
+                "direction": _SURVEY_DIRECTIONS[data["direction"]],
+                "name": data["name"],
+                "shots": shots,
+                "version": data["version"],
+            },
+        )
+
+    def to_dmp_bytes(self) -> bytes:
+        """Encode the section as packed signed bytes."""
+        codec = get_codec(self.version)
+
+        # =================== DMP HEADER =================== #
+        header = codec.encode_header(
+            [
+                self.version,
+                self.date.year % 100,  # 2023 -> 23
+                self.date.month,
+                self.date.day,
+                self.date.hour,
+                self.date.minute,
+                ord(self.name[0]),
+                ord(self.name[1]),
+                ord(self.name[2]),
+                self.direction.value,
+            ]
+        )
         # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%% #
 
-        for shot in self.shots:
-            data += shot._generate_dmp(version=self.version)  # pyright: ignore[reportPrivateUsage] # noqa: SLF001
+        return header + _encode_shots(self.shots, codec)
 
-        return data
+    def _generate_dmp(self) -> list[int]:
+        return array("b", self.to_dmp_bytes()).tolist()
 
 
 class DMPFile(RootModel[list[Section]]):
+    _pending_validation: bool = PrivateAttr(default=False)
+    # Called once the deferred validation succeeded, see `_when_validated`
+    _on_validated: Callable[[], None] | None = PrivateAttr(default=None)
+
+    def ensure_validated(self) -> None:
+        """Validate in one batch the sections built with `validate="deferred"`."""
+        if not self._pending_validation:
+            return
+
+        with phase(
+            "validate", n_shots=sum(len(section.shots) for section in self.root)
+        ):
+            self.root = [
+                Section.model_validate(
+                    {
+                        **section.__dict__,
+                        "shots": [shot.__dict__ for shot in section.shots],
+                    }
+                )
+                for section in self.root
+            ]
+        self._pending_validation = False
+
+        if (on_validated := self._on_validated) is not None:
+            self._on_validated = None
+            on_validated()
+
+    def _when_validated(self, callback: Callable[[], None]) -> None:
+        """Call `callback` now, or once validated by `ensure_validated`."""
+        if self._pending_validation:
+            self._on_validated = callback
+        else:
+            callback()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        if self._on_validated is not None:
+            # Bound to the stores of this process: copies are not stored, and
+            # the private attributes of a `RootModel` are held in `__dict__`
+            private = {**self.__pydantic_private__, "_on_validated": None}
+            state = {
+                **state,
+                "__dict__": {**state["__dict__"], "__pydantic_private__": private},
+            }
+        return state
+
+    def model_dump(self, **kwargs: Any) -> Any:
+        self.ensure_validated()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.ensure_validated()
+        return super().model_dump_json(**kwargs)
+
+    # Mutable, unhashable like any pydantic model
+    __hash__ = RootModel.__hash__
+
+    def __eq__(self, other: object) -> bool:
+        self.ensure_validated()
+        if isinstance(other, DMPFile):
+            other.ensure_validated()
+        return super().__eq__(other)
+
     def to_json(self, filepath: str | Path | None = None) -> str:
-        json_str = orjson.dumps(
-            self.model_dump(),
-            None,
-            option=(orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS),
-        ).decode("utf-8")
+        """
+        Serialize the file in JSON, also written to `filepath` if provided.
+
+        The file is serialized once, in memory. Use `writers.write_json` to
+        stream large files to the disk without building the string.
+        """
+        self.ensure_validated()
+
+        with phase(
+            "serialize", n_shots=sum(len(section.shots) for section in self.root)
+        ) as serialize_phase:
+            data = orjson.dumps(
+                self.model_dump(),
+                None,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS),
+            )
+            serialize_phase.add(n_bytes=len(data))
 
         if filepath is not None:
             if not isinstance(filepath, Path):
                 filepath = Path(filepath)
 
-            with filepath.open(mode="w") as file:
-                file.write(json_str)
+            filepath.write_bytes(data)
+
+        return data.decode("utf-8")
+
+    async def ato_json(
+        self, filepath: str | Path | None = None, executor: Executor | None = None
+    ) -> str:
+        """
+        Asyncio counterpart of `to_json`: the file is serialized, and written to
+        `filepath` if provided, in `executor`, the default executor of the
+        running loop if `None`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.to_json, filepath)
+
+    def to_ndjson(self, filepath: str | Path) -> int:
+        """Stream the shots to `filepath` as JSON Lines, see `write_ndjson`.
+        Returns the number of lines written."""
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        self.ensure_validated()
+
+        with filepath.open(mode="wb") as file:
+            return write_ndjson(self.root, file)
+
+    # ====================== Arrow / DataFrames ====================== #
+    # Optional dependencies: `pip install mnemo_lib[arrow]`, see `mnemo_lib.arrow`
+
+    def _to_table(self) -> SectionTable:
+        from mnemo_lib.table import SectionTable  # noqa: PLC0415
+
+        return SectionTable.from_dmpfile(self)
+
+    def to_arrow(self) -> pa.Table:
+        """Arrow table of the shots, one row per shot, see `arrow.to_arrow`."""
+        return arrow.to_arrow(self._to_table())
+
+    def to_pandas(self) -> pd.DataFrame:
+        """`pandas.DataFrame` of the shots, built from `to_arrow`."""
+        return arrow.to_pandas(self._to_table())
 
-        return json_str
+    def to_polars(self) -> pl.DataFrame:
+        """`polars.DataFrame` of the shots, built from `to_arrow`."""
+        return arrow.to_polars(self._to_table())
+
+    def to_parquet(self, filepath: str | Path) -> int:
+        """Write `to_arrow` as Parquet. Returns the number of shots written."""
+        return arrow.write_parquet(self._to_table(), filepath)
 
     @classmethod
     def from_dmp(
@@ -449,89 +646,731 @@ class DMPFile(RootModel[list[Section]]):
         filepath: Path | str,
         uncorrupt: bool = False,
         uncorrupt_date: datetime.date | None = None,
+        validate: ValidationMode = "full",
+        cache: DMPCache | None = None,
+        memo: DMPMemo | None = None,
+        workers: int = 1,
+        progress: ProgressCallback | None = None,
+        cancel: CancellationToken | None = None,
     ) -> Self:
+        """
+        Decode a DMP file.
+
+        `validate` selects when the models are validated, see `ValidationMode`.
+        With a `memo` (in-process, keyed by path and modification time) or a
+        `cache` (on-disk, keyed by content), the decoded file is looked up first
+        and stored once validated: with `validate="deferred"` on the first
+        `ensure_validated`, and `validate="none"` results are never stored.
+        Both store the sections as decoded, a hit being identical to a decoding.
+        `workers` processes share the validation, see `from_dmp_data`.
+        `progress` and `cancel` also cover the reading of the file, see
+        `mnemo_lib.progress`.
+        """
         if not isinstance(filepath, Path):
             filepath = Path(filepath)
 
         if not filepath.exists():
             raise FileNotFoundError
 
-        with filepath.open(mode="r") as file:
-            data = [int(i) for i in file.read().strip().split(";") if i != ""]
+        if memo is None and cache is None:
+            return cls.from_dmp_data(
+                read_dmp_file(filepath, progress=progress, cancel=cancel),
+                uncorrupt=uncorrupt,
+                uncorrupt_date=uncorrupt_date,
+                validate=validate,
+                workers=workers,
+                progress=progress,
+                cancel=cancel,
+            )
+
+        return cls._from_dmp_stored(
+            filepath,
+            uncorrupt=uncorrupt,
+            uncorrupt_date=uncorrupt_date,
+            validate=validate,
+            cache=cache,
+            memo=memo,
+            workers=workers,
+            progress=progress,
+            cancel=cancel,
+        )
+
+    @classmethod
+    def _from_dmp_stored(
+        cls,
+        filepath: Path,
+        uncorrupt: bool,
+        uncorrupt_date: datetime.date | None,
+        validate: ValidationMode,
+        cache: DMPCache | None,
+        memo: DMPMemo | None,
+        workers: int,
+        progress: ProgressCallback | None,
+        cancel: CancellationToken | None,
+    ) -> Self:
+        """`from_dmp` looking the file up in `memo` then in `cache`, and storing
+        it in both once validated."""
+        # The stores hold the sections as decoded, before the `uncorrupt` fix-ups
+        fixup_date = uncorrupt_date if uncorrupt else None
+
+        if memo is not None:
+            memo_key = memo.make_key(
+                filepath, uncorrupt=uncorrupt, uncorrupt_date=uncorrupt_date
+            )
+            if (decoded_sections := memo.get(memo_key)) is not None:
+                return cls._from_validated(decoded_sections, fixup_date)
+
+        if cache is None:
+            data = pack_dmp_data(
+                read_dmp_file(filepath, progress=progress, cancel=cancel)
+            )
+        else:
+            with phase("read") as read_phase:
+                raw = filepath.read_bytes()
+                read_phase.add(n_bytes=len(raw))
+            key = cache.make_key(
+                raw, uncorrupt=uncorrupt, uncorrupt_date=uncorrupt_date
+            )
+
+            if (entry := cache.get_entry(key)) is not None:
+                if memo is not None:
+                    memo.put_entry(memo_key, entry)
+                return cls._from_validated(load_sections(entry), fixup_date)
 
-        return cls.from_dmp_data(
+            data = pack_dmp_data(tokenize_dmp(raw))
+
+        dmp_file, bounds = cls._from_raw(
             data,
             uncorrupt=uncorrupt,
             uncorrupt_date=uncorrupt_date,
+            validate=validate,
+            workers=workers,
+            progress=progress,
+            cancel=cancel,
+        )
+
+        def store() -> None:
+            entry = dump_sections(decode_sections(data, bounds, uncorrupt=uncorrupt))
+            if memo is not None:
+                memo.put_entry(memo_key, entry)
+            if cache is not None:
+                cache.put_entry(key, entry)
+
+        if validate != "none":
+            dmp_file._when_validated(store)  # noqa: SLF001
+
+        return dmp_file
+
+    @classmethod
+    def from_many(
+        cls,
+        filepaths: Iterable[Path | str],
+        workers: int | None = None,
+        uncorrupt: bool = False,
+        uncorrupt_date: datetime.date | None = None,
+        validate: ValidationMode = "full",
+    ) -> Iterator[BatchResult[Self]]:
+        """
+        Decode many DMP files with a pool of `workers` processes, every CPU by
+        default, see `mnemo_lib.batch`.
+
+        Results are yielded as they complete. A file failing to decode does not
+        stop the batch: its result holds the error instead of the `DMPFile`.
+        """
+        workers = resolve_workers(workers)
+        if workers == 1:
+            yield from run_batch(
+                functools.partial(
+                    cls.from_dmp,
+                    uncorrupt=uncorrupt,
+                    uncorrupt_date=uncorrupt_date,
+                    validate=validate,
+                ),
+                filepaths,
+                workers=1,
+            )
+            return
+
+        # Workers send back the sections as decoded: far cheaper to pickle than
+        # the models, which are rebuilt here without validation
+        for result in run_batch(
+            functools.partial(
+                _read_dumped,
+                uncorrupt=uncorrupt,
+                uncorrupt_date=uncorrupt_date,
+                validate=validate,
+            ),
+            filepaths,
+            workers=workers,
+        ):
+            if result.value is None:
+                yield result  # pyright: ignore[reportReturnType]
+                continue
+
+            try:
+                dmp_file = cls._from_dumped(result.value, uncorrupt, uncorrupt_date)
+            except Exception as e:  # noqa: BLE001
+                yield result._replace(value=None, error=e)
+            else:
+                yield result._replace(value=dmp_file)
+
+    @classmethod
+    async def afrom_dmp(
+        cls,
+        filepath: Path | str,
+        uncorrupt: bool = False,
+        uncorrupt_date: datetime.date | None = None,
+        validate: ValidationMode = "full",
+        executor: Executor | None = None,
+    ) -> Self:
+        """
+        Asyncio counterpart of `from_dmp`: the file is read and decoded in
+        `executor`, the default executor of the running loop if `None`, without
+        blocking the loop.
+
+        With a `ProcessPoolExecutor`, the decoding does not even hold the GIL
+        of the loop: the file is sent back as decoded and its models are rebuilt
+        in the default executor.
+        """
+        loop = asyncio.get_running_loop()
+
+        if not isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    cls.from_dmp,
+                    filepath,
+                    uncorrupt=uncorrupt,
+                    uncorrupt_date=uncorrupt_date,
+                    validate=validate,
+                ),
+            )
+
+        dumped = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                _read_dumped,
+                Path(filepath),
+                uncorrupt=uncorrupt,
+                uncorrupt_date=uncorrupt_date,
+                validate=validate,
+            ),
+        )
+        return await loop.run_in_executor(
+            None, cls._from_dumped, dumped, uncorrupt, uncorrupt_date
         )
 
+    @classmethod
+    async def aiter_many(
+        cls,
+        filepaths: Iterable[Path | str],
+        concurrency: int = 4,
+        executor: Executor | None = None,
+        uncorrupt: bool = False,
+        uncorrupt_date: datetime.date | None = None,
+        validate: ValidationMode = "full",
+    ) -> AsyncIterator[BatchResult[Self]]:
+        """
+        Asyncio counterpart of `from_many`: decode many DMP files in `executor`,
+        at most `concurrency` at a time, see `afrom_dmp` and
+        `mnemo_lib.batch.arun_batch`.
+
+        Results are yielded as they complete. A file failing to decode does not
+        stop the iteration: its result holds the error instead of the `DMPFile`.
+        """
+        loop = asyncio.get_running_loop()
+        in_processes = isinstance(executor, ProcessPoolExecutor)
+
+        async for result in arun_batch(
+            functools.partial(
+                _read_dumped if in_processes else cls.from_dmp,
+                uncorrupt=uncorrupt,
+                uncorrupt_date=uncorrupt_date,
+                validate=validate,
+            ),
+            filepaths,
+            concurrency=concurrency,
+            executor=executor,
+        ):
+            if not in_processes or result.value is None:
+                yield result  # pyright: ignore[reportReturnType]
+                continue
+
+            try:
+                dmp_file = await loop.run_in_executor(
+                    None, cls._from_dumped, result.value, uncorrupt, uncorrupt_date
+                )
+            except Exception as e:  # noqa: BLE001
+                yield result._replace(value=None, error=e)
+            else:
+                yield result._replace(value=dmp_file)
+
+    @classmethod
+    def _from_dumped(
+        cls,
+        dumped: bytes,
+        uncorrupt: bool = False,
+        uncorrupt_date: datetime.date | None = None,
+    ) -> Self:
+        """Build a file sent back by `_read_dumped`: the models are trusted."""
+        return cls._from_validated(
+            load_sections(dumped), uncorrupt_date if uncorrupt else None
+        )
+
+    @classmethod
+    def _from_validated(
+        cls,
+        decoded_sections: list[DecodedSection],
+        uncorrupt_date: datetime.date | None = None,
+    ) -> Self:
+        """Build a file from sections validated before being stored in a cache or a
+        memo: the models are trusted. Recovered sections are given their
+        `uncorrupt_date` fix-ups again, see `from_dmp_data`."""
+        # The construction creates no reference cycle, the garbage collector
+        # would only keep rescanning the new models
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            sections = [
+                Section.from_decoded(decoded, validate="none")
+                for decoded in decoded_sections
+            ]
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if uncorrupt_date is not None:
+            _fix_uncorrupted(sections, uncorrupt_date)
+
+        return cls.model_construct(sections)
+
+    @classmethod
+    def from_json(cls, filepath: Path | str, validate: ValidationMode = "full") -> Self:
+        """
+        Load a file exported with `to_json`.
+
+        `validate` selects when the models are validated, see `ValidationMode`.
+        """
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileNotFoundError
+
+        with phase("read") as read_phase:
+            raw = filepath.read_bytes()
+            read_phase.add(n_bytes=len(raw))
+
+        if validate == "full":
+            # pydantic-core parses and validates in a single pass, faster than
+            # `orjson.loads` followed by `model_validate`
+            return cls.model_validate_json(raw)
+
+        data = orjson.loads(raw)
+        dmp_file = cls.model_construct(
+            [Section.from_serialized(section, validate=validate) for section in data]
+        )
+        dmp_file._pending_validation = validate == "deferred"  # noqa: SLF001
+        return dmp_file
+
+    @classmethod
+    def from_packed(
+        cls, filepath: Path | str, validate: ValidationMode = "full"
+    ) -> Self:
+        """
+        Load a file written by `to_packed`.
+
+        The file is memory-mapped and its sections are decoded straight out of
+        the mapped buffer, without tokenizing nor scanning for section bounds.
+        `validate` selects when the models are validated, see `ValidationMode`.
+        """
+        with PackedDMP(filepath) as packed:
+            sections = [
+                Section.from_decoded(decoded, validate=validate)
+                for decoded in packed.decode()
+            ]
+
+        if validate == "full":
+            return cls(sections)
+
+        dmp_file = cls.model_construct(sections)
+        dmp_file._pending_validation = validate == "deferred"  # noqa: SLF001
+        return dmp_file
+
+    def to_packed(self, filepath: str | Path) -> int:
+        """Write the file in the packed binary format, see `mnemo_lib.packed`.
+        Returns the number of bytes written."""
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        with filepath.open(mode="wb") as file:
+            return write_packed_sections(file, *self._encode_sections())
+
+    def _encode_sections(self) -> tuple[list[bytes], bytes]:
+        """Encoded sections and trailer of the DMP stream."""
+        self.ensure_validated()
+
+        sections = [section.to_dmp_bytes() for section in self.root]
+        # adding `MN2OVER` message at the end
+        trailer = bytes(MN2OVER) if self.root and self.root[0].version > 2 else b""
+
+        return sections, trailer
+
+    @classmethod
+    def iter_sections(
+        cls,
+        filepath: Path | str,
+        max_sections: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Section]:
+        """
+        Yield the sections of a DMP file one at a time.
+
+        The file is read by chunks of `chunk_size` bytes and each section is
+        decoded as soon as it is complete: memory usage is bounded by the largest
+        section, not by the file size. Stops after `max_sections` if provided.
+        """
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileNotFoundError
+
+        if max_sections is not None and max_sections <= 0:
+            return
+
+        with filepath.open(mode="rb") as file:
+            chunks = iter_dmp_chunks(file, chunk_size=chunk_size)
+            for idx, decoded in enumerate(iter_decode_chunks(chunks), start=1):
+                yield Section.from_decoded(decoded)
+
+                if idx == max_sections:
+                    return
+
     @classmethod
     def from_dmp_data(
         cls,
-        dmp_data: list[int],
+        dmp_data: list[int] | array[int],
         uncorrupt: bool = False,
         uncorrupt_date: datetime.date | None = None,
+        validate: ValidationMode = "full",
+        workers: int = 1,
+        progress: ProgressCallback | None = None,
+        cancel: CancellationToken | None = None,
     ) -> Self:
-        sections: list[Section]
+        """
+        Decode packed or unpacked DMP data.
+
+        `validate` selects when the models are validated, see `ValidationMode`.
+        The output is identical in every mode for valid input.
+
+        With `validate="full"` and more than one worker, the validation of the
+        sections, their most expensive step, is spread over a pool of `workers`
+        processes, see `_build_sections`.
+
+        `progress` is called as the sections are located and decoded, and the
+        decoding stops with `DecodingCancelledError` once `cancel` is cancelled,
+        see `mnemo_lib.progress`.
+        """
+        dmp_file, _ = cls._from_raw(
+            pack_dmp_data(dmp_data),
+            uncorrupt=uncorrupt,
+            uncorrupt_date=uncorrupt_date,
+            validate=validate,
+            workers=workers,
+            progress=progress,
+            cancel=cancel,
+        )
+        return dmp_file
+
+    @classmethod
+    def _from_raw(
+        cls,
+        raw: bytes | bytearray,
+        uncorrupt: bool,
+        uncorrupt_date: datetime.date | None,
+        validate: ValidationMode,
+        workers: int,
+        progress: ProgressCallback | None,
+        cancel: CancellationToken | None,
+    ) -> tuple[Self, list[tuple[int, int]]]:
+        """`from_dmp_data` of the packed stream `raw`, also returning the bounds
+        of its sections."""
+        if workers <= 0:
+            raise ValueError("`workers` must be strictly positive.")
 
         if not uncorrupt:
-            sections: list[Section] = [
-                Section.from_dmp(section_dmp, uncorrupt=False)
-                for section_dmp in split_dmp_into_sections(dmp_data)
-            ]
+            bounds = _find_bounds(
+                raw, uncorrupt=False, progress=progress, cancel=cancel
+            )
+            sections = _build_sections(
+                raw,
+                bounds,
+                uncorrupt=False,
+                validate=validate,
+                workers=workers,
+                progress=progress,
+                cancel=cancel,
+            )
         else:
             if uncorrupt_date is None:
                 raise ValueError(
                     "`uncorrupt_date` is mandatory for `uncorrupt == True`"
                 )
-            sections: list[Section] = [
-                Section.from_dmp(section_dmp, uncorrupt=True)
-                for section_dmp in try_split_dmp_in_sections(dmp_data)
-            ]
+            bounds = _find_bounds(raw, uncorrupt=True, progress=progress, cancel=cancel)
+            sections = _build_sections(
+                raw,
+                bounds,
+                uncorrupt=True,
+                validate=validate,
+                workers=workers,
+                progress=progress,
+                cancel=cancel,
+            )
+            _fix_uncorrupted(sections, uncorrupt_date)
 
-            for section in sections:
-                # Force fixing the date - Might be corrupted
-                section.date = datetime.datetime.combine(
-                    uncorrupt_date,
-                    datetime.datetime.min.time(),
-                )
+        if validate == "full":
+            return cls(sections), bounds
 
-                # Adding back the final EOS Shot (might not be here)
-                if section.shots[-1].type != ShotType.END_OF_SURVEY:
-                    section.shots.append(Shot.get_eos_shot())
+        dmp_file = cls.model_construct(sections)
+        dmp_file._pending_validation = validate == "deferred"  # noqa: SLF001
+        return dmp_file, bounds
 
-        return cls(sections)
+    @overload
+    def to_dmp(self, filepath: None = None, return_data: bool = ...) -> list[int]: ...
 
-    def to_dmp(self, filepath: str | Path | None = None) -> list[int]:
-        data = self._generate_dmp()
+    @overload
+    def to_dmp(
+        self, filepath: str | Path, return_data: Literal[False] = ...
+    ) -> None: ...
 
-        if filepath is not None:
-            if not isinstance(filepath, Path):
-                filepath = Path(filepath)
+    @overload
+    def to_dmp(self, filepath: str | Path, return_data: Literal[True]) -> list[int]: ...
 
-            with filepath.open(mode="w") as file:
-                # always finish with a trailing ";"
-                file.write(f"{';'.join([str(nbr) for nbr in data])};")
+    def to_dmp(
+        self, filepath: str | Path | None = None, return_data: bool = False
+    ) -> list[int] | None:
+        """
+        Encode the file in the DMP format.
 
-        return data
+        With a `filepath`, the sections are streamed to the file one at a time
+        and the encoded values are only returned if `return_data=True`.
+        """
+        if filepath is None:
+            return self._generate_dmp()
 
-    def _generate_dmp(self) -> list[int]:  # pyright: ignore[reportIncompatibleMethodOverride]
-        data = [nbr for section in self.root for nbr in section._generate_dmp()]  # pyright: ignore[reportPrivateUsage] # noqa: SLF001
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
 
-        file_version = int(data[0])
+        self.ensure_validated()
 
-        if file_version not in MNEMO_SUPPORTED_VERSIONS:
-            raise ValueError(
-                f"Invalid File Format: Expected DMP version: {MNEMO_SUPPORTED_VERSIONS}"
-                f", got `{file_version}`."
-            )
+        with filepath.open(mode="wb") as file:
+            write_dmp(self.root, file)
+
+        return self._generate_dmp() if return_data else None
+
+    def _generate_dmp(self) -> list[int]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        self.ensure_validated()
 
-        if file_version > 2:  # version > 2
+        data = array("b", b"".join(section.to_dmp_bytes() for section in self.root))
+
+        if data[0] > 2:  # version > 2
             # adding `MN2OVER` message at the end
-            data += [77, 78, 50, 79, 118, 101, 114]
+            data.extend(MN2OVER)
 
-        return data
+        return data.tolist()
 
     @property
     def sections(self):
+        self.ensure_validated()
         return self.root
+
+
+def _read_dumped(
+    filepath: Path,
+    uncorrupt: bool,
+    uncorrupt_date: datetime.date | None,
+    validate: ValidationMode,
+) -> bytes:
+    """
+    Worker of `DMPFile.from_many`: decode and validate a DMP file, returned as
+    its sections exactly as decoded, see `decoder.dump_sections`.
+
+    Encoding the models back to the DMP format would not be lossless.
+    """
+    data = pack_dmp_data(read_dmp_file(filepath))
+    dmp_file, bounds = DMPFile._from_raw(  # noqa: SLF001
+        data,
+        uncorrupt=uncorrupt,
+        uncorrupt_date=uncorrupt_date,
+        validate=validate,
+        workers=1,
+        progress=None,
+        cancel=None,
+    )
+    # Raises in the worker, like `from_dmp`, for a deferred validation
+    dmp_file.ensure_validated()
+
+    return dump_sections(decode_sections(data, bounds, uncorrupt=uncorrupt))
+
+
+def _fix_uncorrupted(sections: list[Section], uncorrupt_date: datetime.date) -> None:
+    """Fix-ups of the sections recovered with `uncorrupt`."""
+    for section in sections:
+        # Force fixing the date - Might be corrupted
+        section.date = datetime.datetime.combine(
+            uncorrupt_date,
+            datetime.datetime.min.time(),
+        )
+
+        # Adding back the final EOS Shot (might not be here)
+        if section.shots[-1].type != ShotType.END_OF_SURVEY:
+            section.shots.append(Shot.get_eos_shot())
+
+
+def _validate_sections(
+    data: bytes, bounds: list[tuple[int, int]], uncorrupt: bool
+) -> None:
+    """Worker of `_build_sections`: raise if a section of `data` is invalid."""
+    for decoded in decode_sections(data, bounds, uncorrupt=uncorrupt):
+        Section.from_decoded(decoded, validate="full")
+
+
+def _find_bounds(
+    raw: bytes | bytearray,
+    uncorrupt: bool,
+    progress: ProgressCallback | None = None,
+    cancel: CancellationToken | None = None,
+) -> list[tuple[int, int]]:
+    """Offsets of the sections of `raw`, recovered ones with `uncorrupt`.
+    `cancel` is checked before every section, see `mnemo_lib.progress`."""
+    if progress is None and cancel is None:
+        return find_recovery_offsets(raw) if uncorrupt else find_section_offsets(raw)
+
+    bounds: list[tuple[int, int]] = []
+    reported = 0
+    with phase("split", n_bytes=len(raw)):
+        for start, end in (
+            iter_recovery_offsets(raw) if uncorrupt else iter_section_offsets(raw)
+        ):
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            bounds.append((start, end))
+
+            if progress is not None and end - reported >= PROGRESS_INTERVAL:
+                reported = end
+                progress(Progress("split", end, len(raw), len(bounds), 0))
+
+    if progress is not None:
+        progress(Progress("split", len(raw), len(raw), len(bounds), 0))
+
+    return bounds
+
+
+def _iter_built_sections(
+    raw: bytes | bytearray,
+    bounds: list[tuple[int, int]],
+    uncorrupt: bool,
+    validate: ValidationMode,
+    progress: ProgressCallback | None,
+    cancel: CancellationToken | None,
+) -> Iterator[Section]:
+    """
+    Yield the sections of `raw` located at `bounds`, decoded by batches of
+    about `PROGRESS_INTERVAL` bytes. `progress` is called after every batch
+    and `cancel` checked before every section.
+    """
+    if not bounds:
+        return
+
+    n_batches = max((bounds[-1][1] - bounds[0][0]) // PROGRESS_INTERVAL, 1)
+    n_sections = n_shots = 0
+
+    for batch in chunk_section_offsets(bounds, n_chunks=n_batches):
+        for decoded in decode_sections(raw, batch, uncorrupt=uncorrupt):
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+
+            yield Section.from_decoded(decoded, validate=validate)
+            n_sections += 1
+            n_shots += len(decoded)
+
+        if progress is not None:
+            progress(Progress("decode", batch[-1][1], len(raw), n_sections, n_shots))
+
+
+def _build_sections(
+    raw: bytes | bytearray,
+    bounds: list[tuple[int, int]],
+    uncorrupt: bool,
+    validate: ValidationMode,
+    workers: int,
+    progress: ProgressCallback | None = None,
+    cancel: CancellationToken | None = None,
+) -> list[Section]:
+    """
+    Build the sections of `raw` located at `bounds`.
+
+    With `validate="full"` and several `workers`, runs of consecutive sections
+    are shipped as bytes to a process pool, which validates them while the
+    sections are built here without validation, in their original order. The
+    models themselves are never sent back: unpickling them costs as much as
+    validating them. The errors are raised in the order of the sections.
+
+    With a `progress` callback or a `cancel` token, the sections are decoded by
+    batches, see `_iter_built_sections`.
+    """
+    if validate != "full" or workers == 1 or len(bounds) < 2:
+        if progress is not None or cancel is not None:
+            return list(
+                _iter_built_sections(
+                    raw, bounds, uncorrupt, validate, progress=progress, cancel=cancel
+                )
+            )
+
+        return [
+            Section.from_decoded(decoded, validate=validate)
+            for decoded in decode_sections(raw, bounds, uncorrupt=uncorrupt)
+        ]
+
+    # More chunks than workers to balance the load
+    chunks = chunk_section_offsets(bounds, n_chunks=workers * 4)
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = []
+        for chunk in chunks:
+            offset, stop = chunk[0][0], chunk[-1][1]
+            futures.append(
+                executor.submit(
+                    _validate_sections,
+                    bytes(raw[offset:stop]),
+                    [(start - offset, end - offset) for start, end in chunk],
+                    uncorrupt,
+                )
+            )
+
+        try:
+            if progress is None and cancel is None:
+                sections = [
+                    Section.from_decoded(decoded, validate="none")
+                    for decoded in decode_sections(raw, bounds, uncorrupt=uncorrupt)
+                ]
+            else:
+                sections = list(
+                    _iter_built_sections(
+                        raw, bounds, uncorrupt, "none", progress=progress, cancel=cancel
+                    )
+                )
+
+            # Validation time left to the workers
+            with phase("validate"):
+                for future in futures:
+                    if cancel is not None:
+                        cancel.raise_if_cancelled()
+                    future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return sections
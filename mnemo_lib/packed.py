@@ -0,0 +1,220 @@
+"""
+Packed binary DMP format.
+
+The DMP text format spends 3 to 4 characters per signed byte and has to be
+tokenized on every read. A packed file stores the same signed bytes as is,
+after a small header and a table of section offsets, so that it can be
+memory-mapped and its sections decoded straight out of the mapped buffer:
+
+    header   `<8sHHI`   magic, format version, reserved, number of sections
+    offsets  `<{2n}Q`   `(start, end)` of every section in the data region
+    data     `b`        the DMP stream, `MN2OVER` trailer included
+
+The data region holds the complete DMP stream, so converting from and back to
+the text format is lossless.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mnemo_lib.decoder import decode_sections
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.writers import dmp_bytes_to_text
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+    from typing import BinaryIO
+    from typing import Self
+
+    from mnemo_lib.decoder import DecodedSection
+
+PACKED_MAGIC = b"MNEMOPK\x00"
+PACKED_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHI")
+
+# Text conversion is done by slices of the data region to bound memory usage
+_TEXT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def write_packed(
+    file: BinaryIO,
+    data: bytes | bytearray | memoryview,
+    bounds: Sequence[tuple[int, int]],
+) -> int:
+    """
+    Write a packed DMP file made of the DMP stream `data`, whose sections are
+    located at `bounds`. Returns the number of bytes written.
+    """
+    for start, end in bounds:
+        if not 0 <= start <= end <= len(data):
+            raise ValueError(f"Section bounds out of the data: `{(start, end)}`.")
+
+    offsets = array("Q", [offset for bound in bounds for offset in bound])
+    if sys.byteorder == "big":  # pragma: no cover
+        offsets.byteswap()
+
+    return (
+        file.write(_HEADER.pack(PACKED_MAGIC, PACKED_FORMAT_VERSION, 0, len(bounds)))
+        + file.write(offsets.tobytes())
+        + file.write(data)
+    )
+
+
+def write_packed_sections(
+    file: BinaryIO, sections: Sequence[bytes], trailer: bytes = b""
+) -> int:
+    """Write a packed DMP file from the encoded `sections`, followed by
+    `trailer`. Returns the number of bytes written."""
+    bounds: list[tuple[int, int]] = []
+    offset = 0
+    for section in sections:
+        bounds.append((offset, offset + len(section)))
+        offset += len(section)
+
+    return write_packed(file, b"".join([*sections, trailer]), bounds)
+
+
+def parse_packed(
+    buffer: bytes | bytearray | memoryview | mmap.mmap,
+) -> tuple[list[tuple[int, int]], memoryview]:
+    """
+    Parse the header and the offset table of a packed DMP file.
+
+    Returns the section bounds and a view over the data region of `buffer`.
+    """
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Invalid packed DMP file: truncated header.")
+
+    magic, format_version, _, n_sections = _HEADER.unpack_from(buffer)
+    if magic != PACKED_MAGIC:
+        raise ValueError("Invalid packed DMP file: wrong magic value.")
+
+    if format_version != PACKED_FORMAT_VERSION:
+        raise ValueError(f"Unsupported packed DMP format version: `{format_version}`.")
+
+    table = struct.Struct(f"<{2 * n_sections}Q")
+    data_start = _HEADER.size + table.size
+    if len(buffer) < data_start:
+        raise ValueError("Invalid packed DMP file: truncated offset table.")
+
+    offsets = table.unpack_from(buffer, _HEADER.size)
+    bounds = list(zip(offsets[0::2], offsets[1::2], strict=True))
+
+    data = memoryview(buffer)[data_start:]
+    if any(not 0 <= start <= end <= len(data) for start, end in bounds):
+        data.release()
+        raise ValueError("Invalid packed DMP file: section out of the data.")
+
+    return bounds, data
+
+
+def decode_packed(buffer: bytes | bytearray | memoryview) -> list[DecodedSection]:
+    """Decode every section of a packed DMP file held in memory."""
+    bounds, data = parse_packed(buffer)
+    with data:
+        return decode_sections(data, bounds)
+
+
+class PackedDMP:
+    """
+    Read-only, memory-mapped, packed DMP file.
+
+    `data` is a view over the mapped DMP stream: nothing is read from the disk
+    until it is accessed. The views must be released before `close`, which is
+    called when leaving the `with` block.
+    """
+
+    __slots__ = ("_file", "_mmap", "bounds", "data")
+
+    def __init__(self, filepath: str | Path) -> None:
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileNotFoundError(f"Impossible to find: `{filepath}`.")
+
+        self._file = filepath.open(mode="rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # empty file
+            self._file.close()
+            raise ValueError("Invalid packed DMP file: the file is empty.") from e
+
+        try:
+            self.bounds, self.data = parse_packed(self._mmap)
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        """Return the number of sections."""
+        return len(self.bounds)
+
+    @property
+    def version(self) -> int | None:
+        """DMP version of the first section, `None` without sections."""
+        if not self.bounds:
+            return None
+        return struct.unpack_from(">b", self.data, self.bounds[0][0])[0]
+
+    def decode(self, uncorrupt: bool = False) -> list[DecodedSection]:
+        """Decode every section straight out of the mapped buffer."""
+        return decode_sections(self.data, self.bounds, uncorrupt=uncorrupt)
+
+    def close(self) -> None:
+        if (data := getattr(self, "data", None)) is not None:
+            data.release()
+
+        # Views might still be referenced, e.g. by the traceback of a decoding
+        # error: the file is then unmapped once they are garbage collected
+        with contextlib.suppress(BufferError):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# ========================== Text conversion ========================== #
+
+
+def pack_dmp_file(input_file: str | Path, output_file: str | Path) -> int:
+    """Convert a DMP text file to the packed format. Returns the number of
+    sections."""
+    data = read_dmp_file(input_file).tobytes()
+    bounds = find_section_offsets(data)
+
+    with Path(output_file).open(mode="wb") as file:
+        write_packed(file, data, bounds)
+
+    return len(bounds)
+
+
+def unpack_dmp_file(input_file: str | Path, output_file: str | Path) -> int:
+    """Convert a packed DMP file back to the text format. Returns the number of
+    sections."""
+    with PackedDMP(input_file) as packed, Path(output_file).open(mode="wb") as file:
+        data = packed.data
+        for offset in range(0, len(data), _TEXT_CHUNK_SIZE):
+            with data[offset : offset + _TEXT_CHUNK_SIZE] as chunk:
+                file.write(dmp_bytes_to_text(chunk))
+
+        return len(packed)
@@ -0,0 +1,201 @@
+"""
+Phase-level profiling of the decoding and encoding pipeline.
+
+The pipeline is instrumented with `phase(name)` blocks: `read`, `tokenize`,
+`split`, `decode`, `validate`, `correct` and `serialize`. They are only timed
+inside a `profile()` block; otherwise `phase` returns a shared no-op context
+manager, which costs one function call.
+
+    with profile() as profiler:
+        DMPFile.from_dmp("survey.dmp").to_json("survey.json")
+    print(profiler.format())
+
+The time of a phase excludes the phases nested in it: e.g. the `read` of the
+chunks of a file is not counted in its `tokenize`. Phases run by worker
+processes are not recorded, only the time spent waiting for them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import Self
+
+# Profiler of the current `profile()` block, `None` outside of one
+_active: Profiler | None = None
+
+
+class PhaseStats:
+    """Cumulated time and throughput of one phase."""
+
+    __slots__ = ("calls", "n_bytes", "n_shots", "name", "seconds")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.n_bytes = 0
+        self.n_shots = 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.n_bytes / self.seconds if self.seconds else 0.0
+
+    @property
+    def shots_per_second(self) -> float:
+        return self.n_shots / self.seconds if self.seconds else 0.0
+
+
+class _NullPhase:
+    """Phase outside of a `profile()` block: nothing is measured."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def add(self, n_bytes: int = 0, n_shots: int = 0) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("_children", "_profiler", "_start", "n_bytes", "n_shots", "name")
+
+    def __init__(
+        self, profiler: Profiler, name: str, n_bytes: int, n_shots: int
+    ) -> None:
+        self._profiler = profiler
+        self.name = name
+        self.n_bytes = n_bytes
+        self.n_shots = n_shots
+        self._children = 0.0  # seconds spent in the nested phases
+        self._start = 0.0
+
+    def __enter__(self) -> Self:
+        self._profiler._stack().append(self)  # noqa: SLF001
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter() - self._start
+
+        stack = self._profiler._stack()  # noqa: SLF001
+        stack.pop()
+        if stack:
+            stack[-1]._children += elapsed  # noqa: SLF001
+
+        self._profiler.record(
+            self.name, elapsed - self._children, self.n_bytes, self.n_shots
+        )
+
+    def add(self, n_bytes: int = 0, n_shots: int = 0) -> None:
+        """Count data processed by the phase, once known."""
+        self.n_bytes += n_bytes
+        self.n_shots += n_shots
+
+
+class Profiler:
+    """Statistics of every phase run within a `profile()` block."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        self.elapsed = 0.0  # wall time of the `profile()` block
+        self._lock = threading.Lock()
+        # Phases are nested per thread
+        self._local = threading.local()
+
+    def _stack(self) -> list[_Phase]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def record(
+        self, name: str, seconds: float, n_bytes: int = 0, n_shots: int = 0
+    ) -> None:
+        with self._lock:
+            if (stats := self.phases.get(name)) is None:
+                stats = self.phases[name] = PhaseStats(name)
+
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.n_bytes += n_bytes
+            stats.n_shots += n_shots
+
+    def format(self) -> str:
+        """Table of the phases, in order of first use."""
+        lines = [
+            f"{'phase':<10} {'calls':>8} {'seconds':>9} {'share':>6} "
+            f"{'MB/s':>9} {'shots/s':>11}"
+        ]
+        for stats in self.phases.values():
+            share = stats.seconds / self.elapsed if self.elapsed else 0.0
+            mb_per_second = (
+                f"{stats.bytes_per_second / 1e6:.2f}" if stats.n_bytes else "-"
+            )
+            shots_per_second = (
+                f"{stats.shots_per_second:,.0f}" if stats.n_shots else "-"
+            )
+            lines.append(
+                f"{stats.name:<10} {stats.calls:>8} {stats.seconds:>9.3f} "
+                f"{share:>6.1%} {mb_per_second:>9} {shots_per_second:>11}"
+            )
+
+        other = self.elapsed - sum(stats.seconds for stats in self.phases.values())
+        lines.append(f"{'other':<10} {'':>8} {max(other, 0.0):>9.3f}")
+        lines.append(f"{'total':<10} {'':>8} {self.elapsed:>9.3f}")
+        return "\n".join(lines)
+
+
+def phase(name: str, n_bytes: int = 0, n_shots: int = 0) -> _Phase | _NullPhase:
+    """
+    Context manager timing the block as the phase `name`, when profiling.
+
+    `n_bytes` and `n_shots` are the data processed by the block, used for the
+    throughputs. They can also be counted once known, with `add`.
+    """
+    if _active is None:
+        return _NULL_PHASE
+    return _Phase(_active, name, n_bytes, n_shots)
+
+
+@contextlib.contextmanager
+def profile(pstats_file: str | Path | None = None) -> Iterator[Profiler]:
+    """
+    Record the phases run within the block. With `pstats_file`, the block is
+    also profiled with `cProfile` and the statistics are dumped to that file,
+    see `pstats.Stats`.
+    """
+    global _active  # noqa: PLW0603
+
+    profiler = Profiler()
+    previous, _active = _active, profiler
+
+    c_profile = cProfile.Profile() if pstats_file is not None else None
+    start = time.perf_counter()
+    try:
+        if c_profile is not None:
+            c_profile.enable()
+        yield profiler
+    finally:
+        if c_profile is not None:
+            c_profile.disable()
+        profiler.elapsed = time.perf_counter() - start
+        _active = previous
+
+        if c_profile is not None:
+            c_profile.dump_stats(pstats_file)
@@ -0,0 +1,64 @@
+"""
+Progress reporting and cancellation of long decodes.
+
+`DMPFile.from_dmp` and `DMPFile.from_dmp_data` accept a `progress` callback and
+a `cancel` token. The callback is called after every chunk of the file read,
+about every `PROGRESS_INTERVAL` bytes of the packed stream split and decoded,
+and once at the end of every stage. The token is checked before every chunk
+and every section: `cancel()`, from any thread, makes the decoding raise
+`DecodingCancelledError`. Nothing decoded so far is kept: the memory is
+released as soon as the error is handled.
+
+Without callback nor token, the decoding runs unchanged.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import NamedTuple
+
+# Packed bytes split or decoded between two calls of the progress callback
+PROGRESS_INTERVAL = 1 << 18  # 256 KiB
+
+
+class Progress(NamedTuple):
+    # `read`: tokenizing the file, `split`: locating the sections in the packed
+    # stream, `decode`: decoding and validating the sections
+    stage: str
+    n_bytes: int  # bytes of the stage processed so far
+    total_bytes: int  # bytes to process in the stage
+    n_sections: int  # sections located (`split`) or decoded (`decode`) so far
+    n_shots: int  # shots decoded so far
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the stage done, in [0, 1]."""
+        return self.n_bytes / self.total_bytes if self.total_bytes else 1.0
+
+
+ProgressCallback = Callable[[Progress], None]
+
+
+class DecodingCancelledError(Exception):
+    """A decoding was cancelled with its `CancellationToken`."""
+
+
+class CancellationToken:
+    """Thread-safe flag cancelling the decodings it is passed to."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise DecodingCancelledError("The decoding was cancelled.")
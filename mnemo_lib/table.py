@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Literal
+from typing import overload
+
+import orjson
+
+from mnemo_lib import arrow
+from mnemo_lib.codecs import SHOT_END_MAGIC
+from mnemo_lib.codecs import SHOT_FIELD_SCALES
+from mnemo_lib.codecs import SHOT_FIELDS
+from mnemo_lib.codecs import SHOT_START_MAGIC
+from mnemo_lib.codecs import get_codec
+from mnemo_lib.codecs import int16be_words
+from mnemo_lib.constants import MN2OVER
+from mnemo_lib.constants import ShotType
+from mnemo_lib.constants import SurveyDirection
+from mnemo_lib.corrections import Corrections
+from mnemo_lib.corrections import column_transforms
+from mnemo_lib.decoder import decode_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.models import Section
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.writers import dmp_bytes_to_text
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterable
+    from typing import Self
+
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+    from mnemo_lib.decoder import DecodedSection
+
+# Int16BE fields are stored as `h`, single byte fields as `b`
+SHOT_FIELD_TYPECODES = {
+    field: "h" if field in SHOT_FIELD_SCALES else "b" for field in SHOT_FIELDS
+}
+
+# `Shot` clamps these values to 0 on validation
+_POSITIVE_FIELDS = ("length", "depth_in", "depth_out")
+
+# JSON of the sections and shots, formatted as `orjson` does with
+# `OPT_INDENT_2 | OPT_SORT_KEYS` for the items of the root list
+_JSON_SHOT_FIELDS = sorted(SHOT_FIELDS)
+_JSON_SHOT_TEMPLATE = (
+    b"      {\n"
+    + b",\n".join(b'        "%s": %%b' % field.encode() for field in _JSON_SHOT_FIELDS)
+    + b"\n      }"
+)
+_JSON_SECTION_TEMPLATE = (
+    b'  {\n    "date": %b,\n    "direction": %b,\n    "name": %b,\n'
+    b'    "shots": %b,\n    "version": %d\n  }'
+)
+_SHOT_TYPE_TOKENS = {
+    member.value: b'"%s"' % member.name.encode() for member in ShotType
+}
+
+
+class ShotTable:
+    """
+    Columnar storage of shots: one contiguous `array` per `Shot` field.
+
+    Values are kept in device units (see `codecs.SHOT_FIELD_SCALES`). Fields
+    absent from the DMP version of a shot are stored as `0`.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: dict[str, array[int]] | None = None) -> None:
+        if columns is None:
+            columns = {
+                field: array(typecode)
+                for field, typecode in SHOT_FIELD_TYPECODES.items()
+            }
+
+        if set(columns) != set(SHOT_FIELDS):
+            raise ValueError(f"Expected one column per shot field: {SHOT_FIELDS}")
+
+        if len({len(values) for values in columns.values()}) != 1:
+            raise ValueError("All the columns must have the same length.")
+
+        self.columns = columns
+
+    def __len__(self) -> int:
+        """Return the number of shots."""
+        return len(self.columns["type"])
+
+    def column(self, field: str, start: int = 0, stop: int | None = None) -> list[Any]:
+        """Return the values of `field` in physical units."""
+        raw = self.columns[field][start:stop]
+        if (scale := SHOT_FIELD_SCALES.get(field)) is None:
+            return raw.tolist()
+        return [value / scale for value in raw]
+
+    def _apply_corrections(self, corrections: Corrections) -> None:
+        """Apply `corrections` to every shot, see `corrections.column_transforms`."""
+        for field, transform in column_transforms(corrections).items():
+            scale = SHOT_FIELD_SCALES[field]
+            values = transform([value / scale for value in self.columns[field]])
+            try:
+                self.columns[field] = array(
+                    "h", [round(value * scale) for value in values]
+                )
+            except OverflowError as e:
+                raise ValueError(f"`{field}` out of the Int16BE range.") from e
+
+    # ======================== Corrections ======================== #
+    # Same transforms than `corrections.apply_corrections` and `mnemo correct`
+
+    def scale_length(self, factor: float) -> None:
+        """Apply a post-survey recalibration scaling factor to the lengths."""
+        self._apply_corrections(Corrections(length_scaling=factor))
+
+    def offset_compass(self, offset: float) -> None:
+        """Apply a post-survey recalibration compass offset."""
+        self._apply_corrections(Corrections(compass_offset=offset))
+
+    def offset_depth(self, offset: float) -> None:
+        """Apply a post-survey depth offset, `offset > 0` => deeper."""
+        self._apply_corrections(Corrections(depth_offset=offset))
+
+    def reverse_azimuth(self) -> None:
+        """Take the reciprocal azimuth to turn a survey IN/OUT into OUT/IN."""
+        self._apply_corrections(Corrections(reverse_azimuth=True))
+
+
+class SectionTable:
+    """
+    Columnar storage of a DMP file.
+
+    Section `i` owns the shots `offsets[i]:offsets[i + 1]` of `shots`.
+    """
+
+    __slots__ = ("dates", "directions", "names", "offsets", "shots", "versions")
+
+    def __init__(self) -> None:
+        self.versions: array[int] = array("b")
+        self.dates: list[datetime.datetime] = []
+        self.names: list[str] = []
+        self.directions: array[int] = array("b")
+        self.offsets: array[int] = array("q", [0])
+        self.shots = ShotTable()
+
+    def __len__(self) -> int:
+        """Return the number of sections."""
+        return len(self.versions)
+
+    def _append_section(
+        self,
+        version: int,
+        date: datetime.datetime,
+        name: str,
+        direction: SurveyDirection,
+        n_shots: int,
+    ) -> None:
+        self.versions.append(version)
+        self.dates.append(date)
+        self.names.append(name)
+        self.directions.append(direction.value)
+        self.offsets.append(self.offsets[-1] + n_shots)
+
+    # ========================= Builders ========================= #
+
+    @classmethod
+    def from_decoded(
+        cls, decoded_sections: Iterable[DecodedSection], validate: bool = False
+    ) -> Self:
+        """
+        Gather `decoded_sections` in a table. With `validate`, every section is
+        checked first by the `Section` model, raising the same errors as
+        `DMPFile.from_dmp`; no model is kept.
+        """
+        table = cls()
+
+        for decoded in decoded_sections:
+            if validate:
+                Section.from_decoded(decoded, validate="full")
+
+            n_shots = len(decoded)
+            columns = decoded.columns
+            for field, values in table.shots.columns.items():
+                if (section_values := columns.get(field)) is None:
+                    values.extend(array(values.typecode, [0]) * n_shots)
+                elif field in _POSITIVE_FIELDS and min(section_values, default=0) < 0:
+                    values.extend(array("h", [max(0, v) for v in section_values]))
+                else:
+                    values.extend(section_values)
+
+            table._append_section(
+                version=decoded.version,
+                date=decoded.date,
+                name=decoded.name,
+                direction=decoded.direction,
+                n_shots=n_shots,
+            )
+
+        return table
+
+    @classmethod
+    def from_dmp_data(
+        cls, dmp_data: list[int] | array[int] | bytes, validate: bool = False
+    ) -> Self:
+        return cls.from_decoded(decode_dmp(dmp_data), validate=validate)
+
+    @classmethod
+    def from_dmp(cls, filepath: Path | str, validate: bool = False) -> Self:
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if not filepath.exists():
+            raise FileNotFoundError
+
+        return cls.from_dmp_data(read_dmp_file(filepath), validate=validate)
+
+    @classmethod
+    def from_dmpfile(cls, dmp_file: DMPFile) -> Self:
+        table = cls()
+
+        for section in dmp_file.sections:
+            for field, values in table.shots.columns.items():
+                raw = [getattr(shot, field) or 0 for shot in section.shots]
+                if (scale := SHOT_FIELD_SCALES.get(field)) is not None:
+                    raw = [round(value * scale) for value in raw]
+                values.extend(array(values.typecode, raw))
+
+            table._append_section(
+                version=section.version,
+                date=section.date,
+                name=section.name,
+                direction=section.direction,
+                n_shots=len(section.shots),
+            )
+
+        return table
+
+    # ========================= Exports ========================== #
+
+    def _section_data(self, idx: int) -> dict[str, Any]:
+        """Data of section `idx` as expected by `Section.model_validate`."""
+        start, stop = self.offsets[idx], self.offsets[idx + 1]
+        version = self.versions[idx]
+        columns = get_codec(version).fields
+
+        shot_columns = {
+            field: self.shots.column(field, start, stop)
+            if field in columns
+            else [None] * (stop - start)
+            for field in SHOT_FIELDS
+        }
+        shot_columns["type"] = [ShotType(value) for value in shot_columns["type"]]
+
+        return {
+            "date": self.dates[idx],
+            "direction": SurveyDirection(self.directions[idx]),
+            "name": self.names[idx],
+            "shots": [
+                dict(zip(shot_columns.keys(), values, strict=True))
+                for values in zip(*shot_columns.values(), strict=True)
+            ],
+            "version": version,
+        }
+
+    def to_dmpfile(self) -> DMPFile:
+        return DMPFile.model_validate(
+            [self._section_data(idx) for idx in range(len(self))]
+        )
+
+    def _section_json(self, idx: int) -> bytes:
+        """
+        Section `idx` as serialized by `DMPFile.to_json`, indented as an item of
+        the root list. Every field is serialized in one call for all the shots,
+        then the shots are formatted from the columns of values.
+        """
+        start, stop = self.offsets[idx], self.offsets[idx + 1]
+        columns = get_codec(self.versions[idx]).fields
+
+        tokens: list[list[bytes]] = []
+        for field in _JSON_SHOT_FIELDS:
+            if field == "type":
+                try:
+                    values = [
+                        _SHOT_TYPE_TOKENS[value]
+                        for value in self.shots.columns["type"][start:stop]
+                    ]
+                except KeyError as e:
+                    raise ValueError(f"{e.args[0]} is not a valid ShotType") from e
+                tokens.append(values)
+            elif field in columns:
+                # `[v1,v2,...]`: numbers and nulls never contain a comma
+                values = orjson.dumps(self.shots.column(field, start, stop))[1:-1]
+                tokens.append(values.split(b",") if values else [])
+            else:
+                tokens.append([b"null"] * (stop - start))
+
+        shots = b",\n".join(
+            _JSON_SHOT_TEMPLATE % row for row in zip(*tokens, strict=True)
+        )
+        return _JSON_SECTION_TEMPLATE % (
+            orjson.dumps(self.dates[idx].strftime("%Y-%m-%d %H:%M")),
+            orjson.dumps(SurveyDirection(self.directions[idx]).name),
+            orjson.dumps(self.names[idx]),
+            b"[\n%b\n    ]" % shots if shots else b"[]",
+            self.versions[idx],
+        )
+
+    def to_json(self, filepath: str | Path | None = None) -> str:
+        """
+        Serialize the table in JSON, identically to `DMPFile.to_json`, without
+        creating any model nor per-shot dictionary.
+
+        Also written to `filepath` if provided.
+        """
+        if len(self):
+            sections = b",\n".join(self._section_json(idx) for idx in range(len(self)))
+            data = b"[\n%b\n]" % sections
+        else:
+            data = b"[]"
+
+        if filepath is not None:
+            if not isinstance(filepath, Path):
+                filepath = Path(filepath)
+
+            filepath.write_bytes(data)
+
+        return data.decode("utf-8")
+
+    def _encode_section(self, idx: int) -> bytes:
+        version = self.versions[idx]
+        date = self.dates[idx]
+        codec = get_codec(version)
+
+        # =================== DMP HEADER =================== #
+        header = codec.encode_header(
+            [
+                version,
+                date.year % 100,
+                date.month,
+                date.day,
+                date.hour,
+                date.minute,
+                *(ord(char) for char in self.names[idx]),
+                self.directions[idx],
+            ]
+        )
+
+        # ================== SHOT FRAMES =================== #
+        # Every field is written with a strided assignment over all the frames.
+        start, stop = self.offsets[idx], self.offsets[idx + 1]
+        n_shots = stop - start
+        frame_size = codec.frame.size
+        frames = bytearray(n_shots * frame_size)
+
+        def write(offset: int, data: bytes) -> int:
+            frames[offset::frame_size] = data
+            return offset + 1
+
+        cursor = 0
+        if codec.shot_magic:
+            for magic in SHOT_START_MAGIC:
+                cursor = write(cursor, bytes([magic]) * n_shots)
+
+        for field in codec.fields:
+            values = self.shots.columns[field][start:stop]
+            if field in SHOT_FIELD_SCALES:
+                if min(values, default=0) < 0:
+                    values = int16be_words(values)
+                words = struct.pack(f">{n_shots}h", *values)
+                cursor = write(cursor, words[0::2])
+                cursor = write(cursor, words[1::2])
+            else:
+                cursor = write(cursor, values.tobytes())
+
+        if codec.shot_magic:
+            for magic in SHOT_END_MAGIC:
+                cursor = write(cursor, bytes([magic]) * n_shots)
+
+        return header + frames
+
+    def to_dmp_bytes(self) -> bytes:
+        """Encode the table as packed signed bytes."""
+        data = b"".join(self._encode_section(idx) for idx in range(len(self)))
+
+        if self.versions and self.versions[0] > 2:
+            # adding `MN2OVER` message at the end
+            data += bytes(MN2OVER)
+
+        return data
+
+    @overload
+    def to_dmp(self, filepath: None = None, return_data: bool = ...) -> list[int]: ...
+
+    @overload
+    def to_dmp(
+        self, filepath: str | Path, return_data: Literal[False] = ...
+    ) -> None: ...
+
+    @overload
+    def to_dmp(self, filepath: str | Path, return_data: Literal[True]) -> list[int]: ...
+
+    def to_dmp(
+        self, filepath: str | Path | None = None, return_data: bool = False
+    ) -> list[int] | None:
+        """
+        Encode the table in the DMP format, like `DMPFile.to_dmp`.
+
+        With a `filepath`, the sections are streamed to the file one at a time
+        and the encoded values are only returned if `return_data=True`.
+        """
+        if filepath is None:
+            return array("b", self.to_dmp_bytes()).tolist()
+
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        with filepath.open(mode="wb") as file:
+            for idx in range(len(self)):
+                file.write(dmp_bytes_to_text(self._encode_section(idx)))
+
+            if self.versions and self.versions[0] > 2:
+                # adding `MN2OVER` message at the end
+                file.write(dmp_bytes_to_text(bytes(MN2OVER)))
+
+        return array("b", self.to_dmp_bytes()).tolist() if return_data else None
+
+    # ====================== Arrow / DataFrames ====================== #
+    # Optional dependencies: `pip install mnemo_lib[arrow]`, see `mnemo_lib.arrow`
+
+    def to_arrow(self) -> pa.Table:
+        return arrow.to_arrow(self)
+
+    def to_pandas(self) -> pd.DataFrame:
+        return arrow.to_pandas(self)
+
+    def to_polars(self) -> pl.DataFrame:
+        return arrow.to_polars(self)
+
+    def to_parquet(self, filepath: str | Path) -> int:
+        return arrow.write_parquet(self, filepath)
+
+    # ======================== Corrections ======================== #
+
+    def set_date(self, date: datetime.date) -> None:
+        """Replace the day of every section, keeping the time of the day."""
+        self.dates = [
+            section_date.replace(year=date.year, month=date.month, day=date.day)
+            for section_date in self.dates
+        ]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import operator
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mnemo_lib.profiling import phase
+from mnemo_lib.progress import Progress
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import BinaryIO
+
+    from mnemo_lib.progress import CancellationToken
+    from mnemo_lib.progress import ProgressCallback
+
+# Every valid DMP token: signed bytes in [-128, 127]
+_TOKEN_VALUES: dict[bytes, int] = {str(i).encode(): i for i in range(-128, 128)}
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def _parse_token(token: bytes, offset: int) -> int | None:
+    """Slow path: tokens with whitespaces, leading zeros, etc. `None` if empty."""
+    if not (stripped := token.strip()):
+        return None
+
+    try:
+        value = int(stripped)
+    except ValueError:
+        value = None
+
+    if value is None or not -128 <= value <= 127:
+        raise ValueError(
+            f"Malformed DMP token {token!r} at byte offset {offset}: "
+            "expected an integer in [-128, 127]."
+        )
+
+    return value
+
+
+def _tokenize(raw: bytes, offset: int = 0) -> array[int]:
+    """Parse `;` separated signed bytes. `offset` is the position of `raw` in the
+    file and is only used for error reporting."""
+    tokens = raw.split(b";")
+
+    try:
+        # Fast path: all the dictionary lookups are done in a single C call
+        values = operator.itemgetter(*tokens)(_TOKEN_VALUES)
+        return array("b", values if len(tokens) > 1 else [values])
+    except KeyError:
+        pass
+
+    values = array("b")
+    for token in tokens:
+        if (value := _TOKEN_VALUES.get(token)) is None:
+            value = _parse_token(token, offset)
+
+        if value is not None:
+            values.append(value)
+
+        offset += len(token) + 1
+
+    return values
+
+
+def iter_dmp_chunks(
+    file: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[array[int]]:
+    """
+    Read and tokenize a DMP file by chunks of about `chunk_size` bytes.
+
+    A token cut by the end of a chunk is carried over to the next one.
+    """
+    offset = 0  # position of `pending` in the file
+    pending = b""
+    file_start = True
+
+    while True:
+        with phase("read") as read_phase:
+            chunk = file.read(chunk_size)
+            read_phase.add(n_bytes=len(chunk))
+        if not chunk:
+            break
+
+        data = pending + chunk
+
+        if file_start:
+            stripped = data.lstrip()
+            offset += len(data) - len(stripped)
+            if not (data := stripped):
+                continue
+            file_start = False
+
+        if (split_at := data.rfind(b";")) == -1:
+            pending = data
+            continue
+
+        with phase("tokenize", n_bytes=split_at):
+            values = _tokenize(data[:split_at], offset)
+        yield values
+
+        offset += split_at + 1
+        pending = data[split_at + 1 :]
+
+    if pending := pending.rstrip():
+        with phase("tokenize", n_bytes=len(pending)):
+            values = _tokenize(pending, offset)
+        yield values
+
+
+def tokenize_dmp(raw: bytes) -> array[int]:
+    """
+    Parse the content of a DMP file into a compact array of signed bytes.
+
+    Equivalent to `[int(i) for i in raw.strip().split(";") if i != ""]`.
+    """
+    # Same parsing as a single chunk of `iter_dmp_chunks`, minus its `read`
+    stripped = raw.lstrip()
+    offset = len(raw) - len(stripped)
+
+    data = array("b")
+    with phase("tokenize", n_bytes=len(stripped)):
+        if (split_at := stripped.rfind(b";")) != -1:
+            data = _tokenize(stripped[:split_at], offset)
+            offset += split_at + 1
+            stripped = stripped[split_at + 1 :]
+
+        if stripped := stripped.rstrip():
+            data.extend(_tokenize(stripped, offset))
+    return data
+
+
+def read_dmp_file(
+    filepath: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+    cancel: CancellationToken | None = None,
+) -> array[int]:
+    """
+    Read a DMP file into a compact array of signed bytes.
+
+    `progress` is called after every chunk and `cancel` checked before every
+    chunk, see `mnemo_lib.progress`.
+    """
+    if not isinstance(filepath, Path):
+        filepath = Path(filepath)
+
+    data = array("b")
+    with filepath.open(mode="rb") as file:
+        if progress is None and cancel is None:
+            for values in iter_dmp_chunks(file, chunk_size=chunk_size):
+                data.extend(values)
+            return data
+
+        total_bytes = filepath.stat().st_size
+        for values in iter_dmp_chunks(file, chunk_size=chunk_size):
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            data.extend(values)
+            if progress is not None:
+                progress(Progress("read", file.tell(), total_bytes, 0, 0))
+
+    return data
@@ -1,49 +1,130 @@
 from __future__ import annotations
 
+import re
+from array import array
 from typing import TYPE_CHECKING
 
+from mnemo_lib.profiling import phase
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
-def split_dmp_into_sections(data: list[int]) -> Iterator[list[int]]:
-    dmp_version = data[0]
-    match dmp_version:
-        case 2:
-            end_seq_patterns = [
-                [3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            ]
-        case 5:
-            end_seq_patterns = [
-                [57, 67, 77, 3] + [0] * 28 + [95, 25, 35],  # normal end sequence
-                [57, 67, 77, 3, 7, 8, 7, 8]
-                + [0] * 24
-                + [95, 25, 35],  # buggy end sequence - sometimes legal
-            ]
-        case _:
-            raise ValueError(f"Unsupported Mnemo Version: {dmp_version}")
-
-    len_end_seq = len(end_seq_patterns[0])
-    assert all(len(seq) == len_end_seq for seq in end_seq_patterns)
+# End of survey sequences, per DMP version
+EOS_SEQUENCES: dict[int, list[list[int]]] = {
+    2: [
+        [3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    ],
+    5: [
+        [57, 67, 77, 3] + [0] * 28 + [95, 25, 35],  # normal end sequence
+        [57, 67, 77, 3, 7, 8, 7, 8]
+        + [0] * 24
+        + [95, 25, 35],  # buggy end sequence - sometimes legal
+    ],
+}
+
+# All the end sequences of a version matched at once on the packed signed bytes
+_EOS_REGEXES: dict[int, re.Pattern[bytes]] = {
+    version: re.compile(
+        b"|".join(re.escape(array("b", seq).tobytes()) for seq in sequences)
+    )
+    for version, sequences in EOS_SEQUENCES.items()
+}
+
+
+def get_eos_regex(dmp_version: int) -> re.Pattern[bytes]:
+    """Regex matching the end of survey sequences of `dmp_version` on packed
+    signed bytes."""
+    if (regex := _EOS_REGEXES.get(dmp_version)) is None:
+        raise ValueError(f"Unsupported Mnemo Version: {dmp_version}")
+    return regex
+
+
+def pack_dmp_data(
+    data: list[int] | array[int] | bytes | bytearray,
+) -> bytes | bytearray:
+    """Pack a DMP stream into signed bytes. Already packed data is returned as is."""
+    if isinstance(data, bytes | bytearray):
+        return data
+
+    if isinstance(data, array) and data.typecode == "b":
+        return data.tobytes()
+
+    try:
+        return array("b", data).tobytes()
+    except OverflowError as e:
+        raise ValueError("DMP values must be signed bytes in [-128, 127].") from e
+
+
+def iter_section_offsets(
+    data: list[int] | array[int] | bytes | bytearray,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield the `(start, end)` offsets of every section of a DMP stream.
+
+    The end of survey sequences are searched in a single pass over the packed
+    signed bytes. Data after the last end of survey sequence is ignored.
+    """
+    raw = pack_dmp_data(data)
+    dmp_version = raw[0] - 256 if raw[0] > 127 else raw[0]
+
+    start = 0
+    for match in get_eos_regex(dmp_version).finditer(raw):
+        yield start, match.end()
+        start = match.end()
+
+
+def find_section_offsets(
+    data: list[int] | array[int] | bytes | bytearray,
+) -> list[tuple[int, int]]:
+    """Return the `(start, end)` offsets of every section of a DMP stream."""
+    with phase("split", n_bytes=len(data)):
+        return list(iter_section_offsets(data))
+
+
+def chunk_section_offsets(
+    bounds: list[tuple[int, int]], n_chunks: int
+) -> list[list[tuple[int, int]]]:
+    """Split `bounds` into at most `n_chunks` runs of consecutive sections of
+    about the same size in bytes."""
+    total = sum(end - start for start, end in bounds)
+    chunks: list[list[tuple[int, int]]] = []
+    chunk: list[tuple[int, int]] = []
+    size = 0
+
+    for start, end in bounds:
+        chunk.append((start, end))
+        size += end - start
+        if size * n_chunks >= total * (len(chunks) + 1):
+            chunks.append(chunk)
+            chunk = []
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
 
-    start_seq_idx = 0
 
-    for current_idx in range(len(data) - len_end_seq + 1):
-        window = data[current_idx : current_idx + len_end_seq]
+def split_dmp_into_sections(data: list[int]) -> Iterator[list[int]]:
+    for start, end in iter_section_offsets(data):
+        yield data[start:end]
 
-        # new start sequence is found
-        if any(window == end_seq_pattern for end_seq_pattern in end_seq_patterns):
-            end_of_sequence_idx = current_idx + len_end_seq
 
-            # return the found section
-            yield data[start_seq_idx:end_of_sequence_idx]
+# Beginning of a version 5 section: version + section start magic values
+_V5_SECTION_START = bytes([5, 68, 89, 101])
 
-            # move the start index to the nex sequence
-            start_seq_idx = end_of_sequence_idx
 
+def iter_recovery_offsets(
+    data: list[int] | array[int] | bytes | bytearray,
+) -> Iterator[tuple[int, int]]:
+    """
+    Yield `(start, end)` offsets of the sections of a possibly corrupted stream.
 
-def try_split_dmp_in_sections(data_arr: list[int]) -> Iterator[list[int]]:
-    dmp_version = data_arr[0]
+    A new section starts at every section start sequence, located with
+    `bytes.find`. The end of survey sequences are not required.
+    """
+    raw = pack_dmp_data(data)
+    dmp_version = raw[0] - 256 if raw[0] > 127 else raw[0]
     match dmp_version:
         case 2:
             raise NotImplementedError
@@ -52,17 +133,26 @@ def try_split_dmp_in_sections(data_arr: list[int]) -> Iterator[list[int]]:
         case _:
             raise ValueError(f"Unsupported Mnemo Version: {dmp_version}")
 
-    buff: list[int] = []
-    for idx in range(len(data_arr)):
-        if buff and data_arr[idx : idx + 4] == [5, 68, 89, 101]:
-            yield buff
-            # Reset buffer
-            buff = []
+    start = 0
+    while (idx := raw.find(_V5_SECTION_START, start + 1)) != -1:
+        yield start, idx
+        start = idx
+
+    yield start, len(raw)
 
-        buff.append(data_arr[idx])
 
-    if buff:
-        yield buff
+def find_recovery_offsets(
+    data: list[int] | array[int] | bytes | bytearray,
+) -> list[tuple[int, int]]:
+    """Return `(start, end)` offsets of the sections of a possibly corrupted
+    stream, see `iter_recovery_offsets`."""
+    with phase("split", n_bytes=len(data)):
+        return list(iter_recovery_offsets(data))
+
+
+def try_split_dmp_in_sections(data_arr: list[int]) -> Iterator[list[int]]:
+    for start, end in iter_recovery_offsets(data_arr):
+        yield data_arr[start:end]
 
 
 def convert_to_Int16BE(value: float) -> tuple[int, int]:  # noqa: N802
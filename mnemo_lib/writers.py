@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import orjson
+
+from mnemo_lib.constants import MN2OVER
+from mnemo_lib.profiling import phase
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import BinaryIO
+
+    from mnemo_lib.models import Section
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+
+# `b"<value>;"` for every unsigned byte, as written in a DMP file
+_DMP_TOKENS = [f"{i - 256 if i > 127 else i};".encode() for i in range(256)]
+
+
+def dmp_bytes_to_text(raw: bytes) -> bytes:
+    """Format packed signed bytes in the `;` separated DMP text format."""
+    return b"".join(map(_DMP_TOKENS.__getitem__, raw))
+
+
+def write_json(sections: Iterable[Section], file: BinaryIO) -> int:
+    """
+    Serialize `sections` to `file` one section at a time.
+
+    The output is identical to `DMPFile.to_json`. Returns the number of sections
+    written.
+    """
+    count = 0
+
+    for section in sections:
+        with phase("serialize", n_shots=len(section.shots)) as serialize_phase:
+            section_json = orjson.dumps(
+                section.model_dump(), None, option=_JSON_OPTIONS
+            )
+
+            # Indent the section one level deeper, as an item of the root list
+            file.write(b",\n  " if count else b"[\n  ")
+            serialize_phase.add(
+                n_bytes=file.write(section_json.replace(b"\n", b"\n  "))
+            )
+        count += 1
+
+    file.write(b"\n]" if count else b"[]")
+    return count
+
+
+def write_ndjson(sections: Iterable[Section], file: BinaryIO) -> int:
+    """
+    Serialize `sections` to `file` as JSON Lines: one shot per line.
+
+    Each line holds the shot fields, its index in the section (`shot_idx`) and
+    the context of its section: `section_idx`, `date`, `direction`, `name` and
+    `version`. Returns the number of lines written.
+    """
+    count = 0
+
+    for section_idx, section in enumerate(sections):
+        context = {
+            "section_idx": section_idx,
+            **section.model_dump(exclude={"shots"}),
+        }
+
+        with phase("serialize", n_shots=len(section.shots)):
+            file.writelines(
+                orjson.dumps(
+                    {**context, "shot_idx": shot_idx, **shot.model_dump()},
+                    None,
+                    option=orjson.OPT_APPEND_NEWLINE,
+                )
+                for shot_idx, shot in enumerate(section.shots)
+            )
+        count += len(section.shots)
+
+    return count
+
+
+def write_dmp(sections: Iterable[Section], file: BinaryIO) -> int:
+    """
+    Encode `sections` to `file` one section at a time.
+
+    The output is identical to `DMPFile.to_dmp`, `MN2OVER` trailer and trailing
+    `;` included. Returns the number of sections written.
+    """
+    count = 0
+    file_version = None
+
+    for section in sections:
+        if file_version is None:
+            file_version = section.version
+
+        with phase("serialize", n_shots=len(section.shots)) as serialize_phase:
+            serialize_phase.add(
+                n_bytes=file.write(dmp_bytes_to_text(section.to_dmp_bytes()))
+            )
+        count += 1
+
+    if file_version is not None and file_version > 2:
+        # adding `MN2OVER` message at the end
+        file.write(dmp_bytes_to_text(bytes(MN2OVER)))
+
+    return count
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import json
 import shlex
+import shutil
 import subprocess
 import unittest
 
+import pytest
 from parameterized import parameterized_class
 
+from mnemo_lib.models import DMPFile
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.writers import dmp_bytes_to_text
 from tests.commands.base import BaseCMDTestCase
 
 
@@ -59,6 +65,93 @@ class ConvertCMDTest(CMDTestCase):
         result = self.run_command(cmd)
         assert result.returncode == 0
 
+    def test_convert_output(self):
+        cmd = self.get_test_cmd(
+            input_f=self._file, output_f=self.outfile, extra="--format=json"
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0
+        assert self.outfile.read_bytes() == self._file.with_suffix(".json").read_bytes()
+
+    def test_convert_ndjson(self):
+        cmd = self.get_test_cmd(
+            input_f=self._file, output_f=self.outfile, extra="--format=ndjson"
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0
+
+        lines = self.outfile.read_text().splitlines()
+        sections = DMPFile.from_dmp(self._file).sections
+        assert len(lines) == sum(len(section.shots) for section in sections)
+        assert json.loads(lines[-1])["shot_idx"] == len(sections[-1].shots) - 1
+
+    def test_convert_json_to_dmp(self):
+        outfile = self._temp_dir / "output.dmp"
+        cmd = self.get_test_cmd(
+            input_f=self._file.with_suffix(".json"),
+            output_f=outfile,
+            extra="--format=dmp",
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0
+        assert outfile.read_bytes() == self._file.read_bytes()
+
+    def test_convert_parquet_and_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        n_shots = sum(
+            len(section.shots) for section in DMPFile.from_dmp(self._file).sections
+        )
+
+        for fmt in ("parquet", "arrow"):
+            outfile = self._temp_dir / f"output.{fmt}"
+            cmd = self.get_test_cmd(
+                input_f=self._file, output_f=outfile, extra=f"--format={fmt}"
+            )
+            result = self.run_command(cmd)
+            assert result.returncode == 0
+
+            if fmt == "parquet":
+                table = pq.read_table(outfile)
+            else:
+                table = pa.ipc.open_file(outfile).read_all()
+            assert table.num_rows == n_shots
+
+    def test_convert_many(self):
+        input_dir = self._temp_dir / "input"
+        input_dir.mkdir()
+        shutil.copy(self._file, input_dir / "a.dmp")
+        shutil.copy(self._file, input_dir / "b.dmp")
+        (input_dir / "broken.dmp").write_text("1;2;garbage")
+
+        output_dir = self._temp_dir / "output"
+        for inputs in (input_dir, f"'{input_dir}/*.dmp'"):
+            cmd = self.get_test_cmd(
+                input_f=inputs, output_f=output_dir, extra="--format=json -w -j 2"
+            )
+            result = self.run_command(cmd)
+
+            # The broken file does not stop the others
+            assert result.returncode == 1
+            assert "2 succeeded, 1 failed." in result.stdout
+            assert "broken.dmp" in result.stdout
+
+            expected = self._file.with_suffix(".json").read_bytes()
+            for name in ("a.json", "b.json"):
+                assert (output_dir / name).read_bytes() == expected
+            assert not (output_dir / "broken.json").exists()
+
+        # Without overwrite, existing files are reported as failures
+        cmd = self.get_test_cmd(
+            input_f=input_dir / "a.dmp",
+            output_f=output_dir,
+            extra=f"-i {input_dir / 'b.dmp'} --format=json",
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 1
+        assert "0 succeeded, 2 failed." in result.stdout
+
     def test_no_overwrite_failure(self):
         cmd = self.get_test_cmd(
             input_f=self._file, output_f=self._file, extra="--format=json"
@@ -81,5 +174,54 @@ class ConvertCMDTest(CMDTestCase):
         assert result.returncode == 2
 
 
+class ConvertInvalidCMDTest(CMDTestCase):
+    input_file = "tests/artifacts/test_v5.dmp"
+
+    def run_command(self, command: str):
+        return subprocess.run(  # noqa: S603
+            shlex.split(command),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    def test_invalid_values(self):
+        pytest.importorskip("pyarrow")
+
+        data = read_dmp_file(self._file)
+        data[27] = 10  # first shot `pitch_in` > 90, see `test_read`
+        invalid_file = self._temp_dir / "invalid.dmp"
+        invalid_file.write_bytes(dmp_bytes_to_text(data.tobytes()))
+
+        # Rejected like the JSON export
+        for fmt in ("json", "parquet", "arrow"):
+            outfile = self._temp_dir / f"output.{fmt}"
+            cmd = self.get_test_cmd(
+                input_f=invalid_file, output_f=outfile, extra=f"--format={fmt}"
+            )
+            result = self.run_command(cmd)
+            assert result.returncode == 1
+            assert "pitch_in" in result.stderr
+            assert not outfile.exists()
+
+    def test_failure_keeps_target(self):
+        data = read_dmp_file(self._file)
+        data[27] = 10  # first shot `pitch_in` > 90, see `test_read`
+        invalid_file = self._temp_dir / "invalid.dmp"
+        invalid_file.write_bytes(dmp_bytes_to_text(data.tobytes()))
+
+        for fmt in ("json", "ndjson"):
+            outfile = self._temp_dir / f"output.{fmt}"
+            outfile.write_bytes(b"existing")
+
+            cmd = self.get_test_cmd(
+                input_f=invalid_file, output_f=outfile, extra=f"--format={fmt} -w"
+            )
+            assert self.run_command(cmd).returncode == 1
+            assert outfile.read_bytes() == b"existing"
+
+        assert not list(self._temp_dir.glob("*.tmp"))
+
+
 if __name__ == "__main__":
     unittest.main()
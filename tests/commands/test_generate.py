@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import shlex
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized_class
+
+from mnemo_lib.models import DMPFile
+
+
+def run_command(command: str):
+    return subprocess.run(  # noqa: S603
+        shlex.split(command),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+@parameterized_class(("version",), [(2,), (5,)])
+class GenerateCMDTest(unittest.TestCase):
+    version: int
+
+    def setUp(self):
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+
+    def tearDown(self):
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def generate(self, output_file: Path, extra: str = ""):
+        return run_command(
+            f"mnemo generate --output_file={output_file} "
+            f"--dmp_version={self.version} --sections=12 --shots 3 9 {extra}"
+        )
+
+    def test_generate(self):
+        output_file = self._temp_dir / "output.dmp"
+
+        result = self.generate(output_file, "--seed=5")
+        assert result.returncode == 0, result.stderr
+
+        dmp_file = DMPFile.from_dmp(output_file)
+        assert len(dmp_file.sections) == 12
+        for section in dmp_file.sections:
+            assert section.version == self.version
+            assert 4 <= len(section.shots) <= 10
+
+        # Same seed, same file
+        other_file = self._temp_dir / "other.dmp"
+        assert self.generate(other_file, "--seed=5").returncode == 0
+        assert output_file.read_bytes() == other_file.read_bytes()
+
+    def test_overwrite(self):
+        output_file = self._temp_dir / "output.dmp"
+        output_file.touch()
+
+        result = self.generate(output_file)
+        assert result.returncode != 0
+        assert "FileExistsError" in result.stderr
+        assert output_file.stat().st_size == 0
+
+        assert self.generate(output_file, "--overwrite").returncode == 0
+        assert output_file.stat().st_size > 0
+
+    def test_corruption(self):
+        output_file = self._temp_dir / "output.dmp"
+
+        result = self.generate(
+            output_file, "--corruption_rate=1 --corruptions truncated"
+        )
+        assert result.returncode == 0, result.stderr
+        assert output_file.stat().st_size > 0
+
+    def test_invalid_corruption(self):
+        output_file = self._temp_dir / "output.dmp"
+
+        result = self.generate(output_file, "--corruption_rate=2")
+        assert result.returncode == 2
+        assert "corruption_rate" in result.stderr
+        assert not output_file.exists()
+
+    def test_invalid_arguments_keep_target(self):
+        output_file = self._temp_dir / "output.dmp"
+        output_file.write_bytes(b"existing")
+
+        result = self.generate(output_file, "--corruption_rate=2 --overwrite")
+        assert result.returncode == 2
+        assert output_file.read_bytes() == b"existing"
+        assert list(self._temp_dir.iterdir()) == [output_file]
+
+
+if __name__ == "__main__":
+    unittest.main()
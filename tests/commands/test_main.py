@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pstats
+import shlex
+import subprocess
+import unittest
+
+from parameterized import parameterized_class
+
+from tests.commands.base import BaseCMDTestCase
+
+
+class CMDTestCase(BaseCMDTestCase):
+    command_template = "mnemo {options} {command} --input_file={input_f} {extra}"
+
+    def run_command(self, command: str):
+        return subprocess.run(  # noqa: S603
+            shlex.split(command),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+
+@parameterized_class(
+    ("input_file"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+    ],
+)
+class ProfileCMDTest(CMDTestCase):
+    def test_profile_convert(self):
+        output_file = self._temp_dir / "output.json"
+        pstats_file = self._temp_dir / "profile.pstats"
+
+        cmd = self.get_test_cmd(
+            options=f"--profile --profile_output={pstats_file}",
+            command="convert",
+            input_f=self._file,
+            extra=f"--output_file={output_file} --format=json",
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0, result.stderr
+        assert output_file.exists()
+
+        phases = [line.split()[0] for line in result.stderr.splitlines()]
+        assert phases[0] == "phase"
+        for name in ("read", "tokenize", "split", "decode", "validate", "serialize"):
+            assert name in phases
+        assert phases[-1] == "total"
+
+        stats = pstats.Stats(str(pstats_file))
+        assert stats.total_calls > 0  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_profile_correct(self):
+        output_file = self._temp_dir / "output.dmp"
+
+        cmd = self.get_test_cmd(
+            options="--profile",
+            command="correct",
+            input_f=self._file,
+            extra=f"--output_file={output_file} --length_scaling=1.1",
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0, result.stderr
+        assert "correct" in [line.split()[0] for line in result.stderr.splitlines()]
+
+    def test_no_profile(self):
+        output_file = self._temp_dir / "output.json"
+
+        cmd = self.get_test_cmd(
+            options="",
+            command="convert",
+            input_f=self._file,
+            extra=f"--output_file={output_file} --format=json",
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0, result.stderr
+        assert not result.stderr
+
+    def test_profile_output_requires_profile(self):
+        cmd = self.get_test_cmd(
+            options=f"--profile_output={self._temp_dir / 'profile.pstats'}",
+            command="convert",
+            input_f=self._file,
+            extra=f"--output_file={self._temp_dir / 'output.json'} --format=json",
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 2
+        assert "--profile" in result.stderr
+
+
+if __name__ == "__main__":
+    unittest.main()
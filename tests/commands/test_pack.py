@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import shlex
+import subprocess
+import unittest
+
+from parameterized import parameterized_class
+
+from mnemo_lib.models import DMPFile
+from tests.commands.base import BaseCMDTestCase
+
+
+class CMDTestCase(BaseCMDTestCase):
+    command_template = (
+        "mnemo {command} --input_file={input_f} --output_file={output_f} {extra}"
+    )
+
+    def run_command(self, command: str):
+        return subprocess.run(  # noqa: S603
+            shlex.split(command),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+
+@parameterized_class(
+    ("input_file"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class PackCMDTest(CMDTestCase):
+    def test_pack_unpack(self):
+        packed = self._temp_dir / "output.pdmp"
+        unpacked = self._temp_dir / "output.dmp"
+
+        cmd = self.get_test_cmd(
+            command="pack", input_f=self._file, output_f=packed, extra=""
+        )
+        assert self.run_command(cmd).returncode == 0
+        assert (
+            DMPFile.from_packed(packed).to_json()
+            == DMPFile.from_dmp(self._file).to_json()
+        )
+
+        cmd = self.get_test_cmd(
+            command="unpack", input_f=packed, output_f=unpacked, extra=""
+        )
+        assert self.run_command(cmd).returncode == 0
+        assert unpacked.read_bytes() == self._file.read_bytes()
+
+    def test_no_overwrite_failure(self):
+        cmd = self.get_test_cmd(
+            command="pack", input_f=self._file, output_f=self._file, extra=""
+        )
+        assert self.run_command(cmd).returncode == 1
+
+    def test_unpack_text_file_failure(self):
+        outfile = self._temp_dir / "output.dmp"
+        cmd = self.get_test_cmd(
+            command="unpack", input_f=self._file, output_f=outfile, extra=""
+        )
+        assert self.run_command(cmd).returncode == 1
+        assert not outfile.exists()
+
+    def test_unpack_failure_keeps_target(self):
+        outfile = self._temp_dir / "output.dmp"
+        outfile.write_bytes(b"existing")
+
+        cmd = self.get_test_cmd(
+            command="unpack", input_f=self._file, output_f=outfile, extra="-w"
+        )
+        assert self.run_command(cmd).returncode == 1
+        assert outfile.read_bytes() == b"existing"
+        assert list(self._temp_dir.iterdir()) == [outfile]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,6 +97,55 @@ class ConvertCMDTest(CMDTestCase):
         self._execute_successful_split(extra="-w")
         self._execute_successful_split(extra="--overwrite")
 
+    def test_successful_raw_split(self):
+        # Same files as when decoding and re-encoding every section
+        self._execute_successful_split(extra="--raw")
+        self._execute_successful_split(extra="--raw --validate -w")
+
+    def test_validate_requires_raw(self):
+        cmd = self.get_test_cmd(
+            input_f=self._file, output_dir=self._temp_dir, extra="--validate"
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 2
+
+    def test_raw_split_invalid_section(self):
+        # Invalid month in the header of the last section
+        data = self._file.read_text().split(";")
+        starts = [
+            idx
+            for idx in range(len(data) - 3)
+            if data[idx] == data[0] and data[idx + 1 : idx + 4] == ["68", "89", "101"]
+        ]
+        offset = 5 if data[0] == "5" else 2  # version, (magic values), year, month
+        data[(starts[-1] if starts else 0) + offset] = "13"
+        invalid_file = self._temp_dir / "invalid.dmp"
+        invalid_file.write_text(";".join(data))
+
+        output_dir = self._temp_dir / "output"
+        output_dir.mkdir()
+
+        cmd = self.get_test_cmd(
+            input_f=invalid_file, output_dir=output_dir, extra="--raw --validate"
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 1
+        assert not any(output_dir.iterdir())
+
+        # The sections written before the invalid one are deleted
+        cmd = self.get_test_cmd(input_f=invalid_file, output_dir=output_dir, extra="")
+        result = self.run_command(cmd)
+        assert result.returncode == 1
+        assert not any(output_dir.iterdir())
+
+        # Without validation, the original bytes are copied as is
+        cmd = self.get_test_cmd(
+            input_f=invalid_file, output_dir=output_dir, extra="--raw"
+        )
+        result = self.run_command(cmd)
+        assert result.returncode == 0
+        assert len(list(output_dir.glob("*.dmp"))) == self.expected_filecount
+
     def test_no_overwrite_failure(self):
         self._execute_successful_split()
         cmd = self.get_test_cmd(input_f=self._file, output_dir=self._temp_dir, extra="")
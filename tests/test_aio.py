@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from benchmarks.utils import build_large_dmp
+from mnemo_lib.batch import arun_batch
+from mnemo_lib.models import DMPFile
+
+ARTIFACTS = (
+    "tests/artifacts/test_v2.dmp",
+    "tests/artifacts/test_v5.dmp",
+    "tests/artifacts/test_v5_buggy_EOS.dmp",
+)
+
+
+class AsyncAPITest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+        self._expected = {path: DMPFile.from_dmp(path) for path in ARTIFACTS}
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    async def test_afrom_dmp(self):
+        for filepath, expected in self._expected.items():
+            assert await DMPFile.afrom_dmp(filepath) == expected
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for filepath, expected in self._expected.items():
+                dmp_file = await DMPFile.afrom_dmp(filepath, executor=executor)
+                assert dmp_file == expected
+
+        with pytest.raises(FileNotFoundError):
+            await DMPFile.afrom_dmp("does_not_exist.dmp")
+
+    async def test_ato_json(self):
+        for filepath, expected in self._expected.items():
+            assert await expected.ato_json() == expected.to_json()
+
+            json_fp = self._temp_dir / "output.json"
+            assert await expected.ato_json(json_fp) == expected.to_json()
+            assert (
+                json_fp.read_text() == Path(filepath).with_suffix(".json").read_text()
+            )
+
+    async def test_aiter_many(self):
+        broken = self._temp_dir / "broken.dmp"
+        broken.write_text("1;2;garbage")
+        filepaths = [*ARTIFACTS, broken]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for executor_ in (None, executor):
+                results = {
+                    str(result.filepath): result
+                    async for result in DMPFile.aiter_many(
+                        filepaths, concurrency=2, executor=executor_
+                    )
+                }
+                assert len(results) == len(filepaths)
+
+                for filepath, expected in self._expected.items():
+                    assert results[filepath].ok
+                    assert results[filepath].value == expected
+
+                assert isinstance(results[str(broken)].error, ValueError)
+
+    async def test_concurrency_limit(self):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def work(filepath: Path) -> str:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return filepath.name
+
+        names = [f"{idx}.dmp" for idx in range(12)]
+        results = [
+            result.value async for result in arun_batch(work, names, concurrency=3)
+        ]
+        assert sorted(results) == sorted(names)
+        assert max_running <= 3
+
+        with pytest.raises(ValueError, match="concurrency"):
+            async for _ in arun_batch(work, names, concurrency=0):
+                pass
+
+    async def test_loop_stays_responsive(self):
+        large_file = build_large_dmp(
+            "tests/artifacts/test_v5.dmp", repeat=300, output=self._temp_dir / "l.dmp"
+        )
+
+        start = time.perf_counter()
+        expected = DMPFile.from_dmp(large_file)
+        blocking = time.perf_counter() - start
+
+        gaps: list[float] = []
+        done = asyncio.Event()
+
+        async def ticker() -> None:
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        async def process() -> list[DMPFile | None]:
+            try:
+                return [
+                    result.value
+                    async for result in DMPFile.aiter_many(
+                        [large_file] * 4, concurrency=2
+                    )
+                ]
+            finally:
+                done.set()
+
+        ticker_task = asyncio.create_task(ticker())
+        dmp_files = await process()
+        await ticker_task
+
+        assert dmp_files == [expected] * 4
+
+        # A blocking call would stall the loop for the whole decoding of a file.
+        # The loop can still be paused by the garbage collector or long C calls.
+        assert len(gaps) > 10
+        assert statistics.median(gaps) < blocking / 10, (gaps, blocking)
+        assert max(gaps) < blocking, (gaps, blocking)
+
+
+if __name__ == "__main__":
+    unittest.main()
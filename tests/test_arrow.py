@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from parameterized import parameterized_class
+
+from mnemo_lib import arrow
+from mnemo_lib.models import DMPFile
+from mnemo_lib.table import SectionTable
+
+pa = pytest.importorskip("pyarrow")
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class ArrowExportTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._dmp_file = DMPFile.from_dmp(self.filepath)
+        self._table = SectionTable.from_dmp(self.filepath)
+
+    def test_same_values_as_models(self):
+        rows = self._table.to_arrow().to_pylist()
+
+        expected = [
+            {
+                "section_idx": section_idx,
+                **section.model_dump(exclude={"shots"}),
+                "shot_idx": shot_idx,
+                **shot.model_dump(),
+            }
+            for section_idx, section in enumerate(self._dmp_file.sections)
+            for shot_idx, shot in enumerate(section.shots)
+        ]
+        for row in rows:
+            row["date"] = row["date"].strftime("%Y-%m-%d %H:%M")
+
+        assert rows == expected
+
+    def test_dictionary_columns(self):
+        schema = self._table.to_arrow().schema
+        for name in ("date", "name", "direction", "version", "type"):
+            assert pa.types.is_dictionary(schema.field(name).type)
+
+        # One dictionary entry per distinct value, not per section
+        names = self._table.to_arrow().column("name").chunk(0)
+        assert len(names.dictionary) == len(set(self._table.names))
+
+    def test_dmpfile_to_arrow(self):
+        assert self._dmp_file.to_arrow().equals(self._table.to_arrow())
+
+    def test_to_pandas(self):
+        pytest.importorskip("pandas")
+        df = self._dmp_file.to_pandas()
+        assert len(df) == len(self._table.shots)
+        assert df["direction"].dtype == "category"
+        assert df["head_in"].tolist() == self._table.shots.column("head_in")
+
+    def test_to_polars(self):
+        pl = pytest.importorskip("polars")
+        df = self._dmp_file.to_polars()
+        assert df.height == len(self._table.shots)
+        assert df.schema["name"] == pl.Categorical
+        assert df["length"].to_list() == self._table.shots.column("length")
+
+    def test_to_parquet(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir) / "shots.parquet"
+            assert self._dmp_file.to_parquet(filepath) == len(self._table.shots)
+            # Parquet only restores the dictionary encoding of string columns
+            assert pq.read_table(filepath).to_pylist() == (
+                self._table.to_arrow().to_pylist()
+            )
+
+
+class MissingDependencyTest(unittest.TestCase):
+    def test_install_hint(self):
+        table = SectionTable.from_dmp("tests/artifacts/test_v5.dmp")
+        with (
+            mock.patch.object(
+                arrow.importlib, "import_module", side_effect=ImportError
+            ),
+            pytest.raises(ImportError, match=r"mnemo_lib\[arrow\]"),
+        ):
+            table.to_arrow()
+
+
+if __name__ == "__main__":
+    unittest.main()
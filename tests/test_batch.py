@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from mnemo_lib.batch import BatchResult
+from mnemo_lib.batch import BatchSummary
+from mnemo_lib.batch import expand_paths
+from mnemo_lib.batch import resolve_workers
+from mnemo_lib.batch import run_batch
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.writers import dmp_bytes_to_text
+
+ARTIFACTS = (
+    "tests/artifacts/test_v2.dmp",
+    "tests/artifacts/test_v5.dmp",
+    "tests/artifacts/test_v5_buggy_EOS.dmp",
+)
+
+
+def _file_size(filepath: Path) -> int:
+    if filepath.suffix != ".dmp":
+        raise ValueError(f"Not a DMP file: `{filepath}`.")
+    return len(filepath.read_bytes())
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+
+        for artifact in ARTIFACTS:
+            shutil.copy(artifact, self._temp_dir)
+        (self._temp_dir / "notes.txt").write_text("not a DMP file")
+        (self._temp_dir / "broken.dmp").write_text("1;2;garbage")
+
+        self._files = [self._temp_dir / Path(artifact).name for artifact in ARTIFACTS]
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def test_expand_paths(self):
+        expected = sorted([*self._files, self._temp_dir / "broken.dmp"])
+        assert expand_paths([self._temp_dir]) == expected
+        assert expand_paths([str(self._temp_dir / "*.dmp")]) == expected
+        assert expand_paths([str(self._temp_dir / "**" / "*.txt")]) == [
+            self._temp_dir / "notes.txt"
+        ]
+
+        # Duplicates dropped, missing files kept to be reported
+        missing = self._temp_dir / "missing.dmp"
+        assert expand_paths([self._files[0], missing, self._temp_dir]) == [
+            self._files[0],
+            missing,
+            *[path for path in expected if path != self._files[0]],
+        ]
+
+    def test_run_batch(self):
+        filepaths = [*self._files, self._temp_dir / "notes.txt"]
+
+        for workers in (1, 2):
+            results = list(run_batch(_file_size, filepaths, workers=workers))
+            results.sort(key=lambda result: filepaths.index(result.filepath))
+
+            assert [result.filepath for result in results] == filepaths
+            for filepath, result in zip(self._files, results, strict=False):
+                assert result.ok
+                assert result.value == result.size == filepath.stat().st_size
+
+            assert not results[-1].ok
+            assert isinstance(results[-1].error, ValueError)
+            assert results[-1].value is None
+
+    def test_resolve_workers(self):
+        assert resolve_workers(None) >= 1
+        assert resolve_workers(3) == 3
+        with pytest.raises(ValueError, match="workers"):
+            resolve_workers(0)
+
+    def test_summary(self):
+        summary = BatchSummary()
+        summary.add(BatchResult(self._files[0], 1, None, 0.1, 1000))
+        summary.add(
+            BatchResult(self._files[1], None, ValueError("Invalid year"), 0.1, 500)
+        )
+
+        assert summary.n_files == 2
+        assert summary.n_failed == 1
+        assert summary.size == 1500
+        assert summary.files_per_second > 0
+
+        report = summary.format()
+        assert "Processed 2 files" in report
+        assert "1 succeeded, 1 failed." in report
+        assert f"{self._files[1]}: ValueError: Invalid year" in report
+
+    def test_from_many(self):
+        filepaths = [*self._files, self._temp_dir / "broken.dmp"]
+
+        for workers in (1, 2):
+            results = {
+                result.filepath: result
+                for result in DMPFile.from_many(filepaths, workers=workers)
+            }
+            assert len(results) == len(filepaths)
+
+            for filepath in self._files:
+                assert results[filepath].ok
+                assert (
+                    results[filepath].value.to_json()
+                    == DMPFile.from_dmp(filepath).to_json()
+                )
+
+            assert isinstance(results[filepaths[-1]].error, ValueError)
+
+    def test_from_many_same_as_decoded(self):
+        # Pitches and temperatures below -25.6 are not encoded back as read
+        generated = self._temp_dir / "generated.dmp"
+        with generated.open(mode="wb") as file:
+            generate_dmp(file, n_sections=20, seed=3)
+
+        data = read_dmp_file(self._files[1])
+        truncated = self._temp_dir / "truncated.dmp"
+        truncated.write_bytes(dmp_bytes_to_text(data[: len(data) * 2 // 3].tobytes()))
+
+        options = {"uncorrupt": True, "uncorrupt_date": datetime.date(2024, 1, 31)}
+        for filepath, kwargs in ((generated, {}), (truncated, options)):
+            (result,) = DMPFile.from_many([filepath], workers=2, **kwargs)
+            assert result.value == DMPFile.from_dmp(filepath, **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
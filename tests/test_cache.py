@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import datetime
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+from parameterized import parameterized
+from parameterized import parameterized_class
+from pydantic import ValidationError
+
+from mnemo_lib.cache import DMPCache
+from mnemo_lib.decoder import decode_dmp
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.models import Shot
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.writers import dmp_bytes_to_text
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class DMPCacheTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._cache = DMPCache(Path(self._temp_dir_ctx.__enter__()) / "cache")
+        self._key = DMPCache.make_key(Path(self.filepath).read_bytes())
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def test_hit_same_output(self):
+        cold = DMPFile.from_dmp(self.filepath, cache=self._cache)
+        assert len(self._cache) == 1
+        assert self._cache.get(self._key) is not None
+
+        hit = DMPFile.from_dmp(self.filepath, cache=self._cache)
+        assert hit.to_json() == cold.to_json()
+        assert hit.to_dmp() == cold.to_dmp()
+        assert len(self._cache) == 1
+
+    def test_uncorrupt_options_in_key(self):
+        if self.filepath.endswith("_v2.dmp"):
+            self.skipTest("Uncorrupting is not supported for DMP version 2.")
+
+        date = datetime.date(2025, 2, 17)
+        expected = DMPFile.from_dmp(self.filepath, uncorrupt=True, uncorrupt_date=date)
+
+        DMPFile.from_dmp(self.filepath, cache=self._cache)
+        for _ in range(2):
+            dmp_file = DMPFile.from_dmp(
+                self.filepath, uncorrupt=True, uncorrupt_date=date, cache=self._cache
+            )
+            assert dmp_file.to_json() == expected.to_json()
+
+        assert len(self._cache) == 2
+
+    def test_corrupted_entry_is_rebuilt(self):
+        expected = DMPFile.from_dmp(self.filepath, cache=self._cache).to_json()
+
+        entry = next(self._cache.directory.iterdir())
+        raw = bytearray(entry.read_bytes())
+        raw[-10] ^= 0xFF
+        entry.write_bytes(raw)
+
+        assert self._cache.get(self._key) is None
+        assert not entry.exists()
+
+        assert DMPFile.from_dmp(self.filepath, cache=self._cache).to_json() == expected
+        assert self._cache.get(self._key) is not None
+
+    def test_truncated_entry(self):
+        DMPFile.from_dmp(self.filepath, cache=self._cache)
+
+        entry = next(self._cache.directory.iterdir())
+        entry.write_bytes(entry.read_bytes()[:20])
+        assert self._cache.get(self._key) is None
+
+    def test_unvalidated_files_not_stored(self):
+        DMPFile.from_dmp(self.filepath, validate="none", cache=self._cache)
+        assert len(self._cache) == 0
+
+        # Stored once validated
+        dmp_file = DMPFile.from_dmp(
+            self.filepath, validate="deferred", cache=self._cache
+        )
+        assert len(self._cache) == 0
+        dmp_file.ensure_validated()
+        assert len(self._cache) == 1
+
+
+class DMPCacheRoundTripTest(unittest.TestCase):
+    """Hits are identical to a decoding, even where encoding the models back to
+    the DMP format is lossy."""
+
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+        self._cache = DMPCache(self._temp_dir / "cache")
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def _assert_hit_identical(self, filepath: Path, **kwargs) -> DMPFile:
+        cold = DMPFile.from_dmp(filepath, **kwargs)
+        DMPFile.from_dmp(filepath, cache=self._cache, **kwargs)
+
+        hit = DMPFile.from_dmp(filepath, cache=self._cache, **kwargs)
+        assert len(self._cache) == 1
+        assert hit == cold
+        assert hit.to_json() == cold.to_json()
+        return cold
+
+    @parameterized.expand([(2,), (5,)])
+    def test_generated(self, version):
+        # Pitches and temperatures below -25.6 are not encoded back as read
+        filepath = self._temp_dir / "generated.dmp"
+        with filepath.open(mode="wb") as file:
+            generate_dmp(file, version=version, n_sections=20, seed=3)
+
+        self._assert_hit_identical(filepath)
+
+    @parameterized.expand([(datetime.date(2024, 1, 31),), (datetime.date(2012, 5, 3),)])
+    def test_uncorrupt(self, date):
+        data = read_dmp_file("tests/artifacts/test_v5.dmp")
+        filepath = self._temp_dir / "truncated.dmp"
+        filepath.write_bytes(dmp_bytes_to_text(data[: len(data) * 2 // 3].tobytes()))
+
+        dmp_file = self._assert_hit_identical(
+            filepath, uncorrupt=True, uncorrupt_date=date
+        )
+        # The end of survey shot added back has no optional values
+        assert dmp_file.sections[-1].shots[-1] == Shot.get_eos_shot()
+
+    def test_deferred_invalid_not_stored(self):
+        data = read_dmp_file("tests/artifacts/test_v5.dmp")
+        data[27] = 10  # first shot `pitch_in` > 90, see `test_read`
+        filepath = self._temp_dir / "invalid.dmp"
+        filepath.write_bytes(dmp_bytes_to_text(data.tobytes()))
+
+        dmp_file = DMPFile.from_dmp(filepath, validate="deferred", cache=self._cache)
+        with pytest.raises(ValidationError):
+            dmp_file.ensure_validated()
+        assert len(self._cache) == 0
+
+
+class DMPCacheEvictionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._directory = Path(self._temp_dir_ctx.__enter__())
+        self._sections = decode_dmp(read_dmp_file("tests/artifacts/test_v5.dmp"))
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def _put(self, cache: DMPCache, key: str, mtime_ns: int) -> Path:
+        cache.put(key, self._sections)
+        path = cache.directory / f"{key}.pdmpc"
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_lru_eviction(self):
+        cache = DMPCache(self._directory)
+        first = self._put(cache, "first", 1_000_000_000)
+        entry_size = first.stat().st_size
+
+        cache.max_size = entry_size * 2
+        second = self._put(cache, "second", 2_000_000_000)
+
+        # `first` becomes the most recently used
+        assert cache.get("first") is not None
+
+        self._put(cache, "third", 3_000_000_000)
+        assert first.exists()
+        assert not second.exists()
+        assert len(cache) == 2
+        assert cache.size == entry_size * 2
+
+    def test_clear(self):
+        cache = DMPCache(self._directory)
+        self._put(cache, "first", 1_000_000_000)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_make_key(self):
+        raw = Path("tests/artifacts/test_v5.dmp").read_bytes()
+        keys = {
+            DMPCache.make_key(raw),
+            DMPCache.make_key(raw + b"1;"),
+            DMPCache.make_key(raw, uncorrupt=True),
+            DMPCache.make_key(
+                raw, uncorrupt=True, uncorrupt_date=datetime.date(2025, 2, 17)
+            ),
+        }
+        assert len(keys) == 4
+        assert DMPCache.make_key(raw) == DMPCache.make_key(bytes(raw))
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError, match="max_size"):
+            DMPCache(self._directory, max_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
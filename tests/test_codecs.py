@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import struct
+import unittest
+from array import array
+
+import pytest
+from parameterized import parameterized_class
+
+from mnemo_lib.codecs import CODECS
+from mnemo_lib.codecs import SHOT_FIELDS
+from mnemo_lib.codecs import FrameCodec
+from mnemo_lib.codecs import get_codec
+from mnemo_lib.codecs import int16be_words
+from mnemo_lib.codecs import register_codec
+from mnemo_lib.decoder import decode_section
+from mnemo_lib.models import Shot
+from mnemo_lib.utils import convert_to_Int16BE
+
+
+@parameterized_class(
+    ("version", "frame_size"),
+    [(2, 16), (3, 21), (4, 29), (5, 35)],
+)
+class FrameCodecTest(unittest.TestCase):
+    version: int
+    frame_size: int
+
+    def setUp(self) -> None:
+        self._codec = get_codec(self.version)
+        self._values = [2, 1234, 3599, 512, 0, 1000, -900, 900]
+        if "left" in self._codec.fields:
+            self._values += [10, 20, 30, 40]
+        if "temperature" in self._codec.fields:
+            self._values += [-35, 12, 34, 56]
+        self._values.append(7)
+
+    def test_sizes(self):
+        assert self._codec.frame.size == self.frame_size
+        assert self._codec.header.size == (10 if self.version == 2 else 13)
+
+    def test_frame_round_trip(self):
+        raw = self._codec.encode_frame(self._values)
+        assert len(raw) == self.frame_size
+
+        decoded = self._codec.decode_frame(self._codec.frame.unpack(raw))
+        assert list(decoded) == list(self._codec.fields)
+        assert list(decoded.values()) == self._values
+
+    def test_same_frame_as_shot(self):
+        shot = Shot.from_dmp(
+            self.version,
+            array("b", self._codec.encode_frame(self._values)).tolist(),
+        )
+        assert bytes(array("b", shot._generate_dmp(self.version))) == (  # noqa: SLF001
+            self._codec.encode_frame(self._values)
+        )
+
+    def test_header_round_trip(self):
+        values = (self.version, 25, 2, 17, 13, 37, 65, 66, 67, 1)
+        raw = self._codec.encode_header(values)
+        assert len(raw) == self._codec.header.size
+        assert self._codec.decode_header(self._codec.header.unpack(raw)) == values
+
+
+class FrameCodecErrorsTest(unittest.TestCase):
+    def test_unknown_version(self):
+        with pytest.raises(ValueError, match="Invalid File Format"):
+            get_codec(1)
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="Unknown shot fields"):
+            FrameCodec(6, ("type", "unknown"), section_magic=True, shot_magic=True)
+
+    def test_invalid_shot_magic(self):
+        codec = get_codec(5)
+        values = list(codec.frame.unpack(codec.encode_frame([0] * 16 + [1])))
+        values[0] = 0
+        with pytest.raises(ValueError, match="magic"):
+            codec.decode_frame(values)
+
+    def test_invalid_section_magic(self):
+        with pytest.raises(ValueError, match="magic"):
+            get_codec(5).decode_header((5, 0, 0, 0, 25, 2, 17, 13, 37, 65, 66, 67, 1))
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError, match="out of range"):
+            get_codec(2).encode_frame([2, 40000, 0, 0, 0, 0, 0, 0, 0])
+
+    def test_int16be_words(self):
+        values = range(-32000, 32000, 7)
+        for value, word in zip(values, int16be_words(values), strict=True):
+            assert tuple(array("b", struct.pack(">h", word))) == (
+                convert_to_Int16BE(value)
+            )
+
+
+class RegisterCodecTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        CODECS.pop(6, None)
+
+    def test_future_version(self):
+        # A future firmware only needs its layout to be declared
+        register_codec(
+            FrameCodec(
+                version=6,
+                fields=SHOT_FIELDS,
+                section_magic=True,
+                shot_magic=True,
+            )
+        )
+        codec = get_codec(6)
+        header = codec.encode_header((6, 25, 2, 17, 13, 37, 65, 66, 67, 0))
+        frame = codec.encode_frame([2, 10, 20, 30, 40, 50, 60, 70] + [0] * 8 + [1])
+
+        section = decode_section(header + frame * 3)
+        assert section.version == 6
+        assert len(section) == 3
+        assert section.column("length") == [0.3] * 3
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime
+import unittest
+
+import pytest
+from parameterized import parameterized
+from parameterized import parameterized_class
+
+from mnemo_lib.constants import ShotType
+from mnemo_lib.corrections import Corrections
+from mnemo_lib.corrections import apply_corrections
+from mnemo_lib.models import DMPFile
+from mnemo_lib.models import Shot
+
+
+def _correct_shot(shot: Shot, corrections: Corrections) -> None:
+    """Reference implementation: one shot at a time, as `mnemo correct` did."""
+    if corrections.length_scaling is not None:
+        shot.length = round(shot.length * corrections.length_scaling, ndigits=2)
+
+    if corrections.compass_offset is not None:
+        shot.head_in = round(
+            (shot.head_in + corrections.compass_offset) % 360, ndigits=1
+        )
+        shot.head_out = round(
+            (shot.head_out + corrections.compass_offset) % 360, ndigits=1
+        )
+
+    if corrections.depth_offset is not None:
+        shot.depth_in = round(shot.depth_in + corrections.depth_offset, ndigits=2)
+        shot.depth_out = round(shot.depth_out + corrections.depth_offset, ndigits=2)
+
+    if corrections.reverse_azimuth:
+        shot.head_in = round((shot.head_in + 180) % 360, ndigits=0)
+        shot.head_out = round((shot.head_out + 180) % 360, ndigits=0)
+
+
+CORRECTIONS = [
+    (Corrections(),),
+    (Corrections(length_scaling=1.037),),
+    (Corrections(compass_offset=243.5),),
+    (Corrections(depth_offset=-1.37),),
+    (Corrections(reverse_azimuth=True),),
+    (Corrections(compass_offset=12, reverse_azimuth=True),),
+    (
+        Corrections(
+            date=datetime.date(2024, 2, 29),
+            length_scaling=0.61,
+            compass_offset=359.9,
+            depth_offset=2.05,
+            reverse_azimuth=True,
+        ),
+    ),
+]
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class CorrectionsTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._dmp_file = DMPFile.from_dmp(self.filepath)
+        self._expected = DMPFile.from_dmp(self.filepath)
+
+    @parameterized.expand(CORRECTIONS)
+    def test_same_as_per_shot(self, corrections: Corrections):
+        for section in self._expected.sections:
+            if corrections.date is not None:
+                section.date = section.date.replace(
+                    year=corrections.date.year,
+                    month=corrections.date.month,
+                    day=corrections.date.day,
+                )
+            for shot in section.shots:
+                _correct_shot(shot, corrections)
+
+        n_shots = apply_corrections(self._dmp_file, corrections)
+
+        assert n_shots == sum(len(s.shots) for s in self._dmp_file.sections)
+        assert self._dmp_file.to_json() == self._expected.to_json()
+        assert self._dmp_file.to_dmp() == self._expected.to_dmp()
+
+    def test_restricted(self):
+        corrections = Corrections(
+            date=datetime.date(2024, 2, 29), length_scaling=2, reverse_azimuth=True
+        )
+        sections = [0, len(self._dmp_file.sections) - 1]
+        shot_types = [ShotType.STANDARD]
+
+        for idx in sections:
+            section = self._expected.sections[idx]
+            section.date = section.date.replace(year=2024, month=2, day=29)
+            for shot in section.shots:
+                if shot.type in shot_types:
+                    _correct_shot(shot, corrections)
+
+        n_shots = apply_corrections(
+            self._dmp_file, corrections, sections=sections, shot_types=shot_types
+        )
+
+        assert n_shots == sum(
+            shot.type == ShotType.STANDARD
+            for idx in set(sections)
+            for shot in self._dmp_file.sections[idx].shots
+        )
+        assert self._dmp_file.to_json() == self._expected.to_json()
+
+
+class CorrectionsErrorsTest(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (Corrections(length_scaling=0), "length_scaling"),
+            (Corrections(length_scaling=-1.2), "length_scaling"),
+            (Corrections(compass_offset=360), "compass_offset"),
+            (Corrections(compass_offset=-1), "compass_offset"),
+        ]
+    )
+    def test_invalid(self, corrections: Corrections, match: str):
+        dmp_file = DMPFile.from_dmp("tests/artifacts/test_v5.dmp")
+        with pytest.raises(ValueError, match=match):
+            apply_corrections(dmp_file, corrections)
+
+    def test_invalid_section(self):
+        dmp_file = DMPFile.from_dmp("tests/artifacts/test_v5.dmp")
+        with pytest.raises(IndexError):
+            apply_corrections(
+                dmp_file, Corrections(length_scaling=2), sections=[10_000]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import datetime
+import marshal
+import unittest
+import zlib
+from pathlib import Path
+
+import pytest
+from parameterized import parameterized_class
+
+from mnemo_lib.constants import ShotType
+from mnemo_lib.decoder import decode_dmp
+from mnemo_lib.decoder import decode_section
+from mnemo_lib.decoder import dump_sections
+from mnemo_lib.decoder import load_sections
+from mnemo_lib.models import DMPFile
+from mnemo_lib.models import Section
+from mnemo_lib.models import Shot
+from mnemo_lib.utils import EOS_SEQUENCES
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.utils import pack_dmp_data
+from mnemo_lib.utils import split_dmp_into_sections
+from mnemo_lib.utils import try_split_dmp_in_sections
+
+
+def read_dmp_data(filepath: Path) -> list[int]:
+    with filepath.open(mode="r") as file:
+        return [int(i) for i in file.read().strip().split(";") if i != ""]
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class DecoderEquivalenceTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._data = read_dmp_data(Path(self.filepath))
+
+    def test_same_output_as_legacy_decoder(self):
+        legacy = DMPFile(
+            [
+                Section.from_dmp(section_dmp)
+                for section_dmp in split_dmp_into_sections(self._data)
+            ]
+        )
+        decoded = DMPFile([Section.from_decoded(s) for s in decode_dmp(self._data)])
+
+        assert decoded.to_json() == legacy.to_json()
+        assert decoded.to_dmp() == legacy.to_dmp()
+
+    def test_decode_from_bytes(self):
+        from_list = decode_dmp(self._data)
+        from_bytes = decode_dmp(pack_dmp_data(self._data))
+
+        assert len(from_list) == len(from_bytes)
+        for lhs, rhs in zip(from_list, from_bytes, strict=True):
+            assert lhs.columns == rhs.columns
+
+    def test_dump_load(self):
+        decoded = decode_dmp(self._data)
+        loaded = load_sections(dump_sections(decoded))
+
+        assert len(loaded) == len(decoded)
+        for lhs, rhs in zip(loaded, decoded, strict=True):
+            assert lhs.columns == rhs.columns
+            assert (lhs.version, lhs.date, lhs.name, lhs.direction) == (
+                rhs.version,
+                rhs.date,
+                rhs.name,
+                rhs.direction,
+            )
+            assert Section.from_decoded(lhs) == Section.from_decoded(rhs)
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class UncorruptEquivalenceTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._data = read_dmp_data(Path(self.filepath))
+        self._date = datetime.date(2025, 2, 17)
+
+    def _legacy_uncorrupt(self, data: list[int]) -> DMPFile:
+        sections = [
+            Section.from_dmp(section_dmp, uncorrupt=True)
+            for section_dmp in try_split_dmp_in_sections(data)
+        ]
+        for section in sections:
+            section.date = datetime.datetime.combine(
+                self._date, datetime.datetime.min.time()
+            )
+            if section.shots[-1].type != ShotType.END_OF_SURVEY:
+                section.shots.append(Shot.get_eos_shot())
+        return DMPFile(sections)
+
+    def test_same_output_as_legacy_uncorrupt(self):
+        dmp_file = DMPFile.from_dmp_data(
+            self._data, uncorrupt=True, uncorrupt_date=self._date
+        )
+        assert dmp_file.to_json() == self._legacy_uncorrupt(self._data).to_json()
+
+    def test_missing_end_of_survey(self):
+        # Truncated download: the last end of survey sequence is missing
+        _, end = find_section_offsets(self._data)[-1]
+        data = self._data[: end - len(EOS_SEQUENCES[5][0])]
+
+        dmp_file = DMPFile.from_dmp_data(
+            data, uncorrupt=True, uncorrupt_date=self._date
+        )
+        assert dmp_file.to_json() == self._legacy_uncorrupt(data).to_json()
+        assert all(
+            section.shots[-1].type == ShotType.END_OF_SURVEY
+            for section in dmp_file.sections
+        )
+
+
+class DecodedSectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._sections = decode_dmp(read_dmp_data(Path("tests/artifacts/test_v5.dmp")))
+
+    def test_columns(self):
+        section = self._sections[0]
+        assert section.version == 5
+        assert section.name == "BAS"
+        assert len(section) == len(section.columns["type"])
+        assert set(section.columns) == {
+            "type",
+            "head_in",
+            "head_out",
+            "length",
+            "depth_in",
+            "depth_out",
+            "pitch_in",
+            "pitch_out",
+            "left",
+            "right",
+            "up",
+            "down",
+            "temperature",
+            "hours",
+            "minutes",
+            "seconds",
+            "marker_idx",
+        }
+        assert section.column("type")[-1] == ShotType.END_OF_SURVEY
+
+    def test_scaled_column(self):
+        section = self._sections[0]
+        raw = section.columns["head_in"]
+        assert section.column("head_in") == [value / 10.0 for value in raw]
+
+    def test_unknown_column(self):
+        with pytest.raises(KeyError):
+            self._sections[0].column("unknown")
+
+    def test_missing_columns_v2(self):
+        section = decode_dmp(read_dmp_data(Path("tests/artifacts/test_v2.dmp")))[0]
+        assert "left" not in section.columns
+        assert section.column("left") == [None] * len(section)
+
+    def test_decode_single_section(self):
+        data = read_dmp_data(Path("tests/artifacts/test_v5.dmp"))
+        first = next(split_dmp_into_sections(data))
+        section = decode_section(pack_dmp_data(first))
+        assert section.columns == self._sections[0].columns
+
+    def test_invalid_magic_values(self):
+        data = read_dmp_data(Path("tests/artifacts/test_v5.dmp"))
+        data[1] = 0
+        with pytest.raises(ValueError, match="magic"):
+            decode_dmp(data)
+
+    def test_invalid_shot_type(self):
+        data = read_dmp_data(Path("tests/artifacts/test_v2.dmp"))
+        data[10] = 9  # type of the first shot
+        section = decode_dmp(data)[0]
+        with pytest.raises(ValueError, match="not a valid ShotType"):
+            list(section.iter_shot_data())
+
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError, match="Unsupported Mnemo Version"):
+            decode_dmp([1, 2, 3])
+
+    def test_out_of_range_value(self):
+        with pytest.raises(ValueError, match="signed bytes"):
+            decode_dmp([5, 300])
+
+    def test_load_invalid_sections(self):
+        dumped = dump_sections(self._sections)
+        for buffer in (b"", dumped[:-10], zlib.compress(marshal.dumps(([(5,)], [])))):
+            with pytest.raises(ValueError, match="Invalid serialized sections"):
+                load_sections(buffer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import datetime
+import io
+import itertools
+import unittest
+
+import pytest
+from parameterized import parameterized
+from parameterized import parameterized_class
+
+from mnemo_lib.codecs import get_codec
+from mnemo_lib.constants import ShotType
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.generator import iter_sections
+from mnemo_lib.models import DMPFile
+from mnemo_lib.tokenizer import tokenize_dmp
+
+
+def _generate(**kwargs) -> bytes:
+    buffer = io.BytesIO()
+    generate_dmp(buffer, **kwargs)
+    return buffer.getvalue()
+
+
+def _read(**kwargs) -> DMPFile:
+    return DMPFile.from_dmp_data(tokenize_dmp(_generate(**kwargs)))
+
+
+@parameterized_class(("version",), [(2,), (3,), (4,), (5,)])
+class GeneratorTest(unittest.TestCase):
+    version: int
+
+    def test_deterministic(self):
+        kwargs = {"version": self.version, "n_sections": 20, "seed": 7}
+        assert _generate(**kwargs) == _generate(**kwargs)
+        assert _generate(**kwargs) != _generate(**{**kwargs, "seed": 8})
+
+    def test_shots_range(self):
+        sections = list(
+            iter_sections(version=self.version, n_sections=50, shots=(2, 5))
+        )
+        assert len(sections) == 50
+        assert {section.n_shots for section in sections} <= {2, 3, 4, 5}
+
+        frame_size = get_codec(self.version).frame.size
+        header_size = get_codec(self.version).header.size
+        for section in sections:
+            assert section.corruption is None
+            assert section.raw[0] == self.version
+            assert len(section.raw) == header_size + (section.n_shots + 1) * frame_size
+
+    def test_stats(self):
+        buffer = io.BytesIO()
+        stats = generate_dmp(buffer, version=self.version, n_sections=10, shots=4)
+
+        assert stats.n_sections == 10
+        assert stats.n_shots == 40
+        assert stats.n_corrupted == 0
+        assert stats.size == len(buffer.getvalue())
+
+
+@parameterized_class(("version",), [(2,), (5,)])
+class GeneratorReadTest(unittest.TestCase):
+    version: int
+
+    def setUp(self):
+        self.dmp_file = _read(version=self.version, n_sections=100, seed=3)
+
+    def test_valid(self):
+        dmp_file = self.dmp_file
+
+        assert len(dmp_file.sections) == 100
+        for section in dmp_file.sections:
+            assert section.version == self.version
+            assert section.shots[-1].type == ShotType.END_OF_SURVEY
+            assert all(
+                shot.type != ShotType.END_OF_SURVEY for shot in section.shots[:-1]
+            )
+
+    def test_dates(self):
+        dates = [section.date for section in self.dmp_file.sections]
+        assert dates == sorted(dates)
+
+    def test_continuous_depths(self):
+        for section in self.dmp_file.sections:
+            shots = section.shots[:-1]
+            for previous, shot in itertools.pairwise(shots):
+                assert shot.depth_in == previous.depth_out
+
+
+class GeneratorCorruptionTest(unittest.TestCase):
+    def test_buggy_eos(self):
+        dmp_file = _read(
+            version=5, n_sections=20, corruption_rate=1, corruptions=["buggy_eos"]
+        )
+        reference = _read(version=5, n_sections=20)
+        assert len(dmp_file.sections) == 20
+        for section, expected in zip(
+            dmp_file.sections, reference.sections, strict=True
+        ):
+            assert section.shots[:-1] == expected.shots[:-1]
+            assert section.shots[-1].type == ShotType.END_OF_SURVEY
+            assert section.shots[-1].head_in == section.shots[-1].head_out == 180.0
+
+    def test_truncated(self):
+        data = tokenize_dmp(
+            _generate(
+                version=5, n_sections=20, corruption_rate=0.3, corruptions=["truncated"]
+            )
+        )
+        with pytest.raises(ValueError):  # noqa: PT011
+            DMPFile.from_dmp_data(data)
+
+        dmp_file = DMPFile.from_dmp_data(
+            data, uncorrupt=True, uncorrupt_date=datetime.date(2024, 1, 1)
+        )
+        assert len(dmp_file.sections) == 20
+
+    @parameterized.expand([(3,), (4,), (5,)])
+    def test_magic(self, version: int):
+        sections = list(
+            iter_sections(
+                version=version,
+                n_sections=20,
+                corruption_rate=0.5,
+                corruptions=["magic"],
+            )
+        )
+        clean = list(iter_sections(version=version, n_sections=20))
+
+        assert any(section.corruption == "magic" for section in sections)
+        for section, reference in zip(sections, clean, strict=True):
+            assert (section.raw == reference.raw) == (section.corruption is None)
+            assert len(section.raw) == len(reference.raw)
+
+    def test_magic_unreadable(self):
+        data = _generate(
+            version=5, n_sections=20, corruption_rate=0.5, corruptions=["magic"]
+        )
+        with pytest.raises(ValueError, match="magic values"):
+            DMPFile.from_dmp_data(tokenize_dmp(data))
+
+    def test_same_values(self):
+        # Corruptions do not change the values of the other sections
+        clean = list(iter_sections(version=5, n_sections=50))
+        corrupted = list(iter_sections(version=5, n_sections=50, corruption_rate=0.3))
+
+        assert {section.corruption for section in corrupted} == {
+            None,
+            "truncated",
+            "magic",
+            "buggy_eos",
+        }
+        for section, reference in zip(corrupted, clean, strict=True):
+            if section.corruption is None:
+                assert section.raw == reference.raw
+
+    @parameterized.expand(
+        [
+            ({"version": 6},),
+            ({"n_sections": -1},),
+            ({"shots": (5, 2)},),
+            ({"shots": -1},),
+            ({"corruption_rate": 1.5},),
+            ({"corruption_rate": 0.5, "corruptions": []},),
+            ({"corruptions": ["unknown"]},),
+            ({"version": 2, "corruptions": ["magic"]},),
+            ({"version": 4, "corruptions": ["buggy_eos"]},),
+            ({"start_date": datetime.datetime(2015, 1, 1)},),  # noqa: DTZ001
+            ({"start_date": datetime.datetime(2024, 1, 31)},),  # noqa: DTZ001
+        ]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):  # noqa: PT011
+            next(iter_sections(**kwargs))
+
+
+if __name__ == "__main__":
+    unittest.main()
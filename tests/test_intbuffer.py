@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import unittest
+from array import array
 
 import pytest
+from parameterized import parameterized_class
 
 from mnemo_lib.intbuffer import IntegerBuffer
 
@@ -132,3 +134,99 @@ class TestIntegerBuffer(unittest.TestCase):
         TypeError."""
         with pytest.raises(TypeError):
             IntegerBuffer([1, "two", 3.5, 4])
+
+
+@parameterized_class(
+    ("factory"),
+    [
+        (lambda data: array("b", data),),
+        (lambda data: array("b", data).tobytes(),),
+        (lambda data: bytearray(array("b", data).tobytes()),),
+        (lambda data: memoryview(array("b", data).tobytes()),),
+    ],
+)
+class TestPackedIntegerBuffer(unittest.TestCase):
+    factory: staticmethod
+
+    def setUp(self):
+        self.buffer_data = [5, 68, 89, 101, 23, 11, -8, 0, 35, -66, 48, 48]
+        self.buffer = IntegerBuffer(type(self).factory(self.buffer_data))
+
+    def test_is_packed(self):
+        assert self.buffer.is_packed
+        assert not IntegerBuffer(self.buffer_data).is_packed
+
+    def test_same_reads_as_list(self):
+        reference = IntegerBuffer(self.buffer_data)
+        assert self.buffer.read() == reference.read()
+        assert self.buffer.read(3) == reference.read(3)
+        assert self.buffer.peek(2) == reference.peek(2)
+        assert self.buffer.readInt16BE() == reference.readInt16BE()
+        assert self.buffer.readInt16BE(3) == reference.readInt16BE(3)
+        assert self.buffer.cursor == reference.cursor == 12
+        assert self.buffer[-2] == reference[-2]
+        assert len(self.buffer) == len(reference)
+
+    def test_read_int16be_bulk(self):
+        self.buffer.seek(6)
+        assert self.buffer.readInt16BE(3) == [-2048, 9150, 12336]
+
+        self.buffer.seek(6)
+        assert [self.buffer.readInt16BE() for _ in range(3)] == [-2048, 9150, 12336]
+
+    def test_read_int16be_beyond_buffer(self):
+        self.buffer.seek(8)
+        with pytest.raises(IndexError):
+            self.buffer.readInt16BE(3)
+        assert self.buffer.cursor == 8
+
+    def test_read_buffer(self):
+        self.buffer.read()
+        sub_buffer = self.buffer.read_buffer(4)
+        assert self.buffer.cursor == 5
+        assert sub_buffer.cursor == 0
+        assert len(sub_buffer) == 4
+        assert sub_buffer.read(4) == [68, 89, 101, 23]
+
+        with pytest.raises(IndexError):
+            sub_buffer.read()
+
+        with pytest.raises(IndexError):
+            self.buffer.read_buffer(len(self.buffer_data))
+
+    def test_read_beyond_buffer(self):
+        with pytest.raises(IndexError):
+            self.buffer.read(len(self.buffer_data) + 1)
+
+    def test_seek_and_reset(self):
+        self.buffer.seek(5)
+        assert self.buffer.read() == 11
+        self.buffer.reset()
+        assert self.buffer.read() == 5
+
+        with pytest.raises(IndexError):
+            self.buffer.seek(len(self.buffer_data))
+
+
+class TestIntegerBufferStorage(unittest.TestCase):
+    def test_shared_storage(self):
+        data = bytearray(array("b", [1, 2, 3, 4]).tobytes())
+        buffer = IntegerBuffer(data)
+        sub_buffer = buffer.read_buffer(2)
+
+        data[1] = 42
+        assert buffer[1] == 42
+        assert sub_buffer[1] == 42
+
+    def test_read_buffer_from_list(self):
+        buffer = IntegerBuffer([1, 2, 3, 4])
+        buffer.read()
+        assert buffer.read_buffer(2).read(2) == [2, 3]
+
+    def test_invalid_array_typecode(self):
+        with pytest.raises(TypeError):
+            IntegerBuffer(array("h", [1, 2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import datetime
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from mnemo_lib.cache import DMPCache
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.memo import DMPMemo
+from mnemo_lib.memo import MemoStats
+from mnemo_lib.models import DMPFile
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.writers import dmp_bytes_to_text
+
+ARTIFACTS = (
+    "tests/artifacts/test_v2.dmp",
+    "tests/artifacts/test_v5.dmp",
+    "tests/artifacts/test_v5_buggy_EOS.dmp",
+)
+
+
+class DMPMemoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+        self._memo = DMPMemo()
+
+        self._files = []
+        for artifact in ARTIFACTS:
+            shutil.copy(artifact, self._temp_dir)
+            self._files.append(self._temp_dir / Path(artifact).name)
+
+        self._expected = {
+            filepath: DMPFile.from_dmp(filepath).to_json() for filepath in self._files
+        }
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def test_hit(self):
+        for filepath in self._files:
+            for _ in range(2):
+                dmp_file = DMPFile.from_dmp(filepath, memo=self._memo)
+                assert dmp_file.to_json() == self._expected[filepath]
+
+        stats = self._memo.stats
+        assert stats.hits == len(self._files)
+        assert stats.misses == len(self._files)
+        assert stats.evictions == 0
+        assert stats.entries == len(self._files)
+        assert stats.size > 0
+
+    def test_same_entry_for_path_aliases(self):
+        filepath = self._files[0]
+        DMPFile.from_dmp(filepath, memo=self._memo)
+        DMPFile.from_dmp(
+            filepath.parent / ".." / filepath.parent.name / filepath.name,
+            memo=self._memo,
+        )
+        assert self._memo.stats.hits == 1
+
+    def test_mutations_do_not_leak(self):
+        filepath = self._files[1]
+
+        # Same modifications as `mnemo correct`
+        for _ in range(2):
+            dmp_file = DMPFile.from_dmp(filepath, memo=self._memo)
+            assert dmp_file.to_json() == self._expected[filepath]
+
+            for section in dmp_file.sections:
+                section.date = section.date.replace(year=2020)
+                for shot in section.shots:
+                    shot.length = round(shot.length * 2, ndigits=2)
+            section.shots.pop()
+
+    def test_modified_file(self):
+        filepath = self._files[1]
+        DMPFile.from_dmp(filepath, memo=self._memo)
+
+        # Same size, different content and modification time
+        shutil.copy(self._files[2], filepath)
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        dmp_file = DMPFile.from_dmp(filepath, memo=self._memo)
+        assert dmp_file.to_json() == self._expected[self._files[2]]
+        assert self._memo.stats.hits == 0
+
+    def test_invalidate(self):
+        for filepath in self._files:
+            DMPFile.from_dmp(filepath, memo=self._memo)
+
+        assert self._memo.invalidate(self._files[0]) == 1
+        assert self._memo.invalidate(self._files[0]) == 0
+        assert len(self._memo) == len(self._files) - 1
+
+        assert self._memo.invalidate() == len(self._files) - 1
+        assert len(self._memo) == 0
+        assert self._memo.stats.size == 0
+
+    def test_eviction_by_count(self):
+        memo = DMPMemo(max_entries=2)
+        for filepath in self._files:
+            DMPFile.from_dmp(filepath, memo=memo)
+
+        assert memo.stats.evictions == 1
+        assert len(memo) == 2
+
+        # The first file was the least recently used one
+        DMPFile.from_dmp(self._files[0], memo=memo)
+        assert memo.stats.hits == 0
+
+    def test_eviction_by_size(self):
+        memo = DMPMemo()
+        DMPFile.from_dmp(self._files[1], memo=memo)
+        memo.max_size = memo.stats.size
+
+        DMPFile.from_dmp(self._files[1], memo=memo)  # most recently used
+        DMPFile.from_dmp(self._files[2], memo=memo)
+
+        assert memo.stats.evictions >= 1
+        assert memo.stats.size <= memo.max_size
+
+    def test_unvalidated_files_not_stored(self):
+        DMPFile.from_dmp(self._files[0], validate="none", memo=self._memo)
+        assert len(self._memo) == 0
+
+        # Stored once validated
+        dmp_file = DMPFile.from_dmp(
+            self._files[0], validate="deferred", memo=self._memo
+        )
+        assert len(self._memo) == 0
+
+        # Copies are not bound to the memo
+        copy = pickle.loads(pickle.dumps(dmp_file))  # noqa: S301
+        copy.ensure_validated()
+        assert len(self._memo) == 0
+
+        dmp_file.ensure_validated()
+        assert len(self._memo) == 1
+        assert copy == dmp_file
+
+    def test_generated(self):
+        # Pitches and temperatures below -25.6 are not encoded back as read
+        filepath = self._temp_dir / "generated.dmp"
+        with filepath.open(mode="wb") as file:
+            generate_dmp(file, n_sections=20, seed=3)
+
+        cold = DMPFile.from_dmp(filepath)
+        for _ in range(2):
+            assert DMPFile.from_dmp(filepath, memo=self._memo) == cold
+        assert self._memo.stats.hits == 1
+
+    def test_uncorrupt(self):
+        data = read_dmp_file(self._files[1])
+        filepath = self._temp_dir / "truncated.dmp"
+        filepath.write_bytes(dmp_bytes_to_text(data[: len(data) * 2 // 3].tobytes()))
+
+        date = datetime.date(2024, 1, 31)
+        cold = DMPFile.from_dmp(filepath, uncorrupt=True, uncorrupt_date=date)
+        for _ in range(2):
+            dmp_file = DMPFile.from_dmp(
+                filepath, uncorrupt=True, uncorrupt_date=date, memo=self._memo
+            )
+            assert dmp_file == cold
+            assert dmp_file.to_json() == cold.to_json()
+        assert self._memo.stats.hits == 1
+
+    def test_filled_by_cache_hits(self):
+        filepath = self._files[1]
+        cache = DMPCache(self._temp_dir / "cache")
+        DMPFile.from_dmp(filepath, cache=cache)
+
+        for _ in range(2):
+            dmp_file = DMPFile.from_dmp(filepath, cache=cache, memo=self._memo)
+            assert dmp_file.to_json() == self._expected[filepath]
+        assert self._memo.stats.hits == 1
+
+    def test_thread_safety(self):
+        def load(idx: int) -> str:
+            filepath = self._files[idx % len(self._files)]
+            return DMPFile.from_dmp(filepath, memo=self._memo).to_json()
+
+        n_calls = 60
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(load, range(n_calls)))
+
+        for idx, result in enumerate(results):
+            assert result == self._expected[self._files[idx % len(self._files)]]
+
+        stats = self._memo.stats
+        assert stats.hits + stats.misses == n_calls
+        assert stats.entries == len(self._files)
+
+    def test_clear(self):
+        DMPFile.from_dmp(self._files[0], memo=self._memo)
+        self._memo.clear()
+        assert self._memo.stats == MemoStats(0, 0, 0, 0, 0)
+
+    def test_undecodable_entry(self):
+        filepath = self._files[1]
+        key = DMPMemo.make_key(filepath)
+
+        self._memo.put_entry(key, b"not serialized sections")
+
+        # Dropped and decoded again from the file
+        assert self._memo.get(key) is None
+        assert self._memo.stats == MemoStats(
+            hits=0, misses=1, evictions=0, entries=0, size=0
+        )
+        dmp_file = DMPFile.from_dmp(filepath, memo=self._memo)
+        assert dmp_file.to_json() == self._expected[filepath]
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            DMPMemo(max_entries=0)
+
+        with pytest.raises(ValueError, match="max_size"):
+            DMPMemo(max_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
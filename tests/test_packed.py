@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import io
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+from parameterized import parameterized_class
+
+from mnemo_lib.models import DMPFile
+from mnemo_lib.packed import PACKED_MAGIC
+from mnemo_lib.packed import PackedDMP
+from mnemo_lib.packed import pack_dmp_file
+from mnemo_lib.packed import unpack_dmp_file
+from mnemo_lib.packed import write_packed
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import find_section_offsets
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class PackedFormatTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+        self._dmp_file = DMPFile.from_dmp(self.filepath)
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def test_round_trip(self):
+        packed = self._temp_dir / "file.pdmp"
+        self._dmp_file.to_packed(packed)
+
+        for validate in ("full", "deferred", "none"):
+            dmp_file = DMPFile.from_packed(packed, validate=validate)
+            assert dmp_file.to_json() == self._dmp_file.to_json()
+
+    def test_text_conversion_is_lossless(self):
+        packed = self._temp_dir / "file.pdmp"
+        text = self._temp_dir / "file.dmp"
+
+        assert pack_dmp_file(self.filepath, packed) == len(self._dmp_file.sections)
+        assert unpack_dmp_file(packed, text) == len(self._dmp_file.sections)
+        assert text.read_bytes() == Path(self.filepath).read_bytes()
+
+    def test_same_file_as_to_packed(self):
+        from_text = self._temp_dir / "from_text.pdmp"
+        from_model = self._temp_dir / "from_model.pdmp"
+
+        pack_dmp_file(self.filepath, from_text)
+        self._dmp_file.to_packed(from_model)
+        assert from_text.read_bytes() == from_model.read_bytes()
+
+    def test_mapped_sections(self):
+        packed = self._temp_dir / "file.pdmp"
+        self._dmp_file.to_packed(packed)
+
+        data = read_dmp_file(self.filepath).tobytes()
+        with PackedDMP(packed) as packed_dmp:
+            assert len(packed_dmp) == len(self._dmp_file.sections)
+            assert packed_dmp.version == self._dmp_file.sections[0].version
+            assert packed_dmp.bounds == find_section_offsets(data)
+            assert packed_dmp.data == data
+
+
+class PackedFormatErrorsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir_ctx = tempfile.TemporaryDirectory()
+        self._temp_dir = Path(self._temp_dir_ctx.__enter__())
+        self._packed = self._temp_dir / "file.pdmp"
+        pack_dmp_file("tests/artifacts/test_v5.dmp", self._packed)
+
+    def tearDown(self) -> None:
+        self._temp_dir_ctx.__exit__(None, None, None)
+
+    def _corrupt(self, offset: int, value: bytes) -> None:
+        raw = bytearray(self._packed.read_bytes())
+        raw[offset : offset + len(value)] = value
+        self._packed.write_bytes(raw)
+
+    def test_file_not_found(self):
+        with pytest.raises(FileNotFoundError):
+            DMPFile.from_packed(self._temp_dir / "missing.pdmp")
+
+    def test_empty_file(self):
+        self._packed.write_bytes(b"")
+        with pytest.raises(ValueError, match="empty"):
+            PackedDMP(self._packed)
+
+    def test_text_file(self):
+        with pytest.raises(ValueError, match="magic"):
+            PackedDMP("tests/artifacts/test_v5.dmp")
+
+    def test_unsupported_format_version(self):
+        self._corrupt(len(PACKED_MAGIC), struct.pack("<H", 99))
+        with pytest.raises(ValueError, match="format version"):
+            PackedDMP(self._packed)
+
+    def test_truncated_offset_table(self):
+        self._corrupt(len(PACKED_MAGIC) + 4, struct.pack("<I", 10**6))
+        with pytest.raises(ValueError, match="truncated"):
+            PackedDMP(self._packed)
+
+    def test_section_out_of_data(self):
+        self._corrupt(24, struct.pack("<Q", 10**9))
+        with pytest.raises(ValueError, match="out of the data"):
+            PackedDMP(self._packed)
+
+    def test_decoding_error_closes_file(self):
+        # Corrupted section magic values, detected on decoding
+        with PackedDMP(self._packed) as packed:
+            data_start = self._packed.stat().st_size - len(packed.data)
+        self._corrupt(data_start + 1, b"\x00")
+
+        with pytest.raises(ValueError, match="magic"):
+            DMPFile.from_packed(self._packed)
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError, match="out of the data"):
+            write_packed(io.BytesIO(), b"\x05", [(0, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
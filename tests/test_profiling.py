@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import io
+import pstats
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized_class
+
+from mnemo_lib import profiling
+from mnemo_lib.cache import DMPCache
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.profiling import phase
+from mnemo_lib.profiling import profile
+from mnemo_lib.tokenizer import tokenize_dmp
+
+
+class PhaseTest(unittest.TestCase):
+    def test_disabled(self):
+        with phase("decode", n_bytes=10) as decode_phase:
+            decode_phase.add(n_shots=5)
+
+        assert profiling._active is None  # noqa: SLF001
+
+    def test_record(self):
+        with profile() as profiler:
+            for _ in range(3):
+                with phase("decode", n_bytes=10) as decode_phase:
+                    decode_phase.add(n_shots=5)
+
+        stats = profiler.phases["decode"]
+        assert stats.calls == 3
+        assert stats.n_bytes == 30
+        assert stats.n_shots == 15
+        assert 0 < stats.seconds <= profiler.elapsed
+
+        # Not recorded once the block is left
+        with phase("decode"):
+            pass
+        assert profiler.phases["decode"].calls == 3
+
+    def test_nested(self):
+        with profile() as profiler, phase("outer"):
+            time.sleep(0.01)
+            with phase("inner"):
+                time.sleep(0.05)
+
+        outer = profiler.phases["outer"].seconds
+        inner = profiler.phases["inner"].seconds
+        assert 0.01 <= outer < 0.05 <= inner
+        assert outer + inner <= profiler.elapsed
+
+    def test_nested_profiles(self):
+        with profile() as outer:
+            with profile() as inner, phase("decode"):
+                pass
+            with phase("split"):
+                pass
+
+        assert list(inner.phases) == ["decode"]
+        assert list(outer.phases) == ["split"]
+        assert profiling._active is None  # noqa: SLF001
+
+    def test_threads(self):
+        def work():
+            with phase("outer"):
+                time.sleep(0.01)
+
+        with profile() as profiler, phase("inner"):
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Phases of other threads are not nested in the phases of this one
+        assert profiler.phases["outer"].calls == 4
+        assert profiler.phases["inner"].seconds >= 0.01
+
+    def test_format(self):
+        with profile() as profiler, phase("decode", n_bytes=1000, n_shots=10):
+            time.sleep(0.01)
+
+        lines = profiler.format().splitlines()
+        assert lines[0].split() == [
+            "phase",
+            "calls",
+            "seconds",
+            "share",
+            "MB/s",
+            "shots/s",
+        ]
+        assert lines[1].split()[:2] == ["decode", "1"]
+        assert lines[-2].startswith("other")
+        assert lines[-1].startswith("total")
+
+
+@parameterized_class(
+    ("input_file"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+    ],
+)
+class ProfileDMPFileTest(unittest.TestCase):
+    input_file: str
+
+    def test_from_dmp(self):
+        with profile() as profiler:
+            dmp_file = DMPFile.from_dmp(self.input_file)
+            dmp_file.to_json()
+
+        n_shots = sum(len(section.shots) for section in dmp_file.sections)
+        phases = profiler.phases
+
+        assert list(phases) == [
+            "read",
+            "tokenize",
+            "split",
+            "decode",
+            "validate",
+            "serialize",
+        ]
+        assert phases["read"].n_bytes == Path(self.input_file).stat().st_size
+        assert phases["validate"].calls == len(dmp_file.sections)
+        assert phases["validate"].n_shots == n_shots
+        assert phases["serialize"].n_shots == n_shots
+        assert sum(stats.seconds for stats in phases.values()) <= profiler.elapsed
+
+    def test_iter_sections(self):
+        with profile() as profiler:
+            sections = list(DMPFile.iter_sections(self.input_file))
+
+        assert profiler.phases["decode"].calls == len(sections)
+        assert profiler.phases["validate"].n_shots == sum(
+            len(section.shots) for section in sections
+        )
+
+    def test_cache_read(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DMPCache(Path(tmp_dir) / "cache")
+            for _ in ("miss", "hit"):
+                with profile() as profiler:
+                    DMPFile.from_dmp(self.input_file, cache=cache)
+
+                read = profiler.phases["read"]
+                assert read.calls == 1
+                assert read.n_bytes == Path(self.input_file).stat().st_size
+
+    def test_pstats(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pstats_file = Path(tmp_dir) / "profile.pstats"
+            with profile(pstats_file=pstats_file):
+                DMPFile.from_dmp(self.input_file)
+
+            stats = pstats.Stats(str(pstats_file))
+            assert any(
+                function == "from_dmp"
+                for _, _, function in stats.stats  # pyright: ignore[reportAttributeAccessIssue]
+            )
+
+
+class ProfileBatchesTest(unittest.TestCase):
+    def test_decode_bytes(self):
+        buffer = io.BytesIO()
+        generate_dmp(buffer, n_sections=2000, seed=1)
+        data = tokenize_dmp(buffer.getvalue())
+
+        phases = []
+        for progress in (None, lambda _: None):
+            with profile() as profiler:
+                DMPFile.from_dmp_data(data, progress=progress)
+            phases.append(profiler.phases["decode"])
+
+        # Every batch only counts its own sections
+        assert phases[0].calls == 1 < phases[1].calls
+        assert phases[0].n_bytes == phases[1].n_bytes <= len(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import datetime
+import gc
+import io
+import threading
+import tracemalloc
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from parameterized import parameterized
+from parameterized import parameterized_class
+
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.progress import CancellationToken
+from mnemo_lib.progress import DecodingCancelledError
+from mnemo_lib.progress import Progress
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.tokenizer import tokenize_dmp
+
+
+def _generated_data(version: int = 5, n_sections: int = 2000) -> bytes:
+    """Packed synthetic stream of several progress intervals."""
+    buffer = io.BytesIO()
+    generate_dmp(buffer, version=version, n_sections=n_sections, seed=1)
+    return tokenize_dmp(buffer.getvalue()).tobytes()
+
+
+class CancellationTokenTest(unittest.TestCase):
+    def test_cancel(self):
+        token = CancellationToken()
+        assert not token.cancelled
+        token.raise_if_cancelled()
+
+        token.cancel()
+        assert token.cancelled
+        with pytest.raises(DecodingCancelledError):
+            token.raise_if_cancelled()
+
+    def test_fraction(self):
+        assert Progress("decode", 25, 100, 1, 10).fraction == 0.25
+        assert Progress("decode", 0, 0, 0, 0).fraction == 1.0
+
+
+@parameterized_class(
+    ("filepath", "uncorrupt"),
+    [
+        ("tests/artifacts/test_v2.dmp", False),
+        ("tests/artifacts/test_v5.dmp", False),
+        ("tests/artifacts/test_v5.dmp", True),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp", False),
+    ],
+)
+class ProgressArtifactsTest(unittest.TestCase):
+    filepath: str
+    uncorrupt: bool
+
+    def from_dmp(self, **kwargs) -> DMPFile:
+        return DMPFile.from_dmp(
+            self.filepath,
+            uncorrupt=self.uncorrupt,
+            uncorrupt_date=datetime.date(2024, 1, 1) if self.uncorrupt else None,
+            **kwargs,
+        )
+
+    @parameterized.expand([("full",), ("deferred",), ("none",)])
+    def test_identical(self, validate):
+        expected = self.from_dmp(validate=validate)
+        dmp_file = self.from_dmp(
+            validate=validate, progress=lambda _: None, cancel=CancellationToken()
+        )
+        dmp_file.ensure_validated()
+        expected.ensure_validated()
+        assert dmp_file == expected
+
+    def test_progress(self):
+        events: list[Progress] = []
+        dmp_file = self.from_dmp(progress=events.append)
+
+        assert [event.stage for event in events] == sorted(
+            (event.stage for event in events),
+            key=["read", "split", "decode"].index,
+        )
+
+        read = [event for event in events if event.stage == "read"]
+        assert read[-1].n_bytes == read[-1].total_bytes
+        assert read[-1].total_bytes == Path(self.filepath).stat().st_size
+
+        split = [event for event in events if event.stage == "split"]
+        assert split[-1].n_bytes == split[-1].total_bytes
+        assert split[-1].n_sections == len(dmp_file.sections)
+
+        decode = [event for event in events if event.stage == "decode"]
+        assert decode[-1].n_sections == len(dmp_file.sections)
+        if not self.uncorrupt:
+            assert decode[-1].n_shots == sum(
+                len(section.shots) for section in dmp_file.sections
+            )
+
+    def test_cancelled_upfront(self):
+        token = CancellationToken()
+        token.cancel()
+
+        events: list[Progress] = []
+        with pytest.raises(DecodingCancelledError):
+            self.from_dmp(progress=events.append, cancel=token)
+
+        assert not events
+
+
+class ProgressLargeTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = _generated_data()
+
+    def test_monotonic(self):
+        events: list[Progress] = []
+        dmp_file = DMPFile.from_dmp_data(self.data, progress=events.append)
+
+        for stage in ("split", "decode"):
+            stage_events = [event for event in events if event.stage == stage]
+            assert len(stage_events) > 2
+
+            for field in ("n_bytes", "n_sections", "n_shots"):
+                values = [getattr(event, field) for event in stage_events]
+                assert values == sorted(values)
+
+            assert stage_events[-1].n_sections == len(dmp_file.sections) == 2000
+            assert stage_events[-1].total_bytes == len(self.data)
+
+    def test_cancel_from_callback(self):
+        token = CancellationToken()
+        events: list[Progress] = []
+
+        def progress(event: Progress) -> None:
+            events.append(event)
+            if event.stage == "decode":
+                token.cancel()
+
+        with pytest.raises(DecodingCancelledError):
+            DMPFile.from_dmp_data(self.data, progress=progress, cancel=token)
+
+        # Stopped right after the first batch
+        assert [event.stage for event in events].count("decode") == 1
+        assert events[-1].n_sections < 2000
+
+    def test_cancel_split(self):
+        token = CancellationToken()
+
+        def progress(event: Progress) -> None:
+            assert event.stage == "split"
+            token.cancel()
+
+        with pytest.raises(DecodingCancelledError):
+            DMPFile.from_dmp_data(self.data, progress=progress, cancel=token)
+
+    def test_cancel_from_thread(self):
+        token = CancellationToken()
+        started = threading.Event()
+
+        def progress(event: Progress) -> None:
+            started.set()
+
+        def cancel() -> None:
+            started.wait()
+            token.cancel()
+
+        def decode_until_cancelled() -> None:
+            for _ in range(1000):
+                DMPFile.from_dmp_data(self.data, progress=progress, cancel=token)
+
+        thread = threading.Thread(target=cancel)
+        thread.start()
+        try:
+            with pytest.raises(DecodingCancelledError):
+                decode_until_cancelled()
+        finally:
+            thread.join()
+
+    def test_cancel_workers(self):
+        token = CancellationToken()
+
+        def progress(event: Progress) -> None:
+            if event.stage == "decode":
+                token.cancel()
+
+        with pytest.raises(DecodingCancelledError):
+            DMPFile.from_dmp_data(self.data, workers=2, progress=progress, cancel=token)
+
+    def test_progress_workers(self):
+        events: list[Progress] = []
+        dmp_file = DMPFile.from_dmp_data(self.data, workers=2, progress=events.append)
+
+        assert dmp_file == DMPFile.from_dmp_data(self.data)
+        assert events[-1].stage == "decode"
+        assert events[-1].n_sections == 2000
+
+    def test_callback_error(self):
+        def progress(event: Progress) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            DMPFile.from_dmp_data(self.data, progress=progress)
+
+    def test_memory_released(self):
+        token = CancellationToken()
+
+        def progress(event: Progress) -> None:
+            if event.stage == "decode" and event.n_bytes > len(self.data) // 2:
+                token.cancel()
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            with pytest.raises(DecodingCancelledError):
+                DMPFile.from_dmp_data(self.data, progress=progress, cancel=token)
+            gc.collect()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # The sections decoded before the cancellation are not kept
+        assert retained - baseline < (peak - baseline) / 10
+
+    def test_read_cancel(self):
+        with TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir) / "generated.dmp"
+            with filepath.open(mode="wb") as file:
+                generate_dmp(file, n_sections=2000, seed=1)
+
+            token = CancellationToken()
+            events: list[Progress] = []
+
+            def progress(event: Progress) -> None:
+                events.append(event)
+                token.cancel()
+
+            with pytest.raises(DecodingCancelledError):
+                read_dmp_file(
+                    filepath, chunk_size=1 << 16, progress=progress, cancel=token
+                )
+
+            assert len(events) == 1
+            assert events[0].stage == "read"
+            assert 0 < events[0].n_bytes < events[0].total_bytes
+
+
+if __name__ == "__main__":
+    unittest.main()
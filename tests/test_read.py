@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import datetime
 import hashlib
 import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
 from parameterized import parameterized_class
+from pydantic import ValidationError
 
 from mnemo_lib.models import DMPFile
+from mnemo_lib.tokenizer import read_dmp_file
 
 
 def sha256sum(filepath: str | Path):
@@ -60,6 +64,112 @@ class ReadDMPFileTest(unittest.TestCase):
 
             assert target_hash.hexdigest() == sha256sum(self._file.with_suffix(".json"))
 
+    def test_iter_sections(self):
+        for chunk_size in (1, 7, 100, 1 << 20):
+            sections = list(DMPFile.iter_sections(self._file, chunk_size=chunk_size))
+            assert sections == self._dmp_data.sections
+
+    def test_iter_sections_early_stop(self):
+        sections = list(DMPFile.iter_sections(self._file, max_sections=2))
+        assert sections == self._dmp_data.sections[:2]
+
+        assert not list(DMPFile.iter_sections(self._file, max_sections=0))
+
+    def test_iter_sections_file_not_found(self):
+        with pytest.raises(FileNotFoundError):
+            next(DMPFile.iter_sections("does_not_exist.dmp"))
+
+    def test_validation_modes(self):
+        for validate in ("full", "deferred", "none"):
+            dmp_file = DMPFile.from_dmp(self._file, validate=validate)
+            assert dmp_file.to_json() == self._dmp_data.to_json()
+            assert dmp_file.to_dmp() == self._dmp_data.to_dmp()
+            assert dmp_file == self._dmp_data
+            # Trusted models hold their fields in the same order
+            assert dmp_file.model_dump_json() == self._dmp_data.model_dump_json()
+            assert repr(dmp_file) == repr(self._dmp_data)
+
+    def test_parallel_decoding(self):
+        for workers in (2, 3):
+            for validate in ("full", "none"):
+                dmp_file = DMPFile.from_dmp(
+                    self._file, validate=validate, workers=workers
+                )
+                assert dmp_file == self._dmp_data
+                assert repr(dmp_file) == repr(self._dmp_data)
+
+        with pytest.raises(ValueError, match="workers"):
+            DMPFile.from_dmp(self._file, workers=0)
+
+    def test_parallel_decoding_uncorrupt(self):
+        if self._dmp_data.sections[0].version == 2:
+            self.skipTest("Uncorrupt is not supported by DMP version 2.")
+
+        date = datetime.date(2024, 2, 29)
+        assert DMPFile.from_dmp(
+            self._file, uncorrupt=True, uncorrupt_date=date, workers=2
+        ) == DMPFile.from_dmp(self._file, uncorrupt=True, uncorrupt_date=date)
+
+    def test_from_json(self):
+        json_fp = self._file.with_suffix(".json")
+        expected = DMPFile.from_json(json_fp)
+        for validate in ("full", "deferred", "none"):
+            dmp_file = DMPFile.from_json(json_fp, validate=validate)
+            assert dmp_file.to_json() == json_fp.read_text()
+            assert dmp_file.to_dmp() == self._dmp_data.to_dmp()
+            assert repr(dmp_file) == repr(expected)
+
+    def test_from_json_file_not_found(self):
+        with pytest.raises(FileNotFoundError):
+            DMPFile.from_json("does_not_exist.json")
+
+
+class ValidationModesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._data = read_dmp_file("tests/artifacts/test_v5.dmp")
+        # First shot `pitch_in` MSB: header (13) + magic (3) + type (1) + 5 Int16BE
+        self._data[27] = 10  # pitch_in > 90
+
+    def test_full(self):
+        with pytest.raises(ValidationError):
+            DMPFile.from_dmp_data(self._data)
+
+    def test_full_parallel(self):
+        with pytest.raises(ValidationError):
+            DMPFile.from_dmp_data(self._data, workers=2)
+
+    def test_deferred(self):
+        dmp_file = DMPFile.from_dmp_data(self._data, validate="deferred")
+        with pytest.raises(ValidationError):
+            _ = dmp_file.sections
+
+    def test_deferred_dump(self):
+        for dump in (
+            DMPFile.model_dump,
+            DMPFile.model_dump_json,
+            lambda dmp_file: dmp_file == DMPFile([]),
+        ):
+            dmp_file = DMPFile.from_dmp_data(self._data, validate="deferred")
+            with pytest.raises(ValidationError):
+                dump(dmp_file)
+
+    def test_from_json_full(self):
+        dmp_file = DMPFile.from_dmp_data(self._data, validate="none")
+        with TemporaryDirectory() as tmp_dir:
+            json_fp = Path(tmp_dir) / "invalid.json"
+            dmp_file.to_json(json_fp)
+
+            with pytest.raises(ValidationError):
+                DMPFile.from_json(json_fp)
+
+            dmp_file = DMPFile.from_json(json_fp, validate="deferred")
+            with pytest.raises(ValidationError):
+                dmp_file.to_dmp()
+
+    def test_none(self):
+        dmp_file = DMPFile.from_dmp_data(self._data, validate="none")
+        assert dmp_file.sections[0].shots[0].pitch_in > 90
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime
+import io
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from parameterized import parameterized_class
+from pydantic import ValidationError
+
+from mnemo_lib.corrections import Corrections
+from mnemo_lib.corrections import apply_corrections
+from mnemo_lib.generator import generate_dmp
+from mnemo_lib.models import DMPFile
+from mnemo_lib.table import SectionTable
+from mnemo_lib.table import ShotTable
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.tokenizer import tokenize_dmp
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class SectionTableTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._dmp_file = DMPFile.from_dmp(self.filepath)
+        self._table = SectionTable.from_dmp(self.filepath)
+
+    def test_shape(self):
+        assert len(self._table) == len(self._dmp_file.sections)
+        assert len(self._table.shots) == sum(
+            len(section.shots) for section in self._dmp_file.sections
+        )
+        assert self._table.offsets[-1] == len(self._table.shots)
+
+    def test_to_json(self):
+        assert self._table.to_json() == self._dmp_file.to_json()
+
+        with TemporaryDirectory() as tmp_dir:
+            table_fp = Path(tmp_dir) / "table.json"
+            assert self._table.to_json(table_fp) == self._dmp_file.to_json()
+            assert table_fp.read_text() == self._dmp_file.to_json()
+
+    def test_to_dmp(self):
+        assert self._table.to_dmp() == self._dmp_file.to_dmp()
+
+        with TemporaryDirectory() as tmp_dir:
+            table_fp = Path(tmp_dir) / "table.dmp"
+            model_fp = Path(tmp_dir) / "model.dmp"
+            assert self._table.to_dmp(table_fp) is None
+            self._dmp_file.to_dmp(model_fp)
+
+            assert table_fp.read_bytes() == model_fp.read_bytes()
+            data = self._table.to_dmp(table_fp, return_data=True)
+            assert data == self._dmp_file.to_dmp()
+
+    def test_to_dmpfile(self):
+        assert self._table.to_dmpfile() == self._dmp_file
+
+    def test_from_dmpfile(self):
+        table = SectionTable.from_dmpfile(self._dmp_file)
+        assert table.to_json() == self._dmp_file.to_json()
+        assert table.to_dmp() == self._dmp_file.to_dmp()
+
+    def test_corrections(self):
+        self._table.set_date(datetime.date(2025, 2, 17))
+        self._table.shots.scale_length(1.37)
+        self._table.shots.offset_compass(17)
+        self._table.shots.offset_depth(-3.456)
+        self._table.shots.reverse_azimuth()
+
+        for section in self._dmp_file.sections:
+            section.date = section.date.replace(year=2025, month=2, day=17)
+            for shot in section.shots:
+                shot.length = round(shot.length * 1.37, ndigits=2)
+                shot.head_in = round((shot.head_in + 17) % 360, ndigits=1)
+                shot.head_out = round((shot.head_out + 17) % 360, ndigits=1)
+                shot.depth_in = round(shot.depth_in - 3.456, ndigits=2)
+                shot.depth_out = round(shot.depth_out - 3.456, ndigits=2)
+                shot.head_in = round((shot.head_in + 180) % 360, ndigits=0)
+                shot.head_out = round((shot.head_out + 180) % 360, ndigits=0)
+
+        assert self._table.to_json() == self._dmp_file.to_json()
+        assert self._table.to_dmp() == self._dmp_file.to_dmp()
+
+    def test_corrections_api(self):
+        self._table.shots.scale_length(1.37)
+        self._table.shots.offset_compass(17)
+        self._table.shots.reverse_azimuth()
+
+        apply_corrections(
+            self._dmp_file,
+            Corrections(length_scaling=1.37, compass_offset=17, reverse_azimuth=True),
+        )
+
+        assert self._table.to_json() == self._dmp_file.to_json()
+
+
+class ShotTableTest(unittest.TestCase):
+    def test_empty(self):
+        assert len(ShotTable()) == 0
+        assert SectionTable().to_json() == DMPFile([]).to_json()
+
+    def test_to_json_generated(self):
+        for version in (2, 5):
+            buffer = io.BytesIO()
+            generate_dmp(buffer, version=version, n_sections=50, seed=version)
+            data = tokenize_dmp(buffer.getvalue())
+
+            table = SectionTable.from_dmp_data(data)
+            assert table.to_json() == DMPFile.from_dmp_data(data).to_json()
+
+    def test_missing_column(self):
+        columns = ShotTable().columns
+        del columns["type"]
+        with pytest.raises(ValueError, match="one column per shot field"):
+            ShotTable(columns)
+
+    def test_uneven_columns(self):
+        columns = ShotTable().columns
+        columns["type"].append(2)
+        with pytest.raises(ValueError, match="same length"):
+            ShotTable(columns)
+
+    def test_validate(self):
+        data = read_dmp_file("tests/artifacts/test_v5.dmp")
+        data[27] = 10  # first shot `pitch_in` > 90, see `test_read`
+
+        assert SectionTable.from_dmp_data(data).shots.column("pitch_in")[0] > 90
+        with pytest.raises(ValidationError):
+            SectionTable.from_dmp_data(data, validate=True)
+
+    def test_out_of_range_correction(self):
+        table = SectionTable.from_dmp("tests/artifacts/test_v5.dmp")
+        with pytest.raises(ValueError, match="Int16BE"):
+            table.shots.scale_length(1e6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+import unittest
+from pathlib import Path
+
+import pytest
+from parameterized import parameterized
+
+from mnemo_lib.tokenizer import iter_dmp_chunks
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.tokenizer import tokenize_dmp
+
+
+def legacy_tokenize(raw: bytes) -> list[int]:
+    return [int(i) for i in raw.decode("ascii").strip().split(";") if i != ""]
+
+
+class TokenizerTest(unittest.TestCase):
+    @parameterized.expand(  # pyright: ignore[reportUnknownMemberType]
+        [
+            (b"5;68;89;101;",),
+            (b"  5;68;-89\n",),
+            (b"127;-128",),
+            (b"1;;2;",),
+            (b" 1 ; 02 ;+3;",),
+            (b"5",),
+            (b"\n\n",),
+            (b"",),
+        ]
+    )
+    def test_same_as_legacy(self, raw: bytes):
+        assert tokenize_dmp(raw).tolist() == legacy_tokenize(raw)
+
+        for chunk_size in range(1, 8):
+            values = [
+                value
+                for chunk in iter_dmp_chunks(io.BytesIO(raw), chunk_size=chunk_size)
+                for value in chunk
+            ]
+            assert values == legacy_tokenize(raw)
+
+    @parameterized.expand(  # pyright: ignore[reportUnknownMemberType]
+        [
+            (b"1;2;abc;4", b"abc", 4),
+            (b"1;200;", b"200", 2),
+            (b"  1;2;3x", b"3x", 6),
+        ]
+    )
+    def test_malformed_token(self, raw: bytes, token: bytes, offset: int):
+        match = f"Malformed DMP token {token!r} at byte offset {offset}"
+
+        with pytest.raises(ValueError, match=match):
+            tokenize_dmp(raw)
+
+        for chunk_size in range(1, 8):
+            with pytest.raises(ValueError, match=match):
+                list(iter_dmp_chunks(io.BytesIO(raw), chunk_size=chunk_size))
+
+    def test_read_artifacts(self):
+        for filepath in Path("tests/artifacts").glob("*.dmp"):
+            assert read_dmp_file(filepath, chunk_size=100).tolist() == (
+                legacy_tokenize(filepath.read_bytes())
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
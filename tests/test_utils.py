@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import unittest
+from array import array
+from pathlib import Path
+
+import pytest
+from parameterized import parameterized_class
+
+from mnemo_lib.tokenizer import read_dmp_file
+from mnemo_lib.utils import EOS_SEQUENCES
+from mnemo_lib.utils import chunk_section_offsets
+from mnemo_lib.utils import find_recovery_offsets
+from mnemo_lib.utils import find_section_offsets
+from mnemo_lib.utils import split_dmp_into_sections
+from mnemo_lib.utils import try_split_dmp_in_sections
+
+
+def sliding_window_offsets(data: list[int]) -> list[tuple[int, int]]:
+    """Reference implementation: compare every window to every end sequence."""
+    patterns = EOS_SEQUENCES[data[0]]
+    size = len(patterns[0])
+
+    offsets: list[tuple[int, int]] = []
+    start = 0
+    for idx in range(len(data) - size + 1):
+        if data[idx : idx + size] in patterns:
+            offsets.append((start, idx + size))
+            start = idx + size
+
+    return offsets
+
+
+def legacy_recovery_split(data: list[int]) -> list[list[int]]:
+    """Reference implementation: split before every version 5 section start."""
+    sections: list[list[int]] = []
+    buff: list[int] = []
+    for idx in range(len(data)):
+        if buff and data[idx : idx + 4] == [5, 68, 89, 101]:
+            sections.append(buff)
+            buff = []
+        buff.append(data[idx])
+
+    if buff:
+        sections.append(buff)
+
+    return sections
+
+
+@parameterized_class(
+    ("filepath", "expected_sections"),
+    [
+        ("tests/artifacts/test_v2.dmp", 6),
+        ("tests/artifacts/test_v5.dmp", 9),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp", 3),
+    ],
+)
+class SectionScannerTest(unittest.TestCase):
+    filepath: str
+    expected_sections: int
+
+    def setUp(self) -> None:
+        self._packed = read_dmp_file(Path(self.filepath))
+        self._data = self._packed.tolist()
+
+    def test_offsets(self):
+        offsets = find_section_offsets(self._data)
+        assert len(offsets) == self.expected_sections
+        assert offsets == sliding_window_offsets(self._data)
+
+    def test_input_types(self):
+        offsets = find_section_offsets(self._data)
+        assert find_section_offsets(self._packed) == offsets
+        assert find_section_offsets(self._packed.tobytes()) == offsets
+
+    def test_split(self):
+        sections = list(split_dmp_into_sections(self._data))
+        assert [len(section) for section in sections] == [
+            end - start for start, end in find_section_offsets(self._data)
+        ]
+        assert sections[0][0] == self._data[0]
+
+
+class ChunkSectionOffsetsTest(unittest.TestCase):
+    def test_balanced(self):
+        bounds = [(0, 10), (10, 20), (20, 60), (60, 70), (70, 80)]
+        chunks = chunk_section_offsets(bounds, n_chunks=2)
+        assert chunks == [[(0, 10), (10, 20), (20, 60)], [(60, 70), (70, 80)]]
+
+    def test_consecutive(self):
+        bounds = find_section_offsets(read_dmp_file("tests/artifacts/test_v5.dmp"))
+        for n_chunks in (1, 2, 4, 100):
+            chunks = chunk_section_offsets(bounds, n_chunks=n_chunks)
+            assert len(chunks) <= n_chunks
+            assert all(chunks)
+            assert [bound for chunk in chunks for bound in chunk] == bounds
+
+    def test_empty(self):
+        assert chunk_section_offsets([], n_chunks=4) == []
+
+
+class SectionScannerEdgeCasesTest(unittest.TestCase):
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError, match="Unsupported Mnemo Version"):
+            find_section_offsets([3, 0, 0])
+
+    def test_no_end_sequence(self):
+        assert find_section_offsets([5, 68, 89, 101]) == []
+
+    def test_both_v5_end_sequences(self):
+        normal, buggy = EOS_SEQUENCES[5]
+        data = [5, *normal, 5, *buggy, 5, 1, 2]
+        assert find_section_offsets(data) == [(0, 36), (36, 72)]
+        assert find_section_offsets(array("b", data)) == [(0, 36), (36, 72)]
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class RecoveryScannerTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._packed = read_dmp_file(Path(self.filepath))
+        self._data = self._packed.tolist()
+
+    def test_same_split_as_legacy(self):
+        assert list(try_split_dmp_in_sections(self._data)) == legacy_recovery_split(
+            self._data
+        )
+
+    def test_corrupted_stream(self):
+        # Drop every end of survey sequence: sections are still recovered
+        data = self._data
+        for _, end in reversed(find_section_offsets(data)):
+            data = data[: end - len(EOS_SEQUENCES[5][0])] + data[end:]
+
+        assert list(try_split_dmp_in_sections(data)) == legacy_recovery_split(data)
+
+    def test_input_types(self):
+        offsets = find_recovery_offsets(self._data)
+        assert find_recovery_offsets(self._packed) == offsets
+        assert find_recovery_offsets(self._packed.tobytes()) == offsets
+
+
+class RecoveryScannerEdgeCasesTest(unittest.TestCase):
+    def test_v2_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            find_recovery_offsets([2, 0, 0])
+
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError, match="Unsupported Mnemo Version"):
+            find_recovery_offsets([3, 0, 0])
+
+    def test_single_section(self):
+        assert find_recovery_offsets([5, 68, 89, 101, 1]) == [(0, 5)]
+
+
+if __name__ == "__main__":
+    unittest.main()
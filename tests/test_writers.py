@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from parameterized import parameterized_class
+
+from mnemo_lib.models import DMPFile
+from mnemo_lib.writers import write_dmp
+from mnemo_lib.writers import write_json
+from mnemo_lib.writers import write_ndjson
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class WriteJSONTest(unittest.TestCase):
+    filepath: str
+
+    def test_same_as_to_json(self):
+        dmp_file = DMPFile.from_dmp(self.filepath)
+
+        buffer = io.BytesIO()
+        count = write_json(DMPFile.iter_sections(self.filepath), buffer)
+
+        assert count == len(dmp_file.sections)
+        assert buffer.getvalue().decode("utf-8") == dmp_file.to_json()
+
+    def test_empty(self):
+        buffer = io.BytesIO()
+        assert write_json([], buffer) == 0
+        assert buffer.getvalue().decode("utf-8") == DMPFile([]).to_json()
+
+    def test_to_json_file(self):
+        dmp_file = DMPFile.from_dmp(self.filepath)
+
+        with TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir) / "output.json"
+            assert dmp_file.to_json(filepath) == dmp_file.to_json()
+            assert filepath.read_text() == dmp_file.to_json()
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class WriteNDJSONTest(unittest.TestCase):
+    filepath: str
+
+    def test_one_shot_per_line(self):
+        dmp_file = DMPFile.from_dmp(self.filepath)
+        sections = json.loads(dmp_file.to_json())
+
+        buffer = io.BytesIO()
+        count = write_ndjson(DMPFile.iter_sections(self.filepath), buffer)
+        lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+        assert count == len(lines) == sum(len(s["shots"]) for s in sections)
+
+        for line in lines:
+            section = sections[line.pop("section_idx")]
+            shot_idx = line.pop("shot_idx")
+            for key in ("date", "direction", "name", "version"):
+                assert line.pop(key) == section[key]
+            assert line == section["shots"][shot_idx]
+
+    def test_to_ndjson(self):
+        dmp_file = DMPFile.from_dmp(self.filepath)
+
+        buffer = io.BytesIO()
+        write_ndjson(dmp_file.sections, buffer)
+
+        with TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir) / "output.ndjson"
+            assert dmp_file.to_ndjson(filepath) == len(buffer.getvalue().splitlines())
+            assert filepath.read_bytes() == buffer.getvalue()
+
+
+@parameterized_class(
+    ("filepath"),
+    [
+        ("tests/artifacts/test_v2.dmp",),
+        ("tests/artifacts/test_v5.dmp",),
+        ("tests/artifacts/test_v5_buggy_EOS.dmp",),
+    ],
+)
+class WriteDMPTest(unittest.TestCase):
+    filepath: str
+
+    def setUp(self) -> None:
+        self._dmp_file = DMPFile.from_dmp(self.filepath)
+        self._data = self._dmp_file.to_dmp()
+
+    def test_same_as_to_dmp(self):
+        buffer = io.BytesIO()
+        count = write_dmp(DMPFile.iter_sections(self.filepath), buffer)
+
+        assert count == len(self._dmp_file.sections)
+        assert buffer.getvalue().decode("ascii") == (
+            f"{';'.join([str(nbr) for nbr in self._data])};"
+        )
+
+    def test_to_dmp_file(self):
+        with TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir) / "output.dmp"
+            assert self._dmp_file.to_dmp(filepath) is None
+            assert filepath.read_text() == (
+                f"{';'.join([str(nbr) for nbr in self._data])};"
+            )
+
+            assert self._dmp_file.to_dmp(filepath, return_data=True) == self._data
+
+
+class WriteDMPEdgeCasesTest(unittest.TestCase):
+    def test_empty(self):
+        buffer = io.BytesIO()
+        assert write_dmp([], buffer) == 0
+        assert buffer.getvalue() == b""
+
+
+if __name__ == "__main__":
+    unittest.main()